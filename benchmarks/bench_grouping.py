@@ -0,0 +1,49 @@
+"""Measures how the running time of ``group_colors`` scales with the number of colors.
+
+Usage: ``python -m benchmarks.bench_grouping [--max-exponent N] [--seed N]``
+"""
+import time
+from argparse import ArgumentParser
+
+import numpy as np
+
+from designtools.color import group_colors, packed_color
+from designtools.color.collectors import GRAYS, HUES_MARTIAN
+
+COLLECTORS = GRAYS | HUES_MARTIAN
+
+
+def _time_grouping(size: int, rng: np.random.Generator) -> float:
+    # Draw from a limited range of values so that larger palettes contain duplicates, which is
+    # typical of extracted colors.
+    values = rng.integers(0, min(size, 1 << 24) * 4, size).tolist()
+    colors = [packed_color(value) for value in values]
+
+    start = time.perf_counter()
+    group_colors(colors, COLLECTORS)
+
+    return time.perf_counter() - start
+
+
+def main():
+    parser = ArgumentParser(prog="bench_grouping", description=__doc__)
+    parser.add_argument("--max-exponent", type=int, default=6,
+                        help="Time palettes of 10**3 up to 10**N colors. Defaults to 6.")
+    parser.add_argument("--seed", type=int, default=0, help="The random seed.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'colors':>10} {'seconds':>10} {'ns/color':>10}")
+
+    for exponent in range(3, args.max_exponent + 1):
+        for mantissa in (1, 3):
+            size = mantissa * 10 ** exponent
+            if exponent == args.max_exponent and mantissa > 1:
+                break
+
+            elapsed = _time_grouping(size, rng)
+            print(f"{size:>10} {elapsed:>10.4f} {elapsed / size * 1e9:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
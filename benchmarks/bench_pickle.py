@@ -0,0 +1,89 @@
+"""Compares how quickly palettes can be sent to another process in each serialized form.
+
+The "slot state" form uses the default pickling of objects with ``__slots__`` that ``Color`` had
+before it defined a compact ``__reduce__``. It ships the hex code and the RGB and HSV tuples of
+every color.
+
+Usage: ``python -m benchmarks.bench_pickle [--size N] [--seed N]``
+"""
+import pickle
+import time
+from argparse import ArgumentParser
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+
+import numpy as np
+
+from designtools.color import Color, group_colors, pack_groups, packed_color
+from designtools.color.collectors import GRAYS, HUES_MARTIAN
+
+
+class SlotStateColor(Color):
+    """A color that pickles its slot values like ``Color`` did before it had a ``__reduce__``."""
+
+    __slots__ = ()
+
+    __reduce__ = object.__reduce__
+
+    @classmethod
+    def copy_of(cls, color: Color) -> "SlotStateColor":
+        copy = cls.__new__(cls)
+        for slot in Color.__slots__:
+            setattr(copy, slot, getattr(color, slot))
+
+        return copy
+
+
+def _echo_length(conn: Connection) -> None:
+    while (payload := conn.recv()) is not None:
+        conn.send(len(payload))
+
+
+def _send(conn: Connection, payload) -> tuple[float, int]:
+    size = len(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+
+    start = time.perf_counter()
+    conn.send(payload)
+    conn.recv()
+
+    return time.perf_counter() - start, size
+
+
+def main():
+    parser = ArgumentParser(prog="bench_pickle", description=__doc__)
+    parser.add_argument("--size", type=int, default=10 ** 6,
+                        help="The number of colors to send. Defaults to 10**6.")
+    parser.add_argument("--seed", type=int, default=0, help="The random seed.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    colors = [packed_color(value) for value in rng.integers(0, 1 << 24, args.size).tolist()]
+    # Derive every representation, as happens to colors that have been grouped and sorted.
+    for color in colors:
+        color.hex_code, color.hsv
+    slot_state = [SlotStateColor.copy_of(color) for color in colors]
+    groups = group_colors(colors, GRAYS | HUES_MARTIAN)
+
+    payloads = {
+        "slot state": slot_state,
+        "Color": colors,
+        "grouped Color": groups,
+        "pack_groups": pack_groups(groups),
+    }
+
+    parent, child = Pipe()
+    worker = Process(target=_echo_length, args=(child,))
+    worker.start()
+
+    print(f"{'form':>14} {'MB':>10} {'seconds':>10} {'colors/s':>12}")
+    try:
+        for name, payload in payloads.items():
+            elapsed, size = _send(parent, payload)
+            print(f"{name:>14} {size / 1e6:>10.1f} {elapsed:>10.3f} {args.size / elapsed:>12.0f}")
+    finally:
+        parent.send(None)
+        worker.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Compares the throughput of the color extractors on a generated CSS corpus.
+
+``colors_from_text`` is the original line by line ``HEX_COLOR`` search. ``HEX_SCANNER`` finds the
+same colors in a memory-mapped file, and ``CSS_SCANNER`` also finds 4 and 8 digit hex colors,
+``rgb()``, ``hsl()``, and named colors in the same single pass. ``separate passes`` finds the same
+syntaxes with one scanner per syntax, matching named colors with an identifier pattern, to measure
+what the single pass saves. ``HEX_SCANNER (gzip)`` streams the same corpus through gzip with
+:func:`scan_source`, and its throughput is measured in uncompressed bytes.
+
+Usage: ``python -m benchmarks.bench_scanners [--size-mb N] [--seed N]``
+"""
+import gzip
+import os
+import re
+import shutil
+import tempfile
+import time
+from argparse import ArgumentParser
+
+import numpy as np
+
+from designtools.graphics.extractors import (CSS_MAX_LENGTH, CSS_NAMED_COLORS, CSS_SCANNER,
+                                             HEX_SCANNER, NOT_A_COLOR, ColorScanner,
+                                             colors_from_text, parse_css_color, scan_file,
+                                             scan_source, )
+
+_NAMES = sorted(CSS_NAMED_COLORS)
+
+
+def _parse(tokens):
+    values = (parse_css_color(token) for token in tokens)
+
+    return np.array([NOT_A_COLOR if value is None else value for value in values], dtype=np.uint32)
+
+
+_SEPARATE_SCANNERS = tuple(
+    ColorScanner(re.compile(pattern, re.I), CSS_MAX_LENGTH, _parse, b"\n;}")
+    for pattern in (
+        rb"#(?:[0-9a-f]{8}|[0-9a-f]{6}|[0-9a-f]{3,4})(?![\w-])",
+        rb"rgba?\([^()\n;]{0,100}\)",
+        rb"hsla?\([^()\n;]{0,100}\)",
+        rb"(?<![#\w-])[a-z]{3,20}(?![\w-])",
+    )
+)
+"""One scanner for each of the syntaxes ``CSS_SCANNER`` finds."""
+
+
+def _scan_separately(path: str) -> np.ndarray:
+    return np.unique(np.concatenate([scan_file(path, scanner) for scanner in _SEPARATE_SCANNERS]))
+
+
+def _rule(index: int, value: int, rng: np.random.Generator) -> str:
+    red, green, blue = value >> 16, (value >> 8) & 0xff, value & 0xff
+    color = (
+        f"#{value:06x}",
+        f"#{value:06x}cc",
+        f"rgb({red}, {green}, {blue})",
+        f"rgba({red} {green} {blue} / 50%)",
+        f"hsl({value % 360}deg, {green * 100 // 255}%, {blue * 100 // 255}%)",
+        _NAMES[value % len(_NAMES)],
+    )[rng.integers(0, 6)]
+
+    return (
+        f".component-{index} > .item:hover {{ color: {color}; margin: 0 auto; "
+        f"padding: 4px 8px; font: 14px/1.5 sans-serif; transition: all 0.2s ease-in-out; }}\n"
+    )
+
+
+def _write_corpus(path: str, size: int, rng: np.random.Generator) -> None:
+    """Writes ``size`` bytes of CSS by repeating a block of 100,000 random rules."""
+    values = rng.integers(0, 1 << 24, 100_000).tolist()
+    block = "".join(_rule(index, value, rng) for index, value in enumerate(values)).encode()
+
+    with open(path, "wb") as file:
+        for _ in range(size // len(block)):
+            file.write(block)
+        file.write(block[:size % len(block)])
+
+
+def main():
+    parser = ArgumentParser(prog="bench_scanners", description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=256,
+                        help="The size of the generated corpus in MB. Defaults to 256.")
+    parser.add_argument("--seed", type=int, default=0, help="The random seed.")
+    args = parser.parse_args()
+
+    size = args.size_mb * 1_000_000
+    extractors = {
+        "colors_from_text": lambda path: colors_from_text(path),
+        "HEX_SCANNER": lambda path: scan_file(path, HEX_SCANNER),
+        "CSS_SCANNER": lambda path: scan_file(path, CSS_SCANNER),
+        "separate passes": _scan_separately,
+        "HEX_SCANNER (gzip)": lambda path: scan_source(path + ".gz", HEX_SCANNER),
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "corpus.css")
+        _write_corpus(path, size, np.random.default_rng(args.seed))
+        with open(path, "rb") as source, gzip.open(path + ".gz", "wb", compresslevel=1) as target:
+            shutil.copyfileobj(source, target)
+
+        print(f"{'extractor':>20} {'colors':>10} {'seconds':>10} {'MB/s':>10}")
+        for name, extract in extractors.items():
+            start = time.perf_counter()
+            found = extract(path)
+            elapsed = time.perf_counter() - start
+            print(f"{name:>20} {len(found):>10} {elapsed:>10.2f} {size / elapsed / 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
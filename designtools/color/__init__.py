@@ -1,3 +1,13 @@
-from ._color_util import (get_luminance, hex_to_hsv, hex_to_rgb, normalize_hex_color, rgb_to_hex, )
-from ._models import Color, hex_color, hsv_color, rgb_color
-from .grouping import group_colors
+from ._array_util import (HexParseResult, delinearize_array, get_luminance_array,
+                          get_packed_luminance_array, hex_to_packed_array, hex_to_rgb_array,
+                          hsv_to_rgb_array, lab_to_lch_array, linearize_array, packed_to_rgb_array,
+                          rgb_to_hex_array, rgb_to_hsv_array, rgb_to_lab_array, rgb_to_oklab_array,
+                          rgb_to_packed_array, scale_components_array, )
+from ._color_array import COLOR_SPACES, ColorArray
+from ._color_util import (LUMINANCE_WEIGHTS, SRGB_LINEAR_8BIT, delinearize, get_luminance,
+                          get_packed_luminance, hex_to_hsv, hex_to_packed, hex_to_rgb, lab_to_lch,
+                          linearize, normalize_hex_color, packed_to_hex, packed_to_rgb, rgb_to_hex,
+                          rgb_to_lab, rgb_to_oklab, rgb_to_packed, )
+from ._models import (COLOR_CACHE, CacheInfo, Color, ColorCache, hex_color, hsv_color,
+                      packed_color, rgb_color, )
+from .grouping import ColorCount, PackedGroups, group_color_counts, group_colors, pack_groups
@@ -0,0 +1,422 @@
+"""Vectorized color utility functions that operate on whole arrays of colors at once.
+
+Arrays of colors are ``(N, 3)`` float arrays where each row holds the three components of one color,
+each expressed as a float from ``0`` to ``1``.
+"""
+from collections.abc import Sequence
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._color_util import (_LAB_EPSILON, _LAB_SLOPE, D65_WHITE, LINEAR_RGB_TO_LMS, LINEAR_RGB_TO_XYZ,
+                          LMS_TO_OKLAB, LUMINANCE_WEIGHTS, SRGB_LINEAR_8BIT, )
+
+_NIBBLES = np.full(256, 16, dtype=np.uint32)
+"""Maps character codes to their hexadecimal digit value. Anything that isn't a digit maps to 16."""
+for _value, _digit in enumerate("0123456789abcdef"):
+    _NIBBLES[ord(_digit)] = _value
+    _NIBBLES[ord(_digit.upper())] = _value
+
+_LINEAR_8BIT = np.array(SRGB_LINEAR_8BIT)
+"""The NumPy copy of :data:`SRGB_LINEAR_8BIT` used for table lookups."""
+
+_MAX_HEX_DIGITS = 8
+"""The number of digits in the longest hexadecimal color code accepted."""
+
+
+class HexParseResult(NamedTuple):
+    """The result of parsing a batch of hexadecimal color codes."""
+    values: NDArray
+    """The parsed colors, one entry for each given code. Entries for invalid codes are black."""
+    invalid: NDArray[np.intp]
+    """The indexes of the codes that were not valid hexadecimal colors, in ascending order."""
+
+
+def as_component_array(values: ArrayLike) -> NDArray[np.float64]:
+    """Converts the given values to an ``(N, 3)`` float array of color components.
+
+    Args:
+        values: The color components. Anything NumPy can convert to an ``(N, 3)`` array is accepted.
+
+    Returns:
+        A C-contiguous ``(N, 3)`` float array.
+
+    Raises:
+        ValueError: If the values do not have the shape ``(N, 3)`` or any component is outside the
+            range [0, 1].
+    """
+    array = np.ascontiguousarray(values, dtype=np.float64)
+
+    if array.size == 0:
+        return array.reshape(0, 3)
+
+    if array.ndim != 2 or array.shape[1] != 3:
+        raise ValueError("Color component arrays must have the shape (N, 3).")
+
+    if not np.all((array >= 0) & (array <= 1)):
+        raise ValueError("All color components must be >= 0 and <= 1.")
+
+    return array
+
+
+def rgb_to_hsv_array(rgb: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Converts an array of RGB colors to HSV.
+
+    This produces the same results as :func:`colorsys.rgb_to_hsv` applied to each row.
+
+    Args:
+        rgb: An ``(N, 3)`` array of RGB colors.
+
+    Returns:
+        An ``(N, 3)`` array of (hue, saturation, value) colors.
+    """
+    r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+    maxc = rgb.max(axis=1)
+    minc = rgb.min(axis=1)
+    rangec = maxc - minc
+    chromatic = rangec != 0
+
+    # Guard the divisions for grays, their hue and saturation are forced to 0 below.
+    safe_max = np.where(chromatic, maxc, 1.0)
+    safe_range = np.where(chromatic, rangec, 1.0)
+
+    s = np.where(chromatic, rangec / safe_max, 0.0)
+    rc = (maxc - r) / safe_range
+    gc = (maxc - g) / safe_range
+    bc = (maxc - b) / safe_range
+
+    h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    h = np.where(chromatic, (h / 6.0) % 1.0, 0.0)
+
+    return np.stack((h, s, maxc), axis=1)
+
+
+def hsv_to_rgb_array(hsv: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Converts an array of HSV colors to RGB.
+
+    This produces the same results as :func:`colorsys.hsv_to_rgb` applied to each row.
+
+    Args:
+        hsv: An ``(N, 3)`` array of HSV colors.
+
+    Returns:
+        An ``(N, 3)`` array of (red, green, blue) colors.
+    """
+    h, s, v = hsv[:, 0], hsv[:, 1], hsv[:, 2]
+    sector = np.floor(h * 6.0)
+    f = (h * 6.0) - sector
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    sector = sector.astype(np.int64) % 6
+
+    # Each row of this table lists the (r, g, b) sources for one hue sector.
+    choices = np.stack((v, t, p, q), axis=1)
+    sources = np.array([[0, 1, 2], [3, 0, 2], [2, 0, 1], [2, 3, 0], [1, 2, 0], [0, 2, 3]])
+    rgb = np.take_along_axis(choices, sources[sector], axis=1)
+
+    gray = s == 0.0
+    rgb[gray] = v[gray, np.newaxis]
+
+    return rgb
+
+
+def rgb_to_packed_array(rgb: NDArray[np.float64]) -> NDArray[np.uint32]:
+    """Converts an array of RGB colors to packed 24-bit color values.
+
+    Components are truncated to 8 bits the same way :func:`rgb_to_packed` does.
+
+    Args:
+        rgb: An ``(N, 3)`` array of RGB colors.
+
+    Returns:
+        The packed value for each row.
+    """
+    channels = (rgb * 255).astype(np.uint32)
+
+    return (channels[:, 0] << 16) | (channels[:, 1] << 8) | channels[:, 2]
+
+
+def packed_to_rgb_array(packed: ArrayLike) -> NDArray[np.float64]:
+    """Converts packed 24-bit color values to an array of RGB colors.
+
+    Args:
+        packed: The packed color values.
+
+    Returns:
+        An ``(N, 3)`` array of RGB colors.
+
+    Raises:
+        ValueError: If any value is not a 24-bit value.
+    """
+    values = np.asarray(packed, dtype=np.int64).reshape(-1)
+    if np.any((values < 0) | (values > 0xffffff)):
+        raise ValueError("Packed colors must be >= 0 and <= 0xffffff.")
+
+    channels = np.stack((values >> 16, (values >> 8) & 0xff, values & 0xff), axis=1)
+
+    return channels / 255
+
+
+def rgb_to_hex_array(rgb: NDArray[np.float64]) -> tuple[str, ...]:
+    """Converts an array of RGB colors to hexadecimal color codes.
+
+    Components are truncated to 8 bits the same way :func:`rgb_to_hex` does.
+
+    Args:
+        rgb: An ``(N, 3)`` array of RGB colors.
+
+    Returns:
+        The six-digit hexadecimal color code for each row.
+    """
+    data = (rgb * 255).astype(np.uint8).tobytes().hex()
+
+    return tuple(data[index:index + 6] for index in range(0, len(data), 6))
+
+
+def _code_points(hex_codes: Sequence[str] | Sequence[bytes] | NDArray) -> NDArray[np.uint32]:
+    """Lays out a batch of strings as an ``(N, _MAX_HEX_DIGITS + 1)`` array of character codes
+    padded with zeros, without their leading # characters. The extra column detects codes that are
+    too long."""
+    codes = np.asarray(hex_codes)
+    if codes.dtype.kind not in "US":
+        codes = codes.astype(str)
+    codes = codes.reshape(-1)
+
+    width = codes.dtype.itemsize // (4 if codes.dtype.kind == "U" else 1)
+    dtype = np.uint32 if codes.dtype.kind == "U" else np.uint8
+    chars = codes.view(dtype).reshape(len(codes), width)
+    if width == 0:
+        return np.zeros((len(codes), _MAX_HEX_DIGITS + 1), dtype=np.uint32)
+
+    # Drop every leading #, as str.lstrip("#") does, by shifting each row to the left.
+    prefixed = chars[:, 0] == ord("#")
+    if width > 1 and np.any(prefixed & (chars[:, 1] == ord("#"))):
+        hashes = chars == ord("#")
+        leading = np.where(np.all(hashes, axis=1), width, np.argmax(~hashes, axis=1))
+        index = leading[:, np.newaxis] + np.arange(_MAX_HEX_DIGITS + 1)
+        shifted = np.take_along_axis(chars, np.minimum(index, width - 1), axis=1)
+        return np.where(index < width, shifted, 0).astype(np.uint32)
+
+    # Codes have at most one #, so the shift is the same for every prefixed row.
+    padded = np.zeros((len(codes), _MAX_HEX_DIGITS + 2), dtype=np.uint32)
+    columns = min(width, _MAX_HEX_DIGITS + 2)
+    padded[:, :columns] = chars[:, :columns]
+
+    return np.where(prefixed[:, np.newaxis], padded[:, 1:], padded[:, :-1])
+
+
+def _hex_to_channels(hex_codes: Sequence[str] | Sequence[bytes] | NDArray) -> HexParseResult:
+    """Parses a batch of hexadecimal codes into an ``(N, 3)`` array of 8-bit channel values."""
+    chars = _code_points(hex_codes)
+
+    lengths = np.count_nonzero(chars, axis=1)
+    nibbles = np.where(chars < 256, _NIBBLES[np.minimum(chars, 255)], 16)
+    in_code = np.arange(chars.shape[1]) < lengths[:, np.newaxis]
+    valid = np.isin(lengths, (3, 4, 6, 8)) & np.all((nibbles < 16) | ~in_code, axis=1)
+
+    nibbles = np.where(nibbles < 16, nibbles, 0)
+    short = (lengths < 6)[:, np.newaxis]
+    channels = np.where(
+        short,
+        nibbles[:, 0:3] * 17,
+        nibbles[:, 0:6:2] * 16 + nibbles[:, 1:6:2],
+    )
+    channels[~valid] = 0
+
+    return HexParseResult(channels, np.flatnonzero(~valid))
+
+
+def hex_to_packed_array(hex_codes: Sequence[str] | Sequence[bytes] | NDArray) -> HexParseResult:
+    """Parses a batch of hexadecimal color codes into packed 24-bit color values in a single pass.
+
+    Codes are normalized the same way :func:`normalize_hex_color` does. They may have 3, 4, 6, or 8
+    digits, with or without # characters in front, and any alpha channel is ignored. Invalid codes
+    don't raise an error, they are reported by index instead.
+
+    Args:
+        hex_codes: The codes to parse as strings or bytes. NumPy string arrays are read in place.
+
+    Returns:
+        A ``uint32`` array with the packed value of each code, along with the indexes of any invalid
+        codes.
+    """
+    channels, invalid = _hex_to_channels(hex_codes)
+    packed = (channels[:, 0] << 16) | (channels[:, 1] << 8) | channels[:, 2]
+
+    return HexParseResult(packed.astype(np.uint32), invalid)
+
+
+def hex_to_rgb_array(hex_codes: Sequence[str] | Sequence[bytes] | NDArray) -> HexParseResult:
+    """Parses a batch of hexadecimal color codes into an array of RGB colors in a single pass.
+
+    See :func:`hex_to_packed_array` for the accepted formats.
+
+    Args:
+        hex_codes: The codes to parse as strings or bytes. NumPy string arrays are read in place.
+
+    Returns:
+        An ``(N, 3)`` array of RGB colors, along with the indexes of any invalid codes.
+    """
+    channels, invalid = _hex_to_channels(hex_codes)
+
+    return HexParseResult(channels / 255, invalid)
+
+
+def linearize_array(values: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Converts gamma-encoded sRGB components to linear light.
+
+    Components that are exact 8-bit values, like those parsed from hexadecimal codes, are looked up
+    in :data:`SRGB_LINEAR_8BIT`. Only the remaining components are computed with the exact formula,
+    so the results always match :func:`linearize`.
+
+    Args:
+        values: An array of components of any shape, each a float from ``0`` to ``1``.
+
+    Returns:
+        An array of the same shape with the linear components.
+    """
+    indexes = np.rint(values * 255).astype(np.intp)
+    np.clip(indexes, 0, 255, out=indexes)
+    linear = _LINEAR_8BIT[indexes]
+
+    exact = (indexes / 255) != values
+    if np.any(exact):
+        remaining = values[exact]
+        linear[exact] = np.where(
+            remaining <= 0.04045, remaining / 12.92, ((remaining + 0.055) / 1.055) ** 2.4
+        )
+
+    return linear
+
+
+def delinearize_array(values: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Converts linear light components to gamma-encoded sRGB. This is the inverse of
+    :func:`linearize_array`.
+
+    Args:
+        values: An array of linear components of any shape, each a float from ``0`` to ``1``.
+
+    Returns:
+        An array of the same shape with the gamma-encoded components.
+    """
+    return np.where(
+        values <= 0.0031308, values * 12.92, 1.055 * np.maximum(values, 0) ** (1 / 2.4) - 0.055
+    )
+
+
+def get_luminance_array(rgb: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Computes the `relative luminance`_ for an array of RGB colors.
+
+    Args:
+        rgb: An ``(N, 3)`` array of RGB colors.
+
+    Returns:
+        The relative luminance of each row.
+
+    .. _relative luminance:
+       https://www.w3.org/WAI/GL/wiki/Relative_luminance
+    """
+    linear = linearize_array(rgb)
+    red, green, blue = LUMINANCE_WEIGHTS
+
+    return red * linear[:, 0] + green * linear[:, 1] + blue * linear[:, 2]
+
+
+def get_packed_luminance_array(packed: ArrayLike) -> NDArray[np.float64]:
+    """Computes the `relative luminance`_ for packed 24-bit color values using table lookups.
+
+    Args:
+        packed: The packed color values.
+
+    Returns:
+        The relative luminance of each value.
+
+    .. _relative luminance:
+       https://www.w3.org/WAI/GL/wiki/Relative_luminance
+    """
+    values = np.asarray(packed, dtype=np.uint32)
+    red, green, blue = LUMINANCE_WEIGHTS
+
+    return (
+        red * _LINEAR_8BIT[values >> 16]
+        + green * _LINEAR_8BIT[(values >> 8) & 0xff]
+        + blue * _LINEAR_8BIT[values & 0xff]
+    )
+
+
+def rgb_to_oklab_array(rgb: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Converts an array of sRGB colors to the `OKLab`_ perceptual color space.
+
+    Args:
+        rgb: An ``(N, 3)`` array of RGB colors.
+
+    Returns:
+        An ``(N, 3)`` array of (L, a, b) colors.
+
+    .. _OKLab:
+       https://bottosson.github.io/posts/oklab/
+    """
+    lms = linearize_array(rgb) @ np.array(LINEAR_RGB_TO_LMS).T
+
+    return np.cbrt(lms) @ np.array(LMS_TO_OKLAB).T
+
+
+def rgb_to_lab_array(rgb: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Converts an array of sRGB colors to the `CIELAB`_ color space with a D65 white point.
+
+    Args:
+        rgb: An ``(N, 3)`` array of RGB colors.
+
+    Returns:
+        An ``(N, 3)`` array of (L*, a*, b*) colors.
+
+    .. _CIELAB:
+       https://en.wikipedia.org/wiki/CIELAB_color_space
+    """
+    xyz = (linearize_array(rgb) @ np.array(LINEAR_RGB_TO_XYZ).T) / np.array(D65_WHITE)
+    f = np.where(xyz > _LAB_EPSILON, np.cbrt(xyz), xyz * _LAB_SLOPE + 4 / 29)
+
+    return np.stack(
+        (116 * f[:, 1] - 16, 500 * (f[:, 0] - f[:, 1]), 200 * (f[:, 1] - f[:, 2])), axis=1
+    )
+
+
+def lab_to_lch_array(lab: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Converts an array of Lab colors (CIELAB or OKLab) to their cylindrical LCh form.
+
+    Args:
+        lab: An ``(N, 3)`` array of Lab colors.
+
+    Returns:
+        An ``(N, 3)`` array of (lightness, chroma, hue) colors, with hues in degrees from ``0`` up
+        to ``360``.
+    """
+    hue = np.degrees(np.arctan2(lab[:, 2], lab[:, 1])) % 360
+
+    return np.stack((lab[:, 0], np.hypot(lab[:, 1], lab[:, 2]), hue), axis=1)
+
+
+def scale_components_array(
+    components: NDArray[np.float64], factors: ArrayLike
+) -> NDArray[np.float64]:
+    """Scales every color by every row of a factor matrix, clamping the results to [0, 1].
+
+    This is the vectorized form of :meth:`Color.hsv_transform` and :meth:`Color.rgb_transform`.
+
+    Args:
+        components: An ``(N, 3)`` array of colors.
+        factors: A ``(K, 3)`` array with one set of component factors in each row.
+
+    Returns:
+        An ``(N, K, 3)`` array where ``[i, j]`` is color ``i`` scaled by factor row ``j``.
+
+    Raises:
+        ValueError: If ``factors`` does not have the shape ``(K, 3)``.
+    """
+    factors = np.asarray(factors, dtype=np.float64)
+    if factors.ndim != 2 or factors.shape[1] != 3:
+        raise ValueError("Factor matrices must have the shape (K, 3).")
+
+    return np.clip(components[:, np.newaxis, :] * factors[np.newaxis, :, :], 0, 1.0)
@@ -0,0 +1,277 @@
+"""Provides a columnar container for working with large numbers of colors at once.
+"""
+from collections.abc import Iterable, Sequence
+from typing import overload
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._array_util import (as_component_array, hex_to_rgb_array, hsv_to_rgb_array,
+                          lab_to_lch_array, packed_to_rgb_array, rgb_to_hex_array, rgb_to_hsv_array,
+                          rgb_to_lab_array, rgb_to_oklab_array, rgb_to_packed_array,
+                          scale_components_array, )
+from ._models import Color
+
+COLOR_SPACES = ("rgb", "hsv", "oklab", "lab")
+"""The color spaces supported by :meth:`ColorArray.coordinates`."""
+
+
+class ColorArray(Sequence[Color]):
+    """Stores the RGB and HSV representations of many colors as contiguous ``(N, 3)`` float arrays.
+
+    This is the structure-of-arrays counterpart to :class:`Color`. Conversions are done for the
+    whole array in a single vectorized pass, so bulk operations avoid the per-object overhead of
+    ``Color``. Indexing with an integer returns a ``Color``, while slices, index arrays, and boolean
+    masks return a new ``ColorArray``.
+
+    Argument precedence is ``hex_codes``, ``rgb``, then ``hsv``. The first non-None parameter
+    present in that order will be used, and the rest will be ignored.
+
+    Args:
+        hex_codes: The hexadecimal colors.
+        rgb: The RGB components as an ``(N, 3)`` array of floats, each on the range [0, 1].
+        hsv: The HSV components as an ``(N, 3)`` array of floats, each on the range [0, 1].
+
+    Raises:
+        ValueError: If an invalid hex code is given
+        ValueError: If any RGB or HSV components are outside the range [0, 1].
+        ValueError: If all parameters are ``None``.
+    """
+
+    __slots__ = ("_rgb", "_hsv", "_oklab", "_lab")
+
+    def __init__(
+        self,
+        hex_codes: Iterable[str] | None = None,
+        rgb: ArrayLike | None = None,
+        hsv: ArrayLike | None = None,
+    ):
+        if hex_codes is not None:
+            self._rgb, invalid = hex_to_rgb_array(
+                hex_codes if isinstance(hex_codes, (Sequence, np.ndarray)) else tuple(hex_codes)
+            )
+            if len(invalid) > 0:
+                raise ValueError(f"Invalid hexadecimal colors at indexes {invalid.tolist()}.")
+            self._hsv = rgb_to_hsv_array(self._rgb)
+        elif rgb is not None:
+            self._rgb = as_component_array(rgb)
+            self._hsv = rgb_to_hsv_array(self._rgb)
+        elif hsv is not None:
+            self._hsv = as_component_array(hsv)
+            self._rgb = hsv_to_rgb_array(self._hsv)
+        else:
+            raise ValueError("One of hex_codes, rgb, or hsv must be given.")
+
+        self._rgb.flags.writeable = False
+        self._hsv.flags.writeable = False
+        self._oklab = None
+        self._lab = None
+
+    @classmethod
+    def from_colors(cls, colors: Iterable[Color]) -> "ColorArray":
+        """Creates a color array from a sequence of ``Color`` instances.
+
+        Args:
+            colors: The colors to copy into the array.
+
+        Returns:
+            The new color array.
+        """
+        colors = tuple(colors)
+
+        return cls._wrap(
+            np.array([color.rgb for color in colors], dtype=np.float64).reshape(-1, 3),
+            np.array([color.hsv for color in colors], dtype=np.float64).reshape(-1, 3),
+        )
+
+    @classmethod
+    def of(cls, colors: Sequence[Color]) -> "ColorArray":
+        """Returns ``colors`` if it is already a color array, otherwise copies it into a new one.
+
+        Args:
+            colors: The colors.
+
+        Returns:
+            The color array.
+        """
+        return colors if isinstance(colors, ColorArray) else cls.from_colors(colors)
+
+    @classmethod
+    def from_packed(cls, packed: ArrayLike) -> "ColorArray":
+        """Creates a color array from packed 24-bit color values.
+
+        Args:
+            packed: The packed color values. See :attr:`Color.packed`
+
+        Returns:
+            The new color array.
+
+        Raises:
+            ValueError: If any value is not a 24-bit value.
+        """
+        rgb = packed_to_rgb_array(packed)
+
+        return cls._wrap(rgb, rgb_to_hsv_array(rgb))
+
+    @classmethod
+    def _wrap(cls, rgb: NDArray[np.float64], hsv: NDArray[np.float64]) -> "ColorArray":
+        """Creates a color array around already validated component arrays without copying them."""
+        array = cls.__new__(cls)
+        array._rgb = np.ascontiguousarray(rgb)
+        array._hsv = np.ascontiguousarray(hsv)
+        array._rgb.flags.writeable = False
+        array._hsv.flags.writeable = False
+        array._oklab = None
+        array._lab = None
+
+        return array
+
+    @property
+    def rgb(self) -> NDArray[np.float64]:
+        """The ``(N, 3)`` read-only array of RGB components."""
+        return self._rgb
+
+    @property
+    def hsv(self) -> NDArray[np.float64]:
+        """The ``(N, 3)`` read-only array of HSV components."""
+        return self._hsv
+
+    @property
+    def oklab(self) -> NDArray[np.float64]:
+        """The ``(N, 3)`` read-only array of OKLab components, computed on first access."""
+        if self._oklab is None:
+            self._oklab = rgb_to_oklab_array(self._rgb)
+            self._oklab.flags.writeable = False
+
+        return self._oklab
+
+    @property
+    def lab(self) -> NDArray[np.float64]:
+        """The ``(N, 3)`` read-only array of CIELAB components, computed on first access."""
+        if self._lab is None:
+            self._lab = rgb_to_lab_array(self._rgb)
+            self._lab.flags.writeable = False
+
+        return self._lab
+
+    @property
+    def lch(self) -> NDArray[np.float64]:
+        """The ``(N, 3)`` array of CIE LCh components with hues in degrees."""
+        return lab_to_lch_array(self.lab)
+
+    def coordinates(self, space: str) -> NDArray[np.float64]:
+        """Returns the colors as points in one of the :data:`COLOR_SPACES`, suitable for measuring
+        Euclidean distances.
+
+        The ``"hsv"`` space maps each color onto the HSV cone,
+        ``(s * v * cos(h), s * v * sin(h), v)``, so that hues wrap around and the hue of dark or
+        desaturated colors matters less.
+
+        Args:
+            space: The name of the color space.
+
+        Returns:
+            An ``(N, 3)`` array of coordinates.
+
+        Raises:
+            ValueError: If ``space`` is not one of the :data:`COLOR_SPACES`.
+        """
+        if space == "rgb":
+            return self._rgb
+        elif space == "hsv":
+            angle = 2 * np.pi * self._hsv[:, 0]
+            value = self._hsv[:, 2]
+            radius = self._hsv[:, 1] * value
+            return np.stack((radius * np.cos(angle), radius * np.sin(angle), value), axis=1)
+        elif space == "oklab":
+            return self.oklab
+        elif space == "lab":
+            return self.lab
+
+        raise ValueError(f"space must be one of {COLOR_SPACES}")
+
+    @property
+    def packed(self) -> NDArray[np.uint32]:
+        """The packed 24-bit value of each color. See :attr:`Color.packed`"""
+        return rgb_to_packed_array(self._rgb)
+
+    @property
+    def hex_codes(self) -> tuple[str, ...]:
+        """The hexadecimal representation of each color."""
+        return rgb_to_hex_array(self._rgb)
+
+    def to_colors(self) -> tuple[Color, ...]:
+        """Creates a ``Color`` instance for every color in this array.
+
+        Returns:
+            The colors in array order.
+        """
+        return tuple(
+            Color._from_components(hex_code, rgb, hsv)
+            for hex_code, rgb, hsv in zip(self.hex_codes, self._rgb.tolist(), self._hsv.tolist())
+        )
+
+    def hsv_transform(self, factors: ArrayLike) -> "ColorArray":
+        """Applies several scaling transforms to the HSV components of every color in one pass.
+
+        Each result is the same as :meth:`Color.hsv_transform` would give, including the clamping of
+        each component to [0, 1].
+
+        Args:
+            factors: A ``(K, 3)`` array of (hue, saturation, value) factors, one row per transform.
+
+        Returns:
+            A new array of ``N * K`` colors. The ``K`` transforms of each color are consecutive, so
+            ``result[i * K + j]`` is color ``i`` scaled by factor row ``j``.
+
+        Raises:
+            ValueError: If ``factors`` does not have the shape ``(K, 3)``.
+        """
+        hsv = scale_components_array(self._hsv, factors).reshape(-1, 3)
+
+        return ColorArray._wrap(hsv_to_rgb_array(hsv), hsv)
+
+    def rgb_transform(self, factors: ArrayLike) -> "ColorArray":
+        """Applies several scaling transforms to the RGB components of every color in one pass.
+
+        Each result is the same as :meth:`Color.rgb_transform` would give, including the clamping of
+        each component to [0, 1].
+
+        Args:
+            factors: A ``(K, 3)`` array with one set of (red, green, blue) factors in each row.
+
+        Returns:
+            A new array of ``N * K`` colors. The ``K`` transforms of each color are consecutive, so
+            ``result[i * K + j]`` is color ``i`` scaled by factor row ``j``.
+
+        Raises:
+            ValueError: If ``factors`` does not have the shape ``(K, 3)``.
+        """
+        rgb = scale_components_array(self._rgb, factors).reshape(-1, 3)
+
+        return ColorArray._wrap(rgb, rgb_to_hsv_array(rgb))
+
+    def __len__(self) -> int:
+        return len(self._rgb)
+
+    @overload
+    def __getitem__(self, index: int) -> Color:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice | ArrayLike) -> "ColorArray":
+        ...
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            rgb = self._rgb[index]
+            hex_code, = rgb_to_hex_array(rgb[np.newaxis])
+            return Color._from_components(hex_code, rgb.tolist(), self._hsv[index].tolist())
+
+        return ColorArray._wrap(self._rgb[index], self._hsv[index])
+
+    def __iter__(self):
+        return iter(self.to_colors())
+
+    def __repr__(self):
+        return f"ColorArray({list(self.hex_codes)})"
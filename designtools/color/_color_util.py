@@ -1,6 +1,9 @@
 """Various color utility functions.
 """
 import colorsys
+import math
+
+_HEX_DIGITS = frozenset("0123456789abcdef")
 
 
 def normalize_hex_color(hex_color: str) -> str:
@@ -55,6 +58,59 @@ def hex_to_rgb(hex_color: str) -> tuple[float, ...]:
     )
 
 
+def hex_to_packed(hex_color: str) -> int:
+    """Creates a packed 24-bit integer from a hexadecimal color code.
+
+    The red component occupies the highest 8 bits and blue the lowest, so ``"ff8000"`` becomes
+    ``0xff8000``. Packed values sort in the same order as their six-digit hexadecimal codes.
+
+    Args:
+        hex_color: The hexadecimal RGB color to convert. The method will normalize this value before
+        creating the instance. See :meth:`normalize_hex_color`
+
+    Returns:
+        The packed color value.
+
+    Raises:
+        ValueError: If ``hex_color`` is not a valid hexadecimal color code.
+    """
+    hex_safe = normalize_hex_color(hex_color)
+    if not _HEX_DIGITS.issuperset(hex_safe):
+        raise ValueError("Hexadecimal color must only contain the digits 0-9 and a-f.")
+
+    return int(hex_safe, 16)
+
+
+def packed_to_hex(packed: int) -> str:
+    """Converts a packed 24-bit color value to a six-digit hexadecimal color code."""
+    return f"{packed:06x}"
+
+
+def packed_to_rgb(packed: int) -> tuple[float, ...]:
+    """Converts a packed 24-bit color value to an RGB tuple.
+
+    Returns:
+        The (red, green, blue) values for the color with each value expressed as a float from ``0``
+        to ``1``.
+    """
+    return (packed >> 16) / 255, ((packed >> 8) & 0xff) / 255, (packed & 0xff) / 255
+
+
+def rgb_to_packed(red: float, green: float, blue: float) -> int:
+    """Converts RGB values to a packed 24-bit color value. Each component must be a float from ``0``
+    to ``1`` and is truncated to 8 bits the same way :meth:`rgb_to_hex` does.
+
+    Args:
+        red: The red component.
+        green: The green component.
+        blue: The blue component.
+
+    Returns:
+        The packed color value.
+    """
+    return (int(red * 255) << 16) | (int(green * 255) << 8) | int(blue * 255)
+
+
 def rgb_to_hex(red: float, green: float, blue: float) -> str:
     """Converts RGB values to a hexadecimal color value. Each component must be a float from ``0`` to
     ``1``.
@@ -86,9 +142,50 @@ def hex_to_hsv(hex_code: str) -> tuple[float, ...]:
     return colorsys.rgb_to_hsv(*hex_to_rgb(hex_code))
 
 
+def linearize(component: float) -> float:
+    """Converts a gamma-encoded sRGB component to linear light.
+
+    Args:
+        component: The component as a float from ``0`` to ``1``.
+
+    Returns:
+        The linear component as a float from ``0`` to ``1``.
+    """
+    if component <= 0.04045:
+        return component / 12.92
+
+    return ((component + 0.055) / 1.055) ** 2.4
+
+
+def delinearize(component: float) -> float:
+    """Converts a linear light component to a gamma-encoded sRGB component. This is the inverse of
+    :func:`linearize`.
+
+    Args:
+        component: The linear component as a float from ``0`` to ``1``.
+
+    Returns:
+        The gamma-encoded component as a float from ``0`` to ``1``.
+    """
+    if component <= 0.0031308:
+        return component * 12.92
+
+    return 1.055 * component ** (1 / 2.4) - 0.055
+
+
+SRGB_LINEAR_8BIT: tuple[float, ...] = tuple(linearize(value / 255) for value in range(256))
+"""The linear value of every 8-bit sRGB component, indexed by the component's integer value."""
+
+LUMINANCE_WEIGHTS: tuple[float, float, float] = (0.2126, 0.7152, 0.0722)
+"""The weights of the linear red, green, and blue components in the relative luminance."""
+
+
 def get_luminance(red: float, green: float, blue: float) -> float:
     """Computes the `relative luminance`_ for the given RGB color.
 
+    This is the exact calculation for any component values. For colors that are known to be 8-bit,
+    :func:`get_packed_luminance` gives the same result using precomputed values.
+
     Args:
         red: The red component as a float from ``0`` to ``1``.
         green: The green component as a float from ``0`` to ``1``.
@@ -105,3 +202,132 @@ def get_luminance(red: float, green: float, blue: float) -> float:
     bs = blue / 12.92 if blue <= 0.04045 else ((blue + 0.055) / 1.055) ** 2.4
 
     return 0.2126 * rs + 0.7152 * gs + 0.0722 * bs
+
+
+def get_packed_luminance(packed: int) -> float:
+    """Computes the `relative luminance`_ for a packed 24-bit color value.
+
+    The components of a packed color are 8-bit, so the linear values are looked up in
+    :data:`SRGB_LINEAR_8BIT` instead of being computed.
+
+    Args:
+        packed: The packed color value.
+
+    Returns:
+        The relative luminance.
+
+    .. _relative luminance:
+       https://www.w3.org/WAI/GL/wiki/Relative_luminance
+    """
+    return (
+        0.2126 * SRGB_LINEAR_8BIT[packed >> 16]
+        + 0.7152 * SRGB_LINEAR_8BIT[(packed >> 8) & 0xff]
+        + 0.0722 * SRGB_LINEAR_8BIT[packed & 0xff]
+    )
+
+
+Matrix3 = tuple[tuple[float, float, float], tuple[float, float, float], tuple[float, float, float]]
+"""A 3x3 matrix stored as a tuple of rows."""
+
+LINEAR_RGB_TO_LMS: Matrix3 = (
+    (0.4122214708, 0.5363325363, 0.0514459929),
+    (0.2119034982, 0.6806995451, 0.1073969566),
+    (0.0883024619, 0.2817188376, 0.6299787005),
+)
+"""Converts linear sRGB to the cone responses used by `OKLab`_.
+
+.. _OKLab:
+   https://bottosson.github.io/posts/oklab/
+"""
+
+LMS_TO_OKLAB: Matrix3 = (
+    (0.2104542553, 0.7936177850, -0.0040720468),
+    (1.9779984951, -2.4285922050, 0.4505937099),
+    (0.0259040371, 0.7827717662, -0.8086757660),
+)
+"""Converts the cube roots of the cone responses to `OKLab`_ (L, a, b).
+
+.. _OKLab:
+   https://bottosson.github.io/posts/oklab/
+"""
+
+LINEAR_RGB_TO_XYZ: Matrix3 = (
+    (0.4124564, 0.3575761, 0.1804375),
+    (0.2126729, 0.7151522, 0.0721750),
+    (0.0193339, 0.1191920, 0.9503041),
+)
+"""Converts linear sRGB to CIE XYZ with a D65 white point."""
+
+D65_WHITE: tuple[float, float, float] = (0.95047, 1.0, 1.08883)
+"""The CIE XYZ coordinates of the D65 reference white."""
+
+_LAB_EPSILON = (6 / 29) ** 3
+_LAB_SLOPE = 1 / (3 * (6 / 29) ** 2)
+
+
+def _transform(matrix: Matrix3, x: float, y: float, z: float) -> tuple[float, float, float]:
+    return (
+        matrix[0][0] * x + matrix[0][1] * y + matrix[0][2] * z,
+        matrix[1][0] * x + matrix[1][1] * y + matrix[1][2] * z,
+        matrix[2][0] * x + matrix[2][1] * y + matrix[2][2] * z,
+    )
+
+
+def _lab_f(t: float) -> float:
+    return math.cbrt(t) if t > _LAB_EPSILON else t * _LAB_SLOPE + 4 / 29
+
+
+def rgb_to_oklab(red: float, green: float, blue: float) -> tuple[float, float, float]:
+    """Converts an sRGB color to the `OKLab`_ perceptual color space.
+
+    Args:
+        red: The red component as a float from ``0`` to ``1``.
+        green: The green component as a float from ``0`` to ``1``.
+        blue: The blue component as a float from ``0`` to ``1``.
+
+    Returns:
+        The (L, a, b) values for the color. L runs from ``0`` (black) to ``1`` (white).
+
+    .. _OKLab:
+       https://bottosson.github.io/posts/oklab/
+    """
+    lms = _transform(LINEAR_RGB_TO_LMS, linearize(red), linearize(green), linearize(blue))
+
+    return _transform(LMS_TO_OKLAB, *(math.cbrt(c) for c in lms))
+
+
+def rgb_to_lab(red: float, green: float, blue: float) -> tuple[float, float, float]:
+    """Converts an sRGB color to the `CIELAB`_ color space with a D65 white point.
+
+    Args:
+        red: The red component as a float from ``0`` to ``1``.
+        green: The green component as a float from ``0`` to ``1``.
+        blue: The blue component as a float from ``0`` to ``1``.
+
+    Returns:
+        The (L*, a*, b*) values for the color. L* runs from ``0`` (black) to ``100`` (white).
+
+    .. _CIELAB:
+       https://en.wikipedia.org/wiki/CIELAB_color_space
+    """
+    x, y, z = _transform(LINEAR_RGB_TO_XYZ, linearize(red), linearize(green), linearize(blue))
+    fx = _lab_f(x / D65_WHITE[0])
+    fy = _lab_f(y / D65_WHITE[1])
+    fz = _lab_f(z / D65_WHITE[2])
+
+    return 116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)
+
+
+def lab_to_lch(lightness: float, a: float, b: float) -> tuple[float, float, float]:
+    """Converts a Lab color (CIELAB or OKLab) to its cylindrical LCh form.
+
+    Args:
+        lightness: The lightness.
+        a: The green-red axis.
+        b: The blue-yellow axis.
+
+    Returns:
+        The (lightness, chroma, hue) values for the color, with the hue in degrees from ``0`` up to
+        ``360``.
+    """
+    return lightness, math.hypot(a, b), math.degrees(math.atan2(b, a)) % 360
@@ -1,18 +1,26 @@
 import colorsys
+from collections import OrderedDict
 from collections.abc import Sequence
+from typing import NamedTuple
 
-from ._color_util import hex_to_rgb, normalize_hex_color, rgb_to_hex
+from ._color_util import (hex_to_packed, lab_to_lch, normalize_hex_color, packed_to_hex,
+                          packed_to_rgb, rgb_to_lab, rgb_to_oklab, rgb_to_packed, )
 
 
 class Color:
-    """Provides a mechanism for storing the pre-computed hexadecimal, RGB, and HSV representations of a
-    color in a single object.
+    """Provides a mechanism for storing the hexadecimal, RGB, and HSV representations of a color in
+    a single object.
 
     Argument precedence is ``hex_code``, ``rgb``, then ``hsv``. The first non-None parameter present in that
     order will be used, and the rest will be ignored.
 
-    This class supports comparison and sorting based on its hexadecimal color code. Hashing is also
-    delegated to the has of the hexadecimal code.
+    Only the given representation is converted when the color is created. The other representations,
+    including the perceptual :attr:`oklab`, :attr:`lab`, and :attr:`lch` coordinates, are derived
+    from it the first time they are accessed and kept for later use.
+
+    This class supports comparison and sorting based on its packed 24-bit color value (see
+    :attr:`packed`), which orders colors the same way as their hexadecimal codes. Hashing is also
+    delegated to the packed value.
 
     Args:
         hex_code: The hexadecimal color.
@@ -25,7 +33,7 @@ class Color:
         ValueError: If all parameters are ``None``.
     """
 
-    __slots__ = ("_hex", "_rgb", "_hsv")
+    __slots__ = ("_packed", "_hex", "_rgb", "_hsv", "_oklab", "_lab")
 
     def __init__(
         self,
@@ -33,42 +41,111 @@ class Color:
         rgb: Sequence[float] | None = None,
         hsv: Sequence[float] | None = None,
     ):
+        self._packed: int | None = None
+        self._hex: str | None = None
+        self._rgb: tuple[float, ...] | None = None
+        self._hsv: tuple[float, ...] | None = None
+        self._oklab: tuple[float, ...] | None = None
+        self._lab: tuple[float, ...] | None = None
+
         if hex_code:
             self._hex = normalize_hex_color(hex_code)
-            self._rgb = hex_to_rgb(self._hex)
-            self._hsv = colorsys.rgb_to_hsv(*self._rgb)
+            # Parsing also validates the digits, so it can't be deferred.
+            self._packed = hex_to_packed(self._hex)
         elif rgb:
             if (len(rgb) == 3) and all(0 <= c <= 1 for c in rgb):
                 self._rgb = tuple(rgb)
-                self._hex = rgb_to_hex(*self.rgb)
-                self._hsv = colorsys.rgb_to_hsv(*self._rgb)
             else:
                 raise ValueError("All 3 RGB components must be >= 0 and <= 1.")
         elif hsv:
             if (len(hsv) == 3) and all(0 <= c <= 1 for c in hsv):
                 self._hsv = tuple(hsv)
-                self._rgb = colorsys.hsv_to_rgb(*self._hsv)
-                self._hex = rgb_to_hex(*self.rgb)
             else:
                 raise ValueError("All 3 HSV components must be >= 0 and <= 1.")
         else:
             raise ValueError("One of hex_code, rgb, or hsv must be given.")
 
+    @classmethod
+    def _from_components(cls, hex_code: str, rgb: Sequence[float], hsv: Sequence[float]) -> "Color":
+        """Creates a color from already normalized and validated representations without converting
+        any of them again. Intended for bulk converters like :class:`ColorArray`."""
+        color = cls.__new__(cls)
+        color._packed = None
+        color._hex = hex_code
+        color._rgb = tuple(rgb)
+        color._hsv = tuple(hsv)
+        color._oklab = None
+        color._lab = None
+
+        return color
+
+    @property
+    def packed(self) -> int:
+        """The color as a 24-bit integer with red in the highest 8 bits and blue in the lowest.
+
+        This is the color's identity for hashing, equality, and ordering. It fits in an unsigned
+        32-bit integer, so it can be used to build compact ``array("I")`` or NumPy ``uint32``
+        indexes.
+        """
+        if self._packed is None:
+            self._packed = (
+                hex_to_packed(self._hex) if self._hex is not None else rgb_to_packed(*self.rgb)
+            )
+
+        return self._packed
+
     @property
     def hex_code(self) -> str:
         """The hexadecimal representation of the color."""
+        if self._hex is None:
+            self._hex = packed_to_hex(self.packed)
+
         return self._hex
 
     @property
     def rgb(self) -> Sequence[float]:
         """The RGB representation of the color."""
+        if self._rgb is None:
+            self._rgb = (
+                packed_to_rgb(self._packed) if self._hsv is None
+                else colorsys.hsv_to_rgb(*self._hsv)
+            )
+
         return self._rgb
 
     @property
     def hsv(self) -> Sequence[float]:
         """The HSV representation of the color."""
+        if self._hsv is None:
+            self._hsv = colorsys.rgb_to_hsv(*self.rgb)
+
         return self._hsv
 
+    @property
+    def oklab(self) -> Sequence[float]:
+        """The `OKLab`_ (L, a, b) representation of the color.
+
+        .. _OKLab:
+           https://bottosson.github.io/posts/oklab/
+        """
+        if self._oklab is None:
+            self._oklab = rgb_to_oklab(*self.rgb)
+
+        return self._oklab
+
+    @property
+    def lab(self) -> Sequence[float]:
+        """The CIELAB (L*, a*, b*) representation of the color with a D65 white point."""
+        if self._lab is None:
+            self._lab = rgb_to_lab(*self.rgb)
+
+        return self._lab
+
+    @property
+    def lch(self) -> Sequence[float]:
+        """The CIE LCh (lightness, chroma, hue) representation of the color. Hue is in degrees."""
+        return lab_to_lch(*self.lab)
+
     def hsv_transform(self, hue_x: float, sat_x: float, val_x: float) -> "Color":
         """Creates a new color by applying a scaling transform to the HSV components of this color.
 
@@ -103,25 +180,176 @@ class Color:
 
         return Color(rgb=[min(max(base * scalar, 0), 1.0) for base, scalar in pairs])
 
+    def __reduce__(self):
+        # Colors with exact 8-bit components are fully described by their packed value, which
+        # pickles to a few bytes instead of a hex string and two tuples of floats.
+        rgb, hsv = self._rgb, self._hsv
+        if rgb is None and hsv is None:
+            return packed_color, (self._packed,)
+
+        if hsv is None:
+            if packed_to_rgb(self.packed) == rgb:
+                return packed_color, (self._packed,)
+            return Color, (None, rgb)
+
+        if rgb is None:
+            return Color, (None, None, hsv)
+
+        # Either representation may be the one the color was created from, so both are kept.
+        if packed_to_rgb(self.packed) == rgb and colorsys.rgb_to_hsv(*rgb) == hsv:
+            return packed_color, (self._packed,)
+        return Color, (None, rgb), (None, {"_hsv": hsv})
+
     def __repr__(self):
-        return f"Color({self._hex})"
+        return f"Color({self.hex_code})"
 
     def __hash__(self):
-        return hash(self._hex)
+        return hash(self.packed)
 
     def __eq__(self, other: "Color"):
-        return self._hex == other._hex
+        return self.packed == other.packed
 
     def __lt__(self, other: "Color"):
-        return self._hex < other._hex
+        return self.packed < other.packed
 
     def __gt__(self, other: "Color"):
-        return self._hex > other._hex
+        return self.packed > other.packed
+
+
+class CacheInfo(NamedTuple):
+    """Statistics reported by :class:`ColorCache`."""
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class ColorCache:
+    """A least-recently-used cache of shared ``Color`` instances keyed by their 24-bit RGB value.
+
+    ``Color`` instances are immutable, so a single instance can safely stand in for every occurrence
+    of the same color. Hexadecimal codes that normalize to the same color (``"#FFF"``, ``"ffffff"``,
+    and ``"ffffffcc"`` for example) share one entry.
+
+    Args:
+        maxsize: The maximum number of colors to keep. ``None`` removes the limit, and ``0``
+            disables caching so every lookup creates a new color.
+
+    Raises:
+        ValueError: If ``maxsize`` is negative.
+    """
+
+    __slots__ = ("_colors", "_maxsize", "_hits", "_misses")
+
+    def __init__(self, maxsize: int | None = 4096):
+        self._colors: OrderedDict[int, Color] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._maxsize: int | None = None
+        self.resize(maxsize)
+
+    def get(self, hex_code: str) -> Color:
+        """Returns the shared color for a hexadecimal color code, creating it if needed.
+
+        Args:
+            hex_code: The hexadecimal color. See :meth:`normalize_hex_color`
+
+        Returns:
+            The shared color instance.
+
+        Raises:
+            ValueError: If an invalid hex code is given
+        """
+        return self.get_packed(hex_to_packed(hex_code))
+
+    def get_packed(self, packed: int) -> Color:
+        """Returns the shared color for a packed 24-bit color value, creating it if needed.
+
+        Args:
+            packed: The packed color value. See :attr:`Color.packed`
+
+        Returns:
+            The shared color instance.
+
+        Raises:
+            ValueError: If ``packed`` is not a 24-bit value.
+        """
+        color = self._colors.get(packed)
+
+        if color is not None:
+            self._hits += 1
+            self._colors.move_to_end(packed)
+            return color
+
+        self._misses += 1
+        color = packed_color(packed)
+
+        if self._maxsize != 0:
+            self._colors[color.packed] = color
+            if self._maxsize is not None and len(self._colors) > self._maxsize:
+                self._colors.popitem(last=False)
+
+        return color
+
+    def info(self) -> CacheInfo:
+        """Reports the hit and miss counts along with the current and maximum size of the cache."""
+        return CacheInfo(self._hits, self._misses, self._maxsize, len(self._colors))
+
+    def resize(self, maxsize: int | None) -> None:
+        """Changes the maximum size of the cache, evicting the least recently used colors if needed.
+
+        Args:
+            maxsize: The new maximum size. ``None`` removes the limit, and ``0`` disables caching.
+
+        Raises:
+            ValueError: If ``maxsize`` is negative.
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be >= 0 or None.")
+
+        self._maxsize = maxsize
+        if maxsize is not None:
+            while len(self._colors) > maxsize:
+                self._colors.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes every color from the cache and resets the statistics."""
+        self._colors.clear()
+        self._hits = 0
+        self._misses = 0
+
+
+COLOR_CACHE = ColorCache()
+"""The cache that :func:`hex_color` draws shared instances from."""
 
 
 def hex_color(hex_code: str) -> Color:
-    """Convenience function to create Color from hex code."""
-    return Color(hex_code=hex_code)
+    """Convenience function to create Color from hex code.
+
+    The returned instance is shared with every other call for the same color while it remains in
+    :data:`COLOR_CACHE`.
+    """
+    return COLOR_CACHE.get(hex_code)
+
+
+def packed_color(packed: int) -> Color:
+    """Convenience function to create Color from a packed 24-bit color value.
+
+    Raises:
+        ValueError: If ``packed`` is not a 24-bit value.
+    """
+    if not 0 <= packed <= 0xffffff:
+        raise ValueError("Packed colors must be >= 0 and <= 0xffffff.")
+
+    color = Color.__new__(Color)
+    color._packed = int(packed)
+    color._hex = None
+    color._rgb = None
+    color._hsv = None
+    color._oklab = None
+    color._lab = None
+
+    return color
 
 
 def rgb_color(red: float, green: float, blue: float) -> Color:
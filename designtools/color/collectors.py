@@ -1,6 +1,10 @@
+from bisect import bisect_right
 from collections.abc import Container, Mapping, Sequence
 from typing import cast
 
+import numpy as np
+from numpy.typing import NDArray
+
 from designtools.common import ContainerChain
 from designtools.mathutil import Range
 from ._models import Color
@@ -26,6 +30,21 @@ class HsvCollector(Container[Color]):
         self._component = HsvCollector.COMPONENTS.index(component)
         self._range = Range(lower_bound, upper_bound, False)
 
+    @property
+    def component(self) -> str:
+        """The HSV component this collector tests, one of :attr:`COMPONENTS`."""
+        return HsvCollector.COMPONENTS[self._component]
+
+    @property
+    def lower_bound(self) -> float:
+        """The lower boundary of this collector's range, inclusive."""
+        return self._range.min
+
+    @property
+    def upper_bound(self) -> float:
+        """The upper boundary of this collector's range, exclusive."""
+        return self._range.max
+
     def __repr__(self):
         return f"""HsvCollector("{self._component}", {self._range.min}, {self._range.max})"""
 
@@ -35,6 +54,94 @@ class HsvCollector(Container[Color]):
         return cast(Color, color).hsv[self._component] in self._range
 
 
+class HuePartition(Container[Color]):
+    """Finds the hue collector that contains a color with a binary search instead of testing each
+    collector in turn.
+
+    The collectors must test hue and their ranges must not overlap, which is always true of the
+    collectors created by :func:`segment_hues`. Since at most one of the collectors can contain any
+    given hue, the match is the same one a linear scan would find.
+
+    Args:
+        collectors: A mapping of group names to hue collectors.
+
+    Raises:
+        ValueError: If any collector does not test hue or if any of the hue ranges overlap.
+    """
+
+    __slots__ = ("_keys", "_lower", "_upper")
+
+    def __init__(self, collectors: Mapping[str, HsvCollector]):
+        if not HuePartition.is_partition(collectors):
+            raise ValueError("Collectors must be non-overlapping hue collectors.")
+
+        ordered = sorted(collectors.items(), key=lambda item: item[1].lower_bound)
+        self._keys = tuple(key for key, _ in ordered)
+        self._lower = tuple(collector.lower_bound for _, collector in ordered)
+        self._upper = tuple(collector.upper_bound for _, collector in ordered)
+
+    @staticmethod
+    def is_partition(collectors: Mapping[str, Container[Color]]) -> bool:
+        """Checks if the given collectors can be combined into a hue partition.
+
+        Args:
+            collectors: A mapping of group names to collectors.
+
+        Returns:
+            ``True`` if every collector is a hue collector and none of their ranges overlap.
+        """
+        if not all(
+            isinstance(collector, HsvCollector) and collector.component == "h"
+            for collector in collectors.values()
+        ):
+            return False
+
+        bounds = sorted((c.lower_bound, c.upper_bound) for c in collectors.values())
+
+        return all(upper <= lower for (_, upper), (lower, _) in zip(bounds, bounds[1:]))
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        """The group names in ascending hue order."""
+        return self._keys
+
+    def find(self, hue: float) -> str | None:
+        """Finds the name of the group that contains a hue.
+
+        Args:
+            hue: The hue as a float from ``0`` to ``1``.
+
+        Returns:
+            The group name, or ``None`` if no collector contains the hue.
+        """
+        index = bisect_right(self._lower, hue) - 1
+
+        return self._keys[index] if index >= 0 and hue < self._upper[index] else None
+
+    def find_indexes(self, hues: NDArray[np.float64]) -> NDArray[np.intp]:
+        """Finds the group for each of an array of hues at once.
+
+        Args:
+            hues: The hues as floats from ``0`` to ``1``.
+
+        Returns:
+            The index into :attr:`keys` of the group for each hue, or ``-1`` where no collector
+            contains the hue.
+        """
+        indexes = np.searchsorted(self._lower, hues, side="right") - 1
+        valid = indexes >= 0
+        valid[valid] = hues[valid] < np.asarray(self._upper)[indexes[valid]]
+
+        return np.where(valid, indexes, -1)
+
+    def __repr__(self):
+        return f"HuePartition({list(self._keys)})"
+
+    def __contains__(self, color: object) -> bool:
+        """Checks if any of the collectors in this partition contains the color."""
+        return self.find(cast(Color, color).hsv[0]) is not None
+
+
 def segment_hues(names: Sequence[str]) -> Mapping[str, Container[Color]]:
     """Generates a set of equally spaced hue collectors with the given names, assigned in the order that the
     names are given.
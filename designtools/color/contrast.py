@@ -0,0 +1,178 @@
+"""Provides WCAG contrast ratios for single color pairs and for whole palettes.
+
+The `contrast ratio`_ between two colors is ``(L1 + 0.05) / (L2 + 0.05)`` where ``L1`` is the
+relative luminance of the lighter color and ``L2`` that of the darker one. It ranges from ``1`` to
+``21``.
+
+.. _contrast ratio:
+   https://www.w3.org/TR/WCAG21/#dfn-contrast-ratio
+"""
+from collections.abc import Iterator, Sequence
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ._array_util import get_luminance_array
+from ._color_array import ColorArray
+from ._color_util import get_luminance
+from ._models import Color
+
+WCAG_AA = 4.5
+"""The minimum contrast ratio for normal text under WCAG level AA."""
+
+WCAG_AA_LARGE = 3.0
+"""The minimum contrast ratio for large text under WCAG level AA."""
+
+WCAG_AAA = 7.0
+"""The minimum contrast ratio for normal text under WCAG level AAA."""
+
+WCAG_AAA_LARGE = 4.5
+"""The minimum contrast ratio for large text under WCAG level AAA."""
+
+
+class ContrastPairs(NamedTuple):
+    """A block of color pairs found by :func:`contrast_pairs`."""
+    foreground: NDArray[np.intp]
+    """The index of the foreground color of each pair."""
+    background: NDArray[np.intp]
+    """The index of the background color of each pair."""
+    ratios: NDArray[np.float64]
+    """The contrast ratio of each pair."""
+
+
+class PassCounts(NamedTuple):
+    """The result of :func:`pass_counts`."""
+    foreground: NDArray[np.intp]
+    """The number of backgrounds each foreground color meets the threshold with."""
+    background: NDArray[np.intp]
+    """The number of foregrounds each background color meets the threshold with."""
+
+
+def contrast_ratio(color1: Color, color2: Color) -> float:
+    """Computes the contrast ratio between two colors. The order of the colors doesn't matter.
+
+    Args:
+        color1: The first color.
+        color2: The second color.
+
+    Returns:
+        The contrast ratio, from ``1`` to ``21``.
+    """
+    lum1 = get_luminance(*color1.rgb)
+    lum2 = get_luminance(*color2.rgb)
+
+    return (max(lum1, lum2) + 0.05) / (min(lum1, lum2) + 0.05)
+
+
+def _luminance(colors: Sequence[Color]) -> NDArray[np.float64]:
+    return get_luminance_array(ColorArray.of(colors).rgb)
+
+
+def _ratios(
+    foreground: NDArray[np.float64], background: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    fg = foreground[:, np.newaxis]
+    bg = background[np.newaxis, :]
+
+    return (np.maximum(fg, bg) + 0.05) / (np.minimum(fg, bg) + 0.05)
+
+
+def contrast_matrix(
+    foregrounds: Sequence[Color], backgrounds: Sequence[Color]
+) -> NDArray[np.float64]:
+    """Computes the contrast ratio of every foreground and background pair.
+
+    The matrix needs ``len(foregrounds) * len(backgrounds)`` floats. Use :func:`contrast_pairs` or
+    :func:`pass_counts` for palettes that are too large for that.
+
+    Args:
+        foregrounds: The foreground colors.
+        backgrounds: The background colors.
+
+    Returns:
+        The ``(len(foregrounds), len(backgrounds))`` matrix of contrast ratios.
+    """
+    return _ratios(_luminance(foregrounds), _luminance(backgrounds))
+
+
+def contrast_pairs(
+    foregrounds: Sequence[Color],
+    backgrounds: Sequence[Color],
+    threshold: float = WCAG_AA,
+    passing: bool = True,
+    tile_size: int = 1024,
+) -> Iterator[ContrastPairs]:
+    """Finds the foreground and background pairs that pass (or fail) a contrast threshold.
+
+    The contrast ratios are computed in tiles of at most ``tile_size`` by ``tile_size`` pairs, so
+    the full matrix never exists in memory.
+
+    Args:
+        foregrounds: The foreground colors.
+        backgrounds: The background colors.
+        threshold: The minimum contrast ratio for a pair to pass, such as :data:`WCAG_AA`.
+        passing: Produces the pairs that meet the threshold when ``True``, otherwise the pairs that
+            don't.
+        tile_size: The maximum number of foregrounds and backgrounds compared at a time.
+
+    Returns:
+        An iterator over blocks of pairs. Blocks without any pairs are skipped.
+
+    Raises:
+        ValueError: If ``tile_size`` is less than 1.
+    """
+    if tile_size < 1:
+        raise ValueError("tile_size must be >= 1.")
+
+    fg_lum = _luminance(foregrounds)
+    bg_lum = _luminance(backgrounds)
+
+    for row in range(0, len(fg_lum), tile_size):
+        for column in range(0, len(bg_lum), tile_size):
+            ratios = _ratios(fg_lum[row:row + tile_size], bg_lum[column:column + tile_size])
+            fg, bg = np.nonzero((ratios >= threshold) == passing)
+            if len(fg) > 0:
+                yield ContrastPairs(fg + row, bg + column, ratios[fg, bg])
+
+
+def _count_passing(luminance: NDArray[np.float64], others: NDArray[np.float64],
+                   threshold: float) -> NDArray[np.intp]:
+    if threshold <= 1:
+        return np.full(len(luminance), len(others), dtype=np.intp)
+
+    # A color passes with every darker color at or below one bound and every lighter color at or
+    # above the other, so two binary searches over the sorted luminances give the count.
+    ordered = np.sort(others)
+    darker = (luminance + 0.05) / threshold - 0.05
+    lighter = (luminance + 0.05) * threshold - 0.05
+
+    return (
+        np.searchsorted(ordered, darker, side="right")
+        + len(ordered) - np.searchsorted(ordered, lighter, side="left")
+    )
+
+
+def pass_counts(
+    foregrounds: Sequence[Color], backgrounds: Sequence[Color], threshold: float = WCAG_AA
+) -> PassCounts:
+    """Counts how many pairs each color passes a contrast threshold in, without computing the ratios
+    for individual pairs.
+
+    Each palette is sorted by luminance once, after which every color's count takes two binary
+    searches. This takes ``O((F + B) log(F + B))`` time and ``O(F + B)`` memory.
+
+    Args:
+        foregrounds: The foreground colors.
+        backgrounds: The background colors.
+        threshold: The minimum contrast ratio for a pair to pass, such as :data:`WCAG_AA`.
+
+    Returns:
+        The pass counts for each foreground and each background color.
+    """
+    fg_lum = _luminance(foregrounds)
+    bg_lum = _luminance(backgrounds)
+
+    return PassCounts(
+        _count_passing(fg_lum, bg_lum, threshold), _count_passing(bg_lum, fg_lum, threshold)
+    )
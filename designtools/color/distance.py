@@ -0,0 +1,258 @@
+"""Provides perceptual color differences (delta E) and tiled pairwise distance computations.
+
+Pairwise distances are computed in square tiles of at most ``tile_size`` by ``tile_size`` pairs, so
+peak memory depends on the tile size rather than on the number of colors.
+"""
+from collections.abc import Iterator, Sequence
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ._color_array import ColorArray
+from ._models import Color
+
+METRICS = ("cie76", "ciede2000", "oklab")
+"""The supported distance metrics. ``"cie76"`` and ``"ciede2000"`` are measured in CIELAB, and
+``"oklab"`` is the Euclidean distance in OKLab."""
+
+_POW25_7 = 25.0 ** 7
+
+
+def delta_e_76(lab1: NDArray[np.float64], lab2: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Computes the CIE76 color difference, the Euclidean distance between CIELAB colors.
+
+    Args:
+        lab1: An array of CIELAB colors with the components in the last axis.
+        lab2: An array of CIELAB colors that broadcasts against ``lab1``.
+
+    Returns:
+        The difference for each pair of colors.
+    """
+    return np.linalg.norm(lab1 - lab2, axis=-1)
+
+
+def delta_e_2000(lab1: NDArray[np.float64], lab2: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Computes the `CIEDE2000`_ color difference between CIELAB colors.
+
+    Args:
+        lab1: An array of CIELAB colors with the components in the last axis.
+        lab2: An array of CIELAB colors that broadcasts against ``lab1``.
+
+    Returns:
+        The difference for each pair of colors.
+
+    .. _CIEDE2000:
+       https://hajim.rochester.edu/ece/sites/gsharma/ciede2000/
+    """
+    l1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    l2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+
+    c_bar7 = ((np.hypot(a1, b1) + np.hypot(a2, b2)) / 2) ** 7
+    g = 0.5 * (1 - np.sqrt(c_bar7 / (c_bar7 + _POW25_7)))
+    a1p = (1 + g) * a1
+    a2p = (1 + g) * a2
+    c1p = np.hypot(a1p, b1)
+    c2p = np.hypot(a2p, b2)
+    h1p = np.degrees(np.arctan2(b1, a1p)) % 360
+    h2p = np.degrees(np.arctan2(b2, a2p)) % 360
+
+    chromatic = (c1p * c2p) != 0
+    h_diff = h2p - h1p
+    dhp = np.where(h_diff > 180, h_diff - 360, np.where(h_diff < -180, h_diff + 360, h_diff))
+    dhp = np.where(chromatic, dhp, 0)
+
+    dlp = l2 - l1
+    dcp = c2p - c1p
+    d_hp = 2 * np.sqrt(c1p * c2p) * np.sin(np.radians(dhp / 2))
+
+    l_barp = (l1 + l2) / 2
+    c_barp = (c1p + c2p) / 2
+    h_sum = h1p + h2p
+    h_barp = np.where(
+        np.abs(h_diff) <= 180,
+        h_sum / 2,
+        np.where(h_sum < 360, (h_sum + 360) / 2, (h_sum - 360) / 2),
+    )
+    h_barp = np.where(chromatic, h_barp, h_sum)
+
+    t = (
+        1
+        - 0.17 * np.cos(np.radians(h_barp - 30))
+        + 0.24 * np.cos(np.radians(2 * h_barp))
+        + 0.32 * np.cos(np.radians(3 * h_barp + 6))
+        - 0.20 * np.cos(np.radians(4 * h_barp - 63))
+    )
+    d_theta = 30 * np.exp(-(((h_barp - 275) / 25) ** 2))
+    c_barp7 = c_barp ** 7
+    r_c = 2 * np.sqrt(c_barp7 / (c_barp7 + _POW25_7))
+    l_offset = (l_barp - 50) ** 2
+    s_l = 1 + 0.015 * l_offset / np.sqrt(20 + l_offset)
+    s_c = 1 + 0.045 * c_barp
+    s_h = 1 + 0.015 * c_barp * t
+    r_t = -np.sin(np.radians(2 * d_theta)) * r_c
+
+    dl = dlp / s_l
+    dc = dcp / s_c
+    dh = d_hp / s_h
+
+    return np.sqrt(dl ** 2 + dc ** 2 + dh ** 2 + r_t * dc * dh)
+
+
+def _coordinates(colors: Sequence[Color], metric: str) -> NDArray[np.float64]:
+    if metric not in METRICS:
+        raise ValueError(f"metric must be one of {METRICS}")
+
+    array = ColorArray.of(colors)
+
+    return array.oklab if metric == "oklab" else array.lab
+
+
+def _distances(first: NDArray[np.float64], second: NDArray[np.float64], metric: str):
+    """Computes the distance between every point in ``first`` and every point in ``second``."""
+    first = first[:, np.newaxis, :]
+    second = second[np.newaxis, :, :]
+
+    return delta_e_2000(first, second) if metric == "ciede2000" else delta_e_76(first, second)
+
+
+def color_distance(color1: Color, color2: Color, metric: str = "ciede2000") -> float:
+    """Computes the distance between two colors.
+
+    Args:
+        color1: The first color.
+        color2: The second color.
+        metric: One of the :data:`METRICS`.
+
+    Returns:
+        The distance.
+
+    Raises:
+        ValueError: If ``metric`` is not one of the :data:`METRICS`.
+    """
+    points = _coordinates((color1, color2), metric)
+
+    return float(_distances(points[:1], points[1:], metric)[0, 0])
+
+
+class DistanceTile(NamedTuple):
+    """One tile of a pairwise distance matrix."""
+    row: int
+    """The index of the first row of the tile in the full matrix."""
+    column: int
+    """The index of the first column of the tile in the full matrix."""
+    distances: NDArray[np.float64]
+    """The distances for the pairs in the tile."""
+
+
+class ColorPairs(NamedTuple):
+    """A block of color pairs found by :func:`close_pairs`."""
+    first: NDArray[np.intp]
+    """The index of the first color of each pair."""
+    second: NDArray[np.intp]
+    """The index of the second color of each pair."""
+    distances: NDArray[np.float64]
+    """The distance between the colors of each pair."""
+
+
+def distance_tiles(
+    colors: Sequence[Color],
+    others: Sequence[Color] | None = None,
+    metric: str = "ciede2000",
+    tile_size: int = 1024,
+) -> Iterator[DistanceTile]:
+    """Computes the pairwise distance matrix one tile at a time.
+
+    Args:
+        colors: The colors for the rows of the matrix.
+        others: The colors for the columns of the matrix. If not given, ``colors`` is compared with
+            itself and only the tiles on or above the diagonal are produced, since the matrix is
+            symmetric.
+        metric: One of the :data:`METRICS`.
+        tile_size: The maximum number of rows and columns in each tile.
+
+    Returns:
+        An iterator over the tiles in row-major order.
+
+    Raises:
+        ValueError: If ``metric`` is not one of the :data:`METRICS` or ``tile_size`` is less than 1.
+    """
+    if tile_size < 1:
+        raise ValueError("tile_size must be >= 1.")
+
+    rows = _coordinates(colors, metric)
+    columns = rows if others is None else _coordinates(others, metric)
+
+    for row in range(0, len(rows), tile_size):
+        first = row if others is None else 0
+        for column in range(first, len(columns), tile_size):
+            distances = _distances(
+                rows[row:row + tile_size], columns[column:column + tile_size], metric
+            )
+            yield DistanceTile(row, column, distances)
+
+
+def distance_matrix(
+    colors: Sequence[Color],
+    others: Sequence[Color] | None = None,
+    metric: str = "ciede2000",
+    tile_size: int = 1024,
+) -> NDArray[np.float64]:
+    """Computes the full pairwise distance matrix.
+
+    The matrix itself needs ``len(colors) * len(others)`` floats. Use :func:`distance_tiles` or
+    :func:`close_pairs` for palettes that are too large for that.
+
+    Args:
+        colors: The colors for the rows of the matrix.
+        others: The colors for the columns of the matrix. If not given, ``colors`` is compared with
+            itself.
+        metric: One of the :data:`METRICS`.
+        tile_size: The maximum number of rows and columns computed at a time.
+
+    Returns:
+        The ``(len(colors), len(others))`` distance matrix.
+    """
+    rows = len(colors)
+    matrix = np.zeros((rows, rows if others is None else len(others)))
+
+    for row, column, distances in distance_tiles(colors, others, metric, tile_size):
+        height, width = distances.shape
+        matrix[row:row + height, column:column + width] = distances
+        if others is None and row != column:
+            matrix[column:column + width, row:row + height] = distances.T
+
+    return matrix
+
+
+def close_pairs(
+    colors: Sequence[Color],
+    threshold: float,
+    others: Sequence[Color] | None = None,
+    metric: str = "ciede2000",
+    tile_size: int = 1024,
+) -> Iterator[ColorPairs]:
+    """Finds the pairs of colors closer than a threshold without keeping the distance matrix.
+
+    This is useful for finding near-duplicates in a palette. Only one tile of distances exists at a
+    time, and each tile produces one block of the pairs it contains.
+
+    Args:
+        colors: The colors to compare.
+        threshold: Pairs with a distance less than this are produced.
+        others: The colors to compare ``colors`` with. If not given, ``colors`` is compared with
+            itself and each pair of distinct indexes is produced once, with ``first < second``.
+        metric: One of the :data:`METRICS`.
+        tile_size: The maximum number of rows and columns computed at a time.
+
+    Returns:
+        An iterator over blocks of close pairs. Blocks without any pairs are skipped.
+    """
+    for row, column, distances in distance_tiles(colors, others, metric, tile_size):
+        close = distances < threshold
+        if others is None and row == column:
+            close = np.triu(close, k=1)
+
+        first, second = np.nonzero(close)
+        if len(first) > 0:
+            yield ColorPairs(first + row, second + column, distances[first, second])
@@ -1,8 +1,63 @@
 """Provides tools for collecting colors into groups.
 """
-from collections.abc import (Container, Mapping, MutableMapping, MutableSequence, Sequence, )
+from collections.abc import (Callable, Container, Iterable, Mapping, MutableMapping,
+                             MutableSequence, Sequence, )
+from typing import NamedTuple
 
-from ._models import Color
+import numpy as np
+from numpy.typing import NDArray
+
+from ._models import Color, packed_color
+from .collectors import HuePartition
+
+Matcher = Callable[[Color], str | None]
+"""Finds the name of the group a color belongs to, or ``None`` if it doesn't belong to the group(s)
+the matcher covers."""
+
+
+def _single_matcher(key: str, collector: Container[Color]) -> Matcher:
+    return lambda color: key if color in collector else None
+
+
+def _partition_matcher(partition: HuePartition) -> Matcher:
+    return lambda color: partition.find(color.hsv[0])
+
+
+def compile_collectors(collectors: Mapping[str, Container[Color]]) -> Sequence[Matcher]:
+    """Converts a mapping of collectors into matchers that are tried in order.
+
+    Each run of consecutive collectors that forms a :class:`HuePartition` is replaced by a single
+    matcher that finds the group with a binary search. Since only one collector in such a run can
+    ever match, the first matching group is the same as it would be when testing each collector in
+    order.
+
+    Args:
+        collectors: A mapping of group names to the container rule that determines membership in the
+        group.
+
+    Returns:
+        The matchers in the order they should be tried.
+    """
+    matchers: list[Matcher] = []
+    run: dict[str, Container[Color]] = {}
+
+    def flush():
+        if len(run) > 1 and HuePartition.is_partition(run):
+            matchers.append(_partition_matcher(HuePartition(run)))
+        else:
+            matchers.extend(_single_matcher(key, collector) for key, collector in run.items())
+        run.clear()
+
+    for key, collector in collectors.items():
+        if not HuePartition.is_partition({key: collector}):
+            flush()
+            matchers.append(_single_matcher(key, collector))
+        else:
+            run[key] = collector
+
+    flush()
+
+    return matchers
 
 
 def group_colors(
@@ -14,28 +69,120 @@ def group_colors(
     Container membership tests are objects that implement a ``__contains__`` method that will check a Color
     instance for membership.
 
-    Colors will be placed in the first group whose membership test passed. The function ensures that any
-    given color will only appear in one group even if it occurs more than once in ``colors``.
+    Colors will be placed in the first group whose membership test passed. The function ensures that
+    any given color will only appear in one group even if it occurs more than once in ``colors``.
+    Colors are de-duplicated with a set and keep the order in which they were first seen, so the
+    running time grows linearly with the number of colors.
 
     Args:
         colors: The Color instances to group.
         collectors: A mapping of group names to the container rule that determines membership in the group.
 
     Returns:
-        A mapping of group names to a sequence of Color instances that were collected by that group's
-        membership tests. The keys in this group will be the same as the keys for ``collectors``. Note that
-        the associated sequence may be empty of none of the collector for that key did not match any of the
-        given colors.
+        A mapping of group names to a sequence of Color instances that were collected by that
+        group's membership tests. The keys in this group will be the same as the keys for
+        ``collectors``, in the same order. Note that the associated sequence may be empty if the
+        collector for that key did not match any of the given colors.
     """
-    groupings: MutableMapping[str, MutableSequence[Color]] = {}
+    groupings: MutableMapping[str, MutableSequence[Color]] = {key: [] for key in collectors}
+    matchers = compile_collectors(collectors)
+    seen: set[Color] = set()
 
     for color in colors:
-        for key, collector in collectors.items():
-            if key not in groupings:
-                groupings[key] = []
+        if color in seen:
+            continue
+        seen.add(color)
 
-            if color in collector and color not in groupings[key]:
+        for matcher in matchers:
+            key = matcher(color)
+            if key is not None:
                 groupings[key].append(color)
                 break
 
     return groupings
+
+
+class ColorCount(NamedTuple):
+    """A color and the number of times it occurs in a source, like the pixels of an image."""
+    color: Color
+    count: int
+
+
+def group_color_counts(
+    color_counts: Iterable[ColorCount],
+    collectors: Mapping[str, Container[Color]]
+) -> Mapping[str, Sequence[ColorCount]]:
+    """Organizes counted colors into groups, like :func:`group_colors` does for plain colors.
+
+    The counts of a color that occurs more than once in ``color_counts`` are added together.
+
+    Args:
+        color_counts: The colors to group and the number of times each occurs.
+        collectors: A mapping of group names to the container rule that determines membership in the
+        group.
+
+    Returns:
+        A mapping of group names to the counted colors collected by that group, from the most to the
+        least common. Colors with the same count keep the order in which they were first seen. The
+        keys are the same as the keys for ``collectors``, in the same order.
+    """
+    totals: dict[Color, int] = {}
+    for color, count in color_counts:
+        totals[color] = totals.get(color, 0) + count
+
+    return {
+        key: sorted(
+            (ColorCount(color, totals[color]) for color in group), key=lambda entry: -entry.count
+        )
+        for key, group in group_colors(tuple(totals), collectors).items()
+    }
+
+
+class PackedGroups(NamedTuple):
+    """A compact form of grouped colors for pickling or sending to other processes.
+
+    The colors of every group are stored end to end in a single array of packed 24-bit values, so a
+    million colors pickle to about 4 MB. See :func:`pack_groups`
+    """
+    names: tuple[str, ...]
+    """The group names in their original order."""
+    offsets: NDArray[np.int64]
+    """The start of each group in :attr:`packed`, followed by the total number of colors."""
+    packed: NDArray[np.uint32]
+    """The packed value of every color, group by group. See :attr:`Color.packed`"""
+
+    def unpack(self) -> Mapping[str, Sequence[Color]]:
+        """Recreates the grouped colors.
+
+        Returns:
+            A mapping of group names to the colors of that group, in their original order.
+        """
+        values = self.packed.tolist()
+        bounds = self.offsets.tolist()
+
+        return {
+            name: [packed_color(value) for value in values[start:end]]
+            for name, start, end in zip(self.names, bounds[:-1], bounds[1:])
+        }
+
+
+def pack_groups(groups: Mapping[str, Sequence[Color]]) -> PackedGroups:
+    """Converts grouped colors, like those returned by :func:`group_colors`, to their compact form.
+
+    Colors are stored as their packed 24-bit values, so components that are not exact 8-bit values
+    are truncated the same way as :attr:`Color.hex_code`.
+
+    Args:
+        groups: A mapping of group names to the colors of that group.
+
+    Returns:
+        The packed groups.
+    """
+    sizes = [len(group) for group in groups.values()]
+    packed = np.fromiter(
+        (color.packed for group in groups.values() for color in group),
+        dtype=np.uint32,
+        count=sum(sizes),
+    )
+
+    return PackedGroups(tuple(groups.keys()), np.cumsum([0] + sizes, dtype=np.int64), packed)
@@ -0,0 +1,128 @@
+"""Provides nearest-color queries against a fixed palette.
+"""
+from collections.abc import Sequence
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ._color_array import COLOR_SPACES, ColorArray
+from ._models import Color
+
+
+class Neighbors(NamedTuple):
+    """The result of a nearest-color query."""
+    indexes: NDArray[np.intp]
+    """The palette indexes of the nearest colors, nearest first."""
+    distances: NDArray[np.float64]
+    """The Euclidean distance to each of the nearest colors in the index's color space."""
+
+
+class PaletteIndex:
+    """Finds the nearest palette colors for large batches of query colors.
+
+    Queries are answered in vectorized blocks of ``batch_size`` query colors. Each block compares
+    every query color with every palette color using a single matrix product, so the work for a
+    block is ``batch_size * len(palette)`` distance computations without any per-color Python code.
+    Memory use is bounded by the block size regardless of how many colors are queried.
+
+    Args:
+        palette: The palette colors to search.
+        space: The color space distances are measured in, one of :data:`COLOR_SPACES`. See
+            :meth:`ColorArray.coordinates`.
+        batch_size: The number of query colors compared with the palette at a time.
+
+    Raises:
+        ValueError: If the palette is empty, the space is unknown, or the batch size is not
+        positive.
+    """
+
+    __slots__ = ("_palette", "_space", "_points", "_norms", "_batch_size")
+
+    def __init__(self, palette: Sequence[Color], space: str = "oklab", batch_size: int = 4096):
+        if space not in COLOR_SPACES:
+            raise ValueError(f"space must be one of {COLOR_SPACES}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1.")
+
+        self._palette = ColorArray.of(palette)
+        if len(self._palette) == 0:
+            raise ValueError("The palette must contain at least one color.")
+
+        self._space = space
+        self._batch_size = batch_size
+        self._points = self._palette.coordinates(space)
+        self._norms = np.einsum("ij,ij->i", self._points, self._points)
+
+    @property
+    def palette(self) -> ColorArray:
+        """The palette colors."""
+        return self._palette
+
+    @property
+    def space(self) -> str:
+        """The color space distances are measured in."""
+        return self._space
+
+    def __len__(self) -> int:
+        return len(self._palette)
+
+    def _query_batch(self, points: NDArray[np.float64], k: int) -> Neighbors:
+        # |q - p|^2 = |q|^2 - 2 q.p + |p|^2, where |q|^2 is the same for every palette color and can
+        # be left out when ranking them.
+        scores = self._norms - 2 * (points @ self._points.T)
+
+        if k == 1:
+            indexes = np.argmin(scores, axis=1)[:, np.newaxis]
+        else:
+            indexes = np.argpartition(scores, k - 1, axis=1)[:, :k]
+            ranked = np.argsort(np.take_along_axis(scores, indexes, axis=1), axis=1, kind="stable")
+            indexes = np.take_along_axis(indexes, ranked, axis=1)
+
+        # Measure the chosen neighbors directly, which is more precise than the expanded form.
+        offsets = points[:, np.newaxis, :] - self._points[indexes]
+        distances = np.sqrt(np.einsum("ijk,ijk->ij", offsets, offsets))
+
+        return Neighbors(indexes, distances)
+
+    def query(self, colors: Sequence[Color], k: int = 1) -> Neighbors:
+        """Finds the ``k`` nearest palette colors for each query color.
+
+        Args:
+            colors: The query colors. A :class:`ColorArray` is used as-is.
+            k: The number of neighbors to find for each color.
+
+        Returns:
+            The palette indexes and distances of the neighbors. With ``k == 1`` both arrays have the
+            shape ``(N,)``, otherwise they have the shape ``(N, k)`` with the nearest neighbor
+            first.
+
+        Raises:
+            ValueError: If ``k`` is less than 1 or greater than the palette size.
+        """
+        if not 1 <= k <= len(self._palette):
+            raise ValueError("k must be >= 1 and <= the palette size.")
+
+        points = ColorArray.of(colors).coordinates(self._space)
+        indexes = np.empty((len(points), k), dtype=np.intp)
+        distances = np.empty((len(points), k), dtype=np.float64)
+
+        for start in range(0, len(points), self._batch_size):
+            stop = start + self._batch_size
+            indexes[start:stop], distances[start:stop] = self._query_batch(points[start:stop], k)
+
+        if k == 1:
+            return Neighbors(indexes[:, 0], distances[:, 0])
+
+        return Neighbors(indexes, distances)
+
+    def nearest(self, colors: Sequence[Color]) -> ColorArray:
+        """Snaps each color to its nearest palette color.
+
+        Args:
+            colors: The colors to snap. A :class:`ColorArray` is used as-is.
+
+        Returns:
+            The nearest palette color for each of ``colors``, in the same order.
+        """
+        return self._palette[self.query(colors).indexes]
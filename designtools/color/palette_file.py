@@ -0,0 +1,326 @@
+"""Provides a compact binary palette format that can be memory-mapped instead of read.
+
+A palette file holds a 16-byte little-endian header followed by up to three arrays and a table of
+group names:
+
+=============  ===========================================================================
+Field          Contents
+=============  ===========================================================================
+``magic``      The 4 bytes ``b"DTPL"``.
+``version``    ``uint16`` format version, currently ``1``.
+``flags``      ``uint16`` bit set of :data:`HAS_GROUPS` and :data:`HAS_COUNTS`.
+``count``      ``uint32`` number of colors.
+``names``      ``uint32`` size in bytes of the UTF-8 group name table.
+colors         ``count`` packed 24-bit colors as ``<u4``. See :attr:`Color.packed`
+group ids      ``count`` group indexes as ``<u4``, if :data:`HAS_GROUPS` is set.
+counts         ``count`` frequency counts as ``<u8``, 8-byte aligned, if :data:`HAS_COUNTS` is set.
+group names    The group names, each followed by a newline, indexed by the group ids.
+=============  ===========================================================================
+
+Loading maps the arrays straight from the file, so several processes that load the same palette
+share one copy of it through the operating system's page cache.
+"""
+import struct
+from collections.abc import Mapping, Sequence
+from os import PathLike
+from typing import overload
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._color_array import ColorArray
+from ._models import Color, packed_color
+
+MAGIC = b"DTPL"
+"""The first four bytes of every palette file."""
+
+VERSION = 1
+"""The palette file format version written by :func:`write_palette`."""
+
+HAS_GROUPS = 0x1
+"""The header flag for files with group ids and names."""
+
+HAS_COUNTS = 0x2
+"""The header flag for files with frequency counts."""
+
+_HEADER = struct.Struct("<4sHHII")
+
+_COLOR_TYPE = np.dtype("<u4")
+_GROUP_TYPE = np.dtype("<u4")
+_COUNT_TYPE = np.dtype("<u8")
+
+
+def _align(offset: int, alignment: int) -> int:
+    return -(-offset // alignment) * alignment
+
+
+class _Layout:
+    """The byte offsets of the sections of a palette file."""
+
+    __slots__ = ("colors", "groups", "counts", "names", "end")
+
+    def __init__(self, count: int, flags: int, names_size: int):
+        self.colors = _HEADER.size
+        offset = self.colors + count * _COLOR_TYPE.itemsize
+
+        self.groups = offset if flags & HAS_GROUPS else None
+        if self.groups is not None:
+            offset += count * _GROUP_TYPE.itemsize
+
+        self.counts = _align(offset, _COUNT_TYPE.itemsize) if flags & HAS_COUNTS else None
+        if self.counts is not None:
+            offset = self.counts + count * _COUNT_TYPE.itemsize
+
+        self.names = offset
+        self.end = offset + names_size
+
+
+class MappedPalette(Sequence[Color]):
+    """A palette backed by read-only arrays, usually memory-mapped from a palette file.
+
+    Colors are only created when they are accessed. Indexing with an integer returns a ``Color``,
+    while slices return a new ``MappedPalette`` that shares the same arrays.
+
+    Args:
+        packed: The packed 24-bit value of each color.
+        group_ids: The optional index into ``group_names`` of each color's group.
+        counts: The optional frequency count of each color.
+        group_names: The names of the groups.
+
+    Raises:
+        ValueError: If the arrays are not all the same length.
+    """
+
+    __slots__ = ("_packed", "_group_ids", "_counts", "_group_names")
+
+    def __init__(
+        self,
+        packed: NDArray[np.uint32],
+        group_ids: NDArray[np.uint32] | None = None,
+        counts: NDArray[np.uint64] | None = None,
+        group_names: Sequence[str] = (),
+    ):
+        if any(array is not None and len(array) != len(packed) for array in (group_ids, counts)):
+            raise ValueError("group_ids and counts must have one entry for each color.")
+
+        self._packed = packed
+        self._group_ids = group_ids
+        self._counts = counts
+        self._group_names = tuple(group_names)
+
+    @property
+    def packed(self) -> NDArray[np.uint32]:
+        """The packed 24-bit value of each color. See :attr:`Color.packed`"""
+        return self._packed
+
+    @property
+    def group_ids(self) -> NDArray[np.uint32] | None:
+        """The index into :attr:`group_names` of each color's group, or ``None`` if not grouped."""
+        return self._group_ids
+
+    @property
+    def counts(self) -> NDArray[np.uint64] | None:
+        """The frequency count of each color, or ``None`` if not counted."""
+        return self._counts
+
+    @property
+    def group_names(self) -> tuple[str, ...]:
+        """The names of the groups."""
+        return self._group_names
+
+    def to_color_array(self) -> ColorArray:
+        """Converts the palette to a color array for vectorized work."""
+        return ColorArray.from_packed(self._packed)
+
+    def groups(self) -> dict[str, tuple[Color, ...]]:
+        """Rebuilds the grouped colors in the shape returned by :func:`group_colors`.
+
+        Returns:
+            The colors of each named group in palette order. Every group name has an entry, even if
+            no colors belong to it.
+
+        Raises:
+            ValueError: If the palette is not grouped.
+        """
+        if self._group_ids is None:
+            raise ValueError("The palette has no groups.")
+
+        order = np.argsort(self._group_ids, kind="stable")
+        bounds = np.searchsorted(self._group_ids[order], np.arange(len(self._group_names) + 1))
+        packed = self._packed[order].tolist()
+
+        starts, ends = bounds[:-1].tolist(), bounds[1:].tolist()
+        return {
+            name: tuple(packed_color(value) for value in packed[start:end])
+            for name, start, end in zip(self._group_names, starts, ends)
+        }
+
+    def __len__(self) -> int:
+        return len(self._packed)
+
+    @overload
+    def __getitem__(self, index: int) -> Color:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "MappedPalette":
+        ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return MappedPalette(
+                self._packed[index],
+                None if self._group_ids is None else self._group_ids[index],
+                None if self._counts is None else self._counts[index],
+                self._group_names,
+            )
+
+        return packed_color(int(self._packed[index]))
+
+    def __iter__(self):
+        return (packed_color(value) for value in self._packed.tolist())
+
+    def __repr__(self):
+        return f"MappedPalette({len(self)} colors, groups={self._group_names})"
+
+
+def _as_packed(colors: Sequence[Color]) -> NDArray[np.uint32]:
+    if isinstance(colors, (ColorArray, MappedPalette)):
+        return colors.packed
+
+    return np.fromiter((color.packed for color in colors), dtype=np.uint32, count=len(colors))
+
+
+def write_palette(
+    path: str | PathLike,
+    colors: Sequence[Color],
+    group_ids: ArrayLike | None = None,
+    counts: ArrayLike | None = None,
+    group_names: Sequence[str] = (),
+) -> None:
+    """Writes colors to a palette file.
+
+    Args:
+        path: The file to create or overwrite.
+        colors: The colors, in the order they will be loaded.
+        group_ids: The optional index into ``group_names`` of each color's group.
+        counts: The optional non-negative frequency count of each color.
+        group_names: The names of the groups. Names may not contain newlines.
+
+    Raises:
+        ValueError: If ``group_ids`` or ``counts`` don't have one entry for each color, a group id
+            has no name, or a name contains a newline.
+    """
+    packed = _as_packed(colors)
+    flags = 0
+
+    if group_ids is not None:
+        flags |= HAS_GROUPS
+        group_ids = np.asarray(group_ids, dtype=_GROUP_TYPE)
+        if len(group_ids) != len(packed):
+            raise ValueError("group_ids must have one entry for each color.")
+        if len(group_ids) > 0 and group_ids.max() >= len(group_names):
+            raise ValueError("Every group id must have a group name.")
+
+    if counts is not None:
+        flags |= HAS_COUNTS
+        counts = np.asarray(counts, dtype=_COUNT_TYPE)
+        if len(counts) != len(packed):
+            raise ValueError("counts must have one entry for each color.")
+
+    if any("\n" in name for name in group_names):
+        raise ValueError("Group names may not contain newlines.")
+    names = "".join(f"{name}\n" for name in group_names).encode("utf-8")
+
+    layout = _Layout(len(packed), flags, len(names))
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, VERSION, flags, len(packed), len(names)))
+        file.write(packed.astype(_COLOR_TYPE, copy=False).tobytes())
+        if group_ids is not None:
+            file.write(group_ids.tobytes())
+        if counts is not None:
+            file.write(bytes(layout.counts - file.tell()))
+            file.write(counts.tobytes())
+        file.write(names)
+
+
+def write_grouped_palette(
+    path: str | PathLike,
+    groups: Mapping[str, Sequence[Color]],
+    counts: Mapping[Color, int] | None = None,
+) -> None:
+    """Writes the result of :func:`group_colors` to a palette file.
+
+    Args:
+        path: The file to create or overwrite.
+        groups: The colors of each named group.
+        counts: The optional frequency count of each color. Colors without a count are written with
+            a count of ``0``.
+
+    Raises:
+        ValueError: If a group name contains a newline.
+    """
+    colors = [color for group in groups.values() for color in group]
+    group_ids = np.repeat(
+        np.arange(len(groups), dtype=_GROUP_TYPE), [len(group) for group in groups.values()]
+    )
+
+    write_palette(
+        path,
+        colors,
+        group_ids,
+        None if counts is None else [counts.get(color, 0) for color in colors],
+        tuple(groups.keys()),
+    )
+
+
+def load_palette(path: str | PathLike) -> MappedPalette:
+    """Memory-maps a palette file.
+
+    The colors are not copied into memory. Pages of the file are read by the operating system as
+    they are used and are shared with every other process that maps the same file.
+
+    Args:
+        path: The palette file.
+
+    Returns:
+        The palette, backed by read-only memory maps of the file.
+
+    Raises:
+        ValueError: If the file is not a palette file, is truncated, or has an unsupported version.
+    """
+    with open(path, "rb") as file:
+        header = file.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise ValueError(f"'{path}' is not a palette file.")
+
+        magic, version, flags, count, names_size = _HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError(f"'{path}' is not a palette file.")
+        if version != VERSION:
+            raise ValueError(f"Unsupported palette file version {version}.")
+
+        layout = _Layout(count, flags, names_size)
+        file.seek(layout.names)
+        names = file.read(names_size)
+        if len(names) != names_size:
+            raise ValueError(f"'{path}' is truncated.")
+
+    def mapped(dtype: np.dtype, offset: int | None) -> NDArray | None:
+        if offset is None:
+            return None
+        if count == 0:
+            # NumPy can't map zero bytes.
+            return np.empty(0, dtype=dtype)
+
+        return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(count,))
+
+    # Every name ends with a newline, so the last entry of the split is always empty.
+    group_names = names.decode("utf-8").split("\n")[:-1]
+
+    return MappedPalette(
+        mapped(_COLOR_TYPE, layout.colors),
+        mapped(_GROUP_TYPE, layout.groups),
+        mapped(_COUNT_TYPE, layout.counts),
+        group_names,
+    )
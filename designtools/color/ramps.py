@@ -0,0 +1,113 @@
+"""Provides bulk generation of tint, shade, and tone ramps for palettes.
+"""
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._array_util import scale_components_array
+from ._color_array import ColorArray
+from ._models import Color
+
+RAMP_SPACES = ("hsv", "rgb", "white")
+"""The component spaces that ramp factors can be applied in. ``"white"`` factors scale the distance
+of each RGB component from white."""
+
+
+def tint_factors(steps: int) -> NDArray[np.float64]:
+    """Creates factors that lighten a color towards white in equal steps.
+
+    The factors scale the distance of each RGB component from white, so they must be applied in the
+    ``"white"`` space. Each tint is the color mixed with a growing amount of white.
+
+    Args:
+        steps: The number of tints, not counting the original color.
+
+    Returns:
+        A ``(steps, 3)`` factor matrix for use with :func:`transform_palette`.
+    """
+    distances = np.linspace(1, 0, steps + 1)[1:]
+
+    return np.repeat(distances[:, np.newaxis], 3, axis=1)
+
+
+def shade_factors(steps: int) -> NDArray[np.float64]:
+    """Creates HSV factors that darken a color towards black in equal steps.
+
+    Args:
+        steps: The number of shades, not counting the original color.
+
+    Returns:
+        A ``(steps, 3)`` factor matrix for use with :func:`transform_palette`.
+    """
+    values = np.linspace(1, 0, steps + 1)[1:]
+
+    return np.stack((np.ones(steps), np.ones(steps), values), axis=1)
+
+
+def tone_factors(steps: int) -> NDArray[np.float64]:
+    """Creates HSV factors that desaturate a color towards gray in equal steps.
+
+    Args:
+        steps: The number of tones, not counting the original color.
+
+    Returns:
+        A ``(steps, 3)`` factor matrix for use with :func:`transform_palette`.
+    """
+    saturations = np.linspace(1, 0, steps + 1)[1:]
+
+    return np.stack((np.ones(steps), saturations, np.ones(steps)), axis=1)
+
+
+def transform_palette(
+    colors: Sequence[Color], factors: ArrayLike, space: str = "hsv"
+) -> ColorArray:
+    """Applies every row of a factor matrix to every color of a palette in one vectorized pass.
+
+    Args:
+        colors: The palette. A :class:`ColorArray` is used as-is.
+        factors: A ``(K, 3)`` array with one set of component factors in each row.
+        space: ``"hsv"`` or ``"rgb"``, the components the factors scale, or ``"white"`` to scale
+            the distance of the RGB components from white. See :meth:`ColorArray.hsv_transform` and
+            :meth:`ColorArray.rgb_transform`.
+
+    Returns:
+        The ``N * K`` transformed colors, with the ``K`` variants of each color next to each other.
+
+    Raises:
+        ValueError: If ``space`` is unknown or ``factors`` does not have the shape ``(K, 3)``.
+    """
+    if space not in RAMP_SPACES:
+        raise ValueError(f"space must be one of {RAMP_SPACES}")
+
+    array = ColorArray.of(colors)
+    if space == "white":
+        # Scaling the complement of each component towards 0 moves the component towards 1.
+        return ColorArray(rgb=1 - scale_components_array(1 - array.rgb, factors).reshape(-1, 3))
+
+    return array.hsv_transform(factors) if space == "hsv" else array.rgb_transform(factors)
+
+
+def color_ramps(
+    colors: Sequence[Color], factors: ArrayLike, space: str = "hsv"
+) -> tuple[tuple[Color, ...], ...]:
+    """Creates a ramp of transformed colors for each color in a palette.
+
+    Args:
+        colors: The palette. A :class:`ColorArray` is used as-is.
+        factors: A ``(K, 3)`` array with one set of component factors in each row.
+        space: ``"hsv"``, ``"rgb"``, or ``"white"``. See :func:`transform_palette`
+
+    Returns:
+        One ramp of ``K`` colors for each color in ``colors``.
+
+    Raises:
+        ValueError: If ``space`` is unknown or ``factors`` does not have the shape ``(K, 3)``.
+    """
+    transformed = transform_palette(colors, factors, space).to_colors()
+    if not transformed:
+        return tuple(() for _ in colors)
+
+    steps = len(transformed) // len(colors)
+
+    return tuple(transformed[start:start + steps] for start in range(0, len(transformed), steps))
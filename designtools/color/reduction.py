@@ -0,0 +1,86 @@
+"""Provides palette reduction by merging colors that are perceptually close to each other.
+"""
+import math
+from collections.abc import Mapping, Sequence
+from itertools import product
+from typing import NamedTuple
+
+import numpy as np
+
+from ._color_array import COLOR_SPACES, ColorArray
+from ._models import Color
+
+_NEIGHBOR_OFFSETS = tuple(product((-1, 0, 1), repeat=3))
+"""The offsets from a grid cell to itself and each of the 26 cells around it."""
+
+
+class ReducedPalette(NamedTuple):
+    """The result of :func:`reduce_palette`."""
+    colors: tuple[Color, ...]
+    """The representative colors, in the order they were first seen."""
+    mapping: Mapping[Color, Color]
+    """Maps each original color to its representative. Representatives map to themselves."""
+
+
+def reduce_palette(
+    colors: Sequence[Color], threshold: float, space: str = "oklab"
+) -> ReducedPalette:
+    """Merges colors that are within a distance threshold of each other.
+
+    Colors are visited in order. A color closer than ``threshold`` to an existing representative is
+    merged into the nearest one, otherwise it becomes a new representative. Earlier colors therefore
+    take precedence, so order ``colors`` by importance when that matters.
+
+    Representatives are kept in a spatial hash with cells ``threshold`` wide. Every representative
+    that could be within the threshold of a color lies in the color's cell or one of the 26 cells
+    around it, and representatives are at least ``threshold`` apart so each cell only holds a few.
+    This makes the reduction run in roughly linear time.
+
+    Args:
+        colors: The colors to reduce.
+        threshold: The distance below which colors are merged, measured in ``space``. In the default
+            OKLab space, differences below ``0.02`` are hard to see.
+        space: The color space distances are measured in, one of :data:`COLOR_SPACES`. See
+            :meth:`ColorArray.coordinates`.
+
+    Returns:
+        The representative colors along with the mapping from every color to its representative.
+
+    Raises:
+        ValueError: If ``threshold`` is not positive or ``space`` is unknown.
+    """
+    if threshold <= 0:
+        raise ValueError("threshold must be > 0.")
+    if space not in COLOR_SPACES:
+        raise ValueError(f"space must be one of {COLOR_SPACES}")
+
+    array = ColorArray.of(colors)
+    points = array.coordinates(space).tolist()
+    cells = np.floor(array.coordinates(space) / threshold).astype(np.int64).tolist()
+
+    grid: dict[tuple[int, ...], list[int]] = {}
+    representatives: list[int] = []
+    mapping: dict[Color, Color] = {}
+
+    for index, (point, cell) in enumerate(zip(points, cells)):
+        color = colors[index]
+        if color in mapping:
+            continue
+
+        nearest = None
+        nearest_distance = threshold
+        for dx, dy, dz in _NEIGHBOR_OFFSETS:
+            for candidate in grid.get((cell[0] + dx, cell[1] + dy, cell[2] + dz), ()):
+                distance = math.dist(point, points[candidate])
+                if distance < nearest_distance:
+                    nearest = candidate
+                    nearest_distance = distance
+
+        if nearest is None:
+            grid.setdefault(tuple(cell), []).append(index)
+            representatives.append(index)
+            mapping[color] = color
+        else:
+            mapping[color] = mapping[colors[nearest]]
+
+    return ReducedPalette(tuple(colors[index] for index in representatives), mapping)
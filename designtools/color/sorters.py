@@ -1,5 +1,16 @@
-"""Provides sorting keys for Color instances."""
+"""Provides sorting keys for Color instances.
 
+The ``*_order`` functions are the array-level counterparts of the sorting keys. They compute the
+keys for a whole sequence of colors at once and return the permutation that sorts it, giving the
+same order as ``sorted()`` with the matching key.
+"""
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ._array_util import get_luminance_array
+from ._color_array import ColorArray
 from ._color_util import get_luminance
 from ._models import Color
 
@@ -41,3 +52,96 @@ def hlv_step_sort_key(color: Color, repetitions=8) -> tuple[int, float, int]:
     v2 = int(v * repetitions)
 
     return h2, lum, v2
+
+
+def _lexical_order(keys: Sequence[NDArray], reverse: bool) -> NDArray[np.intp]:
+    """Finds the stable sorting permutation for composite keys given from most to least significant.
+
+    Reversing negates the keys instead of flipping the result so that equal colors stay in their
+    original order, just like ``sorted(..., reverse=True)``.
+    """
+    if reverse:
+        keys = [-key for key in keys]
+
+    return np.lexsort(tuple(reversed(keys)))
+
+
+def saturation_order(colors: Sequence[Color], reverse: bool = False) -> NDArray[np.intp]:
+    """Finds the permutation that sorts colors the same way as :func:`saturation_key`.
+
+    Args:
+        colors: The colors to sort. A :class:`ColorArray` is used as-is.
+        reverse: Sorts in descending order when ``True``.
+
+    Returns:
+        The indexes of ``colors`` in sorted order.
+    """
+    return _lexical_order((ColorArray.of(colors).hsv[:, 1],), reverse)
+
+
+def value_order(colors: Sequence[Color], reverse: bool = False) -> NDArray[np.intp]:
+    """Finds the permutation that sorts colors the same way as :func:`value_key`.
+
+    Args:
+        colors: The colors to sort. A :class:`ColorArray` is used as-is.
+        reverse: Sorts in descending order when ``True``.
+
+    Returns:
+        The indexes of ``colors`` in sorted order.
+    """
+    return _lexical_order((ColorArray.of(colors).hsv[:, 2],), reverse)
+
+
+def luminance_sort_order(colors: Sequence[Color], reverse: bool = False) -> NDArray[np.intp]:
+    """Finds the permutation that sorts colors the same way as :func:`luminance_sort_key`.
+
+    Args:
+        colors: The colors to sort. A :class:`ColorArray` is used as-is.
+        reverse: Sorts in descending order when ``True``.
+
+    Returns:
+        The indexes of ``colors`` in sorted order.
+    """
+    array = ColorArray.of(colors)
+    hsv = array.hsv
+
+    return _lexical_order((get_luminance_array(array.rgb), hsv[:, 1], hsv[:, 2]), reverse)
+
+
+def hlv_step_sort_order(
+    colors: Sequence[Color], repetitions: int = 8, reverse: bool = False
+) -> NDArray[np.intp]:
+    """Finds the permutation that sorts colors the same way as :func:`hlv_step_sort_key`.
+
+    Args:
+        colors: The colors to sort. A :class:`ColorArray` is used as-is.
+        repetitions: A smoothing factor for the algorithm.
+        reverse: Sorts in descending order when ``True``.
+
+    Returns:
+        The indexes of ``colors`` in sorted order.
+
+    .. [Ref] https://www.alanzucconi.com/2015/09/30/colour-sorting/
+    """
+    array = ColorArray.of(colors)
+    hsv = array.hsv
+    h2 = (hsv[:, 0] * repetitions).astype(np.int64)
+    v2 = (hsv[:, 2] * repetitions).astype(np.int64)
+
+    return _lexical_order((h2, get_luminance_array(array.rgb), v2), reverse)
+
+
+def apply_order(colors: Sequence[Color], order: NDArray[np.intp]) -> Sequence[Color]:
+    """Rearranges colors according to a permutation from one of the ``*_order`` functions.
+
+    Args:
+        colors: The colors to rearrange.
+        order: The indexes of ``colors`` in their new order.
+
+    Returns:
+        A new ``ColorArray`` if ``colors`` is one, otherwise a tuple of the colors.
+    """
+    if isinstance(colors, ColorArray):
+        return colors[order]
+
+    return tuple(colors[index] for index in order.tolist())
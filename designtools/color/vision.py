@@ -0,0 +1,115 @@
+"""Simulates how palettes appear to viewers with color vision deficiencies (CVD).
+
+The simulation uses the matrices of `Machado, Oliveira, and Fernandes (2009)`_, which are applied to
+linear RGB components. Each matrix maps a color to its appearance under a complete (dichromatic)
+deficiency. Partial (anomalous trichromatic) deficiencies are approximated by interpolating between
+the identity matrix and the full matrix, so a whole palette is still a single matrix multiply.
+
+.. _Machado, Oliveira, and Fernandes (2009):
+   https://www.inf.ufrgs.br/~oliveira/pubs_files/CVD_Simulation/CVD_Simulation.html
+"""
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ._array_util import as_component_array, delinearize_array, linearize_array
+from ._color_array import ColorArray
+from ._models import Color
+
+CVD_MATRICES: dict[str, tuple[tuple[float, float, float], ...]] = {
+    "protanopia": (
+        (0.152286, 1.052583, -0.204868),
+        (0.114503, 0.786281, 0.099216),
+        (-0.003882, -0.048116, 1.051998),
+    ),
+    "deuteranopia": (
+        (0.367322, 0.860646, -0.227968),
+        (0.280085, 0.672501, 0.047413),
+        (-0.011820, 0.042940, 0.968881),
+    ),
+    "tritanopia": (
+        (1.255528, -0.076749, -0.178779),
+        (-0.078411, 0.930809, 0.147602),
+        (0.004733, 0.691367, 0.303900),
+    ),
+}
+"""The linear RGB simulation matrix for a complete loss of each type of cone."""
+
+CVD_TYPES = tuple(CVD_MATRICES.keys())
+"""The names of the deficiencies that can be simulated."""
+
+
+def cvd_matrix(deficiency: str, severity: float = 1.0) -> NDArray[np.float64]:
+    """Creates the linear RGB simulation matrix for a deficiency.
+
+    Args:
+        deficiency: One of the :data:`CVD_TYPES`.
+        severity: How severe the deficiency is, from ``0`` (normal vision) to ``1`` (complete loss
+            of the affected cone type).
+
+    Returns:
+        A ``(3, 3)`` matrix that transforms linear RGB column vectors.
+
+    Raises:
+        ValueError: If ``deficiency`` is unknown or ``severity`` is outside the range [0, 1].
+    """
+    if deficiency not in CVD_MATRICES:
+        raise ValueError(f"deficiency must be one of {CVD_TYPES}")
+    if not 0 <= severity <= 1:
+        raise ValueError("severity must be >= 0 and <= 1.")
+
+    matrix = np.array(CVD_MATRICES[deficiency])
+    # The published values are rounded to 6 places. Normalizing the rows restores the property that
+    # neutral colors are left unchanged.
+    matrix /= matrix.sum(axis=1, keepdims=True)
+
+    return (1 - severity) * np.identity(3) + severity * matrix
+
+
+def simulate_cvd_array(
+    rgb: NDArray[np.float64], deficiency: str, severity: float = 1.0
+) -> NDArray[np.float64]:
+    """Simulates a deficiency for an array of RGB colors.
+
+    Simulated components that fall outside the sRGB gamut are clipped to [0, 1].
+
+    Args:
+        rgb: An ``(N, 3)`` array of gamma-encoded RGB components.
+        deficiency: One of the :data:`CVD_TYPES`.
+        severity: How severe the deficiency is, from ``0`` to ``1``.
+
+    Returns:
+        An ``(N, 3)`` array of the simulated gamma-encoded RGB components.
+
+    Raises:
+        ValueError: If ``deficiency`` is unknown or ``severity`` is outside the range [0, 1].
+    """
+    matrix = cvd_matrix(deficiency, severity)
+    simulated = linearize_array(as_component_array(rgb)) @ matrix.T
+    np.clip(simulated, 0, 1.0, out=simulated)
+
+    simulated = delinearize_array(simulated)
+
+    # Snap components that only missed an 8-bit value by the floating point error of the round trip.
+    # Otherwise a component like 1.0 comes back as 0.9999999999999999 and is truncated to 0xfe.
+    levels = np.rint(simulated * 255) / 255
+
+    return np.where(np.abs(simulated - levels) < 1e-9, levels, simulated)
+
+
+def simulate_cvd(colors: Sequence[Color], deficiency: str, severity: float = 1.0) -> ColorArray:
+    """Simulates how a palette appears to a viewer with a color vision deficiency.
+
+    Args:
+        colors: The palette. A :class:`ColorArray` is used as-is.
+        deficiency: One of the :data:`CVD_TYPES`.
+        severity: How severe the deficiency is, from ``0`` to ``1``.
+
+    Returns:
+        The simulated colors in the same order as ``colors``.
+
+    Raises:
+        ValueError: If ``deficiency`` is unknown or ``severity`` is outside the range [0, 1].
+    """
+    return ColorArray(rgb=simulate_cvd_array(ColorArray.of(colors).rgb, deficiency, severity))
@@ -1,26 +1,47 @@
 """Extracts color codes from text files (CSS, JSON, etc.) and creates an SVG file with swatches of those
 colors.
 
+The input may be a single file, a directory tree, or a glob pattern. Multiple files are scanned in
+parallel by a pool of worker processes. With ``--cache``, the colors found in each file are cached,
+so later runs only scan the files that have changed.
+
+Compressed files (gzip, bzip2, xz), tar and zip archives, and standard input (``-``) are
+decompressed and scanned as a stream, without unpacking them to disk.
+
 Notes
 -----
 - Duplicate values are ignored
-- Only hexadecimal color codes are supported
+- Near-duplicate values can optionally be merged with ``--merge``
+- Swatches can be rendered as they appear with a color vision deficiency with ``--simulate``
+- PNG images are reduced to a palette of their most representative colors
+- Only hexadecimal color codes are found in text by default. ``--syntax css`` also finds ``rgb()``,
+  ``hsl()``, and named colors
+- Swatches can be sized by how often each color occurs with ``--frequency``, ``--top``, or
+  ``--min-count``
 - Transparency values are ignored.
 """
-from argparse import ArgumentParser
+from argparse import ArgumentParser, ArgumentTypeError
 from collections.abc import Mapping, Sequence
+from itertools import takewhile
 from pathlib import Path
 from textwrap import dedent
 from typing import NamedTuple
 
 import cairo
 
-from designtools.color import Color, group_colors
+from designtools.color import Color, ColorCount, group_color_counts, group_colors, packed_color
 from designtools.color.collectors import GRAYS, HUES_BASIC, SPLIT_GRAYS
-from designtools.color.sorters import luminance_sort_key
-from designtools.graphics.extractors import colors_from_text
+from designtools.color.reduction import reduce_palette
+from designtools.color.sorters import apply_order, luminance_sort_order
+from designtools.color.vision import CVD_TYPES
+from designtools.graphics.extractors import (CSS_SCANNER, DEFAULT_PALETTE_SIZE,
+                                             DEFAULT_SKETCH_CAPACITY, HEX_SCANNER, SOURCE_PATTERNS,
+                                             STDIN, ColorScanner, ExtractionCache, SpaceSaving,
+                                             default_cache_file, find_files, image_palette,
+                                             is_stream_source, scan_files, scan_source,
+                                             tally_files, tally_source, )
 from designtools.graphics.swatches import (BallGrid, CircleGrid, ColorStack, GradientBar,
-                                           SquareGrid, SwatchRenderer, )
+                                           SimulatedRenderer, SquareGrid, SwatchRenderer, )
 
 OUTFILE = "{0}.{1}"
 """Template for the output filename when no output file is specified."""
@@ -32,6 +53,15 @@ class SwatchConfig(NamedTuple):
     desc: str
 
 
+class FrequencyConfig(NamedTuple):
+    capacity: int | None
+    """The number of colors the counting sketch tracks, or ``None`` to count every color exactly."""
+    top: int | None
+    """The number of most common colors to keep, or ``None`` to keep them all."""
+    min_count: int
+    """The smallest count of a color that is kept."""
+
+
 STYLES: Mapping[str, SwatchConfig] = {
     "ball-grid": SwatchConfig(
         collectors=GRAYS | HUES_BASIC,
@@ -62,10 +92,33 @@ STYLES: Mapping[str, SwatchConfig] = {
 
 DEFAULT_STYLE = "square-grid"
 
+SCANNERS: Mapping[str, ColorScanner] = {
+    "hex": HEX_SCANNER,
+    "css": CSS_SCANNER,
+}
+
+DEFAULT_SYNTAX = "hex"
+
 STYLE_CHOICES = tuple(STYLES.keys())
 
 MSG_STATUS = "\nExtracted {0} colors from {1}.\nWriting swatches to {2}."
 
+MSG_FILES = "\nScanning {0} files from {1}."
+
+MSG_CACHE_STATS = dedent(
+    """
+    Cache {0}:
+      this run: {1} hits, {2} misses ({3:.0%} hit rate)
+      lifetime: {4} hits, {5} misses ({6:.0%} hit rate)
+      {7} files cached"""
+)
+
+MSG_CACHE_CLEARED = "\nCleared cache {0}."
+
+MSG_MERGED = "\nMerged {0} colors into {1} within an OKLab distance of {2}."
+
+MSG_COUNTED = "\nCounted {0} occurrences of {1} colors, keeping {2}."
+
 MSG_FILE_EXISTS = "\nERROR: Specified output file '{0}' already exists."
 
 HELP = {
@@ -74,20 +127,89 @@ HELP = {
         those colors."""),
     "in_file": dedent(
         """The text file to extract color codes from. This may be any text file that contains
-        hexadecimal color codes."""
+        hexadecimal color codes. It may also be a directory, which is searched recursively for
+        source files, or a quoted glob pattern such as 'src/**/*.css'. A PNG image is reduced to a
+        palette of its most representative colors. gzip, bzip2, and xz files and tar and zip
+        archives are decompressed as they are read, and '-' reads from standard input."""
     ),
     "out_file": dedent(
         f"""Optional. The name of the SVG file to create. If the argument is not given, the script
         will create a file with the same base name as the input file and append the extension
         '.<style>.svg' where <style> is replaced with the swatch style ('{DEFAULT_STYLE}' by
-        default)."""
+        default). For glob patterns, the base name is the directory before the first wildcard, and
+        for standard input it is 'stdin'."""
     ),
     "style": dedent(
         f"""Optional. The style of swatches to render. Defaults to '{DEFAULT_STYLE}'."""
+    ),
+    "merge": dedent(
+        """Optional. Merges colors that are closer than this OKLab distance into a single swatch.
+        Differences below 0.02 are hard to see."""
+    ),
+    "simulate": dedent(
+        """Optional. Renders the swatches as they appear to a viewer with the given color vision
+        deficiency. The deficiency is added to the default output file name."""
+    ),
+    "severity": dedent(
+        """Optional. The severity of the simulated deficiency, from 0 (normal vision) to 1 (complete
+        loss of the affected cone type). Defaults to 1."""
+    ),
+    "syntax": dedent(
+        f"""Optional. The color syntax to search for. 'hex' finds hexadecimal color codes, and 'css'
+        also finds rgb(), rgba(), hsl(), hsla(), and named colors. Defaults to
+        '{DEFAULT_SYNTAX}'."""
+    ),
+    "palette_size": dedent(
+        f"""Optional. The largest number of colors extracted from a PNG image. Defaults to
+        {DEFAULT_PALETTE_SIZE}."""
+    ),
+    "frequency": dedent(
+        """Optional. Counts how often each color occurs. Grid swatches are sized, and gradient stops
+        spaced, by frequency."""
+    ),
+    "top": dedent(
+        """Optional. Only renders the N most common colors. Implies --frequency."""
+    ),
+    "min_count": dedent(
+        """Optional. Only renders colors that occur at least N times. Implies --frequency."""
+    ),
+    "sketch_size": dedent(
+        f"""Optional. The number of distinct colors tracked while counting, which bounds the memory
+        used. Counts of colors beyond the most common are estimates. 0 counts every color exactly.
+        Defaults to {DEFAULT_SKETCH_CAPACITY}."""
+    ),
+    "workers": dedent(
+        """Optional. The number of processes that scan files in parallel. Defaults to the number of
+        CPUs."""
+    ),
+    "pattern": dedent(
+        f"""Optional. A file name pattern to search directories and archives for. May be given more
+        than once. Defaults to {', '.join(SOURCE_PATTERNS)}."""
+    ),
+    "cache": dedent(
+        """Optional. Caches the colors extracted from each file, so that later runs only scan the
+        files that have changed."""
+    ),
+    "cache_file": dedent(
+        """Optional. The cache of colors previously extracted from each file. Implies --cache.
+        Defaults to designtools/extraction.db in $XDG_CACHE_HOME or ~/.cache."""
+    ),
+    "cache_stats": dedent(
+        """Optional. Prints the cache hit rates of this run and of the cache's lifetime."""
+    ),
+    "clear_cache": dedent(
+        """Optional. Empties the cache before extracting, so that every file is scanned again."""
     )
 }
 
 
+def _positive_int(value: str) -> int:
+    if not value.strip().isdigit() or int(value) < 1:
+        raise ArgumentTypeError(f"must be a positive integer, not '{value}'")
+
+    return int(value)
+
+
 def _get_args():
     parser = ArgumentParser(prog="extract_swatches", description=HELP["desc"])
 
@@ -95,8 +217,40 @@ def _get_args():
     parser.add_argument("swatch_file", action="store", nargs="?", help=HELP["out_file"])
     parser.add_argument("--style", action="store", type=str, default=DEFAULT_STYLE,
                         help=HELP["style"], choices=STYLE_CHOICES)
-
-    return parser.parse_args()
+    parser.add_argument("--merge", action="store", type=float, default=None, metavar="DISTANCE",
+                        help=HELP["merge"])
+    parser.add_argument("--simulate", action="store", type=str, default=None, metavar="DEFICIENCY",
+                        help=HELP["simulate"], choices=CVD_TYPES)
+    parser.add_argument("--severity", action="store", type=float, default=1.0,
+                        help=HELP["severity"])
+    parser.add_argument("--syntax", action="store", type=str, default=DEFAULT_SYNTAX,
+                        help=HELP["syntax"], choices=tuple(SCANNERS.keys()))
+    parser.add_argument("--palette-size", action="store", type=int, default=DEFAULT_PALETTE_SIZE,
+                        metavar="SIZE", help=HELP["palette_size"])
+    parser.add_argument("--frequency", action="store_true", help=HELP["frequency"])
+    parser.add_argument("--top", action="store", type=_positive_int, default=None, metavar="N",
+                        help=HELP["top"])
+    parser.add_argument("--min-count", action="store", type=_positive_int, default=1, metavar="N",
+                        help=HELP["min_count"])
+    parser.add_argument("--sketch-size", action="store", type=int,
+                        default=DEFAULT_SKETCH_CAPACITY, metavar="SIZE", help=HELP["sketch_size"])
+    parser.add_argument("--workers", action="store", type=int, default=None,
+                        help=HELP["workers"])
+    parser.add_argument("--pattern", action="append", type=str, default=None, dest="patterns",
+                        metavar="PATTERN", help=HELP["pattern"])
+    parser.add_argument("--cache", action="store_true", help=HELP["cache"])
+    parser.add_argument("--cache-file", action="store", type=str, default=None, metavar="PATH",
+                        help=HELP["cache_file"])
+    parser.add_argument("--cache-stats", action="store_true", help=HELP["cache_stats"])
+    parser.add_argument("--clear-cache", action="store_true", help=HELP["clear_cache"])
+
+    args = parser.parse_args()
+    args.cache = args.cache or args.cache_file is not None
+    for option, given in (("--cache-stats", args.cache_stats), ("--clear-cache", args.clear_cache)):
+        if given and not args.cache:
+            parser.error(f"{option} requires --cache or --cache-file.")
+
+    return args
 
 
 def _prep_colors(colors: Sequence[Color],
@@ -105,29 +259,127 @@ def _prep_colors(colors: Sequence[Color],
 
     # Sort each group and filter out any empty groups
     return [
-        sorted(groups[key], key=luminance_sort_key, reverse=True)
+        apply_order(groups[key], luminance_sort_order(groups[key], reverse=True))
         for key in sorted(groups.keys())
         if len(groups[key]) > 0
     ]
 
 
-def _render_swatches(colors: Sequence[Color], collectors: Mapping[str, Sequence[Color]],
-                     renderer: SwatchRenderer) -> cairo.RecordingSurface:
-    color_groups = _prep_colors(colors, collectors)
+def _prep_color_counts(
+    color_counts: Sequence[ColorCount], collectors: Mapping[str, Sequence[Color]]
+) -> tuple[Sequence[Sequence[Color]], Sequence[Sequence[int]]]:
+    groups = group_color_counts(color_counts, collectors)
+    color_groups = []
+    count_groups = []
+
+    # Sort each group, keeping the counts lined up with their colors, and drop any empty groups
+    for key in sorted(groups.keys()):
+        if len(groups[key]) > 0:
+            colors = tuple(entry.color for entry in groups[key])
+            order = luminance_sort_order(colors, reverse=True)
+            color_groups.append(apply_order(colors, order))
+            count_groups.append(tuple(groups[key][index].count for index in order.tolist()))
+
+    return color_groups, count_groups
+
 
-    size = cairo.Rectangle(0, 0, *renderer.compute_size(color_groups))
+def _render_swatches(color_groups: Sequence[Sequence[Color]], renderer: SwatchRenderer,
+                     counts: Sequence[Sequence[int]] | None = None) -> cairo.RecordingSurface:
+    size = cairo.Rectangle(0, 0, *renderer.compute_size(color_groups, counts))
     surface = cairo.RecordingSurface(cairo.CONTENT_COLOR_ALPHA, size)
     ctx = cairo.Context(surface)
 
-    renderer.render(color_groups, ctx)
+    renderer.render(color_groups, ctx, counts)
 
     return surface
 
 
-def _extract_swatches(in_file: str, out_file: str, style: SwatchConfig):
-    colors = colors_from_text(in_file)
+def _rate(hits: int, misses: int) -> float:
+    return hits / (hits + misses) if hits + misses > 0 else 0.0
+
+
+def _extract_colors(source: str, patterns: Sequence[str], workers: int | None,
+                    cache: ExtractionCache | None,
+                    scanner: ColorScanner = HEX_SCANNER,
+                    palette_size: int = DEFAULT_PALETTE_SIZE) -> Sequence[Color]:
+    if Path(source).suffix.lower() == ".png" and Path(source).is_file():
+        return tuple(entry.color for entry in image_palette(source, palette_size))
+
+    if is_stream_source(source):
+        packed = scan_source(source, scanner, patterns)
+        return tuple(packed_color(value) for value in packed.tolist())
+
+    files = find_files([source], patterns)
+    if len(files) > 1:
+        print(MSG_FILES.format(len(files), source))
+
+    packed = scan_files(files, scanner, workers, cache=cache)
+
+    return tuple(packed_color(value) for value in packed.tolist())
+
+
+def _count_colors(source: str, patterns: Sequence[str], workers: int | None,
+                  scanner: ColorScanner, palette_size: int,
+                  frequency: FrequencyConfig) -> Sequence[ColorCount]:
+    if Path(source).suffix.lower() == ".png" and Path(source).is_file():
+        counted = image_palette(source, palette_size)
+    elif is_stream_source(source):
+        sketch = tally_source(source, scanner, patterns, sketch=SpaceSaving(frequency.capacity))
+        counted = tuple(ColorCount(packed_color(value), count) for value, count in sketch.top())
+    else:
+        files = find_files([source], patterns)
+        if len(files) > 1:
+            print(MSG_FILES.format(len(files), source))
+
+        sketch = tally_files(files, scanner, workers, capacity=frequency.capacity)
+        counted = tuple(ColorCount(packed_color(value), count) for value, count in sketch.top())
+
+    kept = [entry for entry in counted if entry.count >= frequency.min_count][:frequency.top]
+    print(MSG_COUNTED.format(sum(entry.count for entry in counted), len(counted), len(kept)))
+
+    return kept
 
-    rs = _render_swatches(colors, style.collectors, style.renderer)
+
+def _merge_color_counts(color_counts: Sequence[ColorCount], merge: float) -> Sequence[ColorCount]:
+    # The most common colors come first, so they are chosen as the representatives.
+    ordered = sorted(color_counts, key=lambda entry: (-entry.count, entry.color))
+    reduced = reduce_palette([entry.color for entry in ordered], merge)
+    totals = dict.fromkeys(reduced.colors, 0)
+    for color, count in ordered:
+        totals[reduced.mapping[color]] += count
+
+    return tuple(ColorCount(color, count) for color, count in totals.items())
+
+
+def _extract_swatches(in_file: str, out_file: str, style: SwatchConfig,
+                      merge: float | None = None, workers: int | None = None,
+                      patterns: Sequence[str] = SOURCE_PATTERNS,
+                      cache: ExtractionCache | None = None,
+                      scanner: ColorScanner = HEX_SCANNER,
+                      palette_size: int = DEFAULT_PALETTE_SIZE,
+                      frequency: FrequencyConfig | None = None):
+    if frequency is None:
+        colors = _extract_colors(in_file, patterns, workers, cache, scanner, palette_size)
+
+        if merge is not None:
+            # Sorting first makes the choice of representative colors repeatable.
+            reduced = reduce_palette(sorted(colors), merge)
+            print(MSG_MERGED.format(len(colors), len(reduced.colors), merge))
+            colors = reduced.colors
+
+        color_groups, counts = _prep_colors(colors, style.collectors), None
+    else:
+        color_counts = _count_colors(in_file, patterns, workers, scanner, palette_size, frequency)
+
+        if merge is not None:
+            merged = _merge_color_counts(color_counts, merge)
+            print(MSG_MERGED.format(len(color_counts), len(merged), merge))
+            color_counts = merged
+
+        color_groups, counts = _prep_color_counts(color_counts, style.collectors)
+        colors = color_counts
+
+    rs = _render_swatches(color_groups, style.renderer, counts)
     _, _, width, height = rs.get_extents()
 
     svg = cairo.SVGSurface(out_file.format(".svg"), width, height)
@@ -142,18 +394,62 @@ def _extract_swatches(in_file: str, out_file: str, style: SwatchConfig):
     print(MSG_STATUS.format(len(colors), in_file, out_file))
 
 
+def _output_base(source: str) -> Path:
+    """Finds the path output file names are based on, the part of a glob pattern before the first
+    wildcard, or 'stdin' in the working directory."""
+    if source == STDIN:
+        return Path.cwd() / "stdin"
+
+    fixed = tuple(takewhile(lambda part: not any(c in part for c in "*?["), Path(source).parts))
+
+    return Path(*fixed).absolute() if fixed else Path.cwd()
+
+
 def main():
     args = _get_args()
     style = STYLES[args.style]
-    text_file = Path(args.text_file).absolute()
+    style_name = args.style
+
+    if args.simulate is not None:
+        style = style._replace(
+            renderer=SimulatedRenderer(style.renderer, args.simulate, args.severity)
+        )
+        style_name = f"{args.style}.{args.simulate}"
+
+    text_file = args.text_file if args.text_file == STDIN else Path(args.text_file).absolute()
+    base = _output_base(args.text_file)
     swatch_file = (
                       args.swatch_file
                       if args.swatch_file
-                      else str(text_file.with_name(
-                          OUTFILE.format(text_file.stem, args.style)).absolute())
+                      else str(base.with_name(
+                          OUTFILE.format(base.stem, style_name)).absolute())
                   ) + "{0}"
 
-    _extract_swatches(str(text_file), swatch_file, style)
+    frequency = None
+    if args.frequency or args.top is not None or args.min_count > 1:
+        frequency = FrequencyConfig(args.sketch_size or None, args.top, args.min_count)
+
+    cache_file = args.cache_file or default_cache_file()
+    cache = ExtractionCache(cache_file) if args.cache else None
+    try:
+        if cache is not None and args.clear_cache:
+            cache.clear()
+            print(MSG_CACHE_CLEARED.format(cache_file))
+
+        _extract_swatches(str(text_file), swatch_file, style, args.merge, args.workers,
+                          args.patterns or SOURCE_PATTERNS, cache, SCANNERS[args.syntax],
+                          args.palette_size, frequency)
+
+        if cache is not None and args.cache_stats:
+            info = cache.info()
+            print(MSG_CACHE_STATS.format(
+                cache_file, info.hits, info.misses, _rate(info.hits, info.misses),
+                info.total_hits, info.total_misses, _rate(info.total_hits, info.total_misses),
+                info.entries
+            ))
+    finally:
+        if cache is not None:
+            cache.close()
 
 
 if __name__ == "__main__":
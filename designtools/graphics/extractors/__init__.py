@@ -1,2 +1,17 @@
+from ._color_counts import (DEFAULT_SKETCH_CAPACITY, SpaceSaving, color_counts_from_files,
+                            tally_file, tally_files, )
+from ._color_files import SOURCE_PATTERNS, colors_from_files, find_files, scan_files
+from ._color_scan import (DEFAULT_BLOCK_SIZE, DEFAULT_CHUNK_SIZE, HEX_COLOR_BYTES, HEX_SCANNER,
+                          NOT_A_COLOR, ColorScanner, colors_from_mapped_text, scan_file, )
+from ._color_streams import (ARCHIVE_SUFFIXES, COMPRESSED_SUFFIXES, STDIN, STREAM_SUFFIXES,
+                             colors_from_stream, is_stream_source, open_streams, scan_source,
+                             tally_source, )
 from ._color_text import colors_from_text
-from ._types import ColorExtractor
+from ._css_colors import (CSS_COLOR_BYTES, CSS_MAX_LENGTH, CSS_NAMED_COLORS, CSS_SCANNER,
+                          css_colors_from_text, parse_css_color, )
+from ._extraction_cache import (ExtractionCache, ExtractionCacheInfo, FileState, ScannedFile,
+                                default_cache_file, scan_for_cache, )
+from ._image_colors import (DEFAULT_HISTOGRAM_BITS, DEFAULT_PALETTE_SIZE, ColorHistogram,
+                            color_histogram, colors_from_image, image_palette, median_cut, )
+from ._png import DEFAULT_STRIP_ROWS, PNG_SIGNATURE, PngHeader, read_png_strips
+from ._types import ColorCount, ColorExtractor
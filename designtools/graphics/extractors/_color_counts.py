@@ -0,0 +1,306 @@
+import heapq
+import mmap
+import os
+from collections.abc import Iterable, Sequence
+from functools import partial
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from designtools.color import ColorCount, packed_color
+from ._color_files import SOURCE_PATTERNS, _map_batches, find_files
+from ._color_scan import DEFAULT_CHUNK_SIZE, HEX_SCANNER, ColorScanner
+
+DEFAULT_SKETCH_CAPACITY = 4096
+"""The number of colors a :class:`SpaceSaving` sketch tracks by default."""
+
+_TALLY_BATCHES = 64
+"""The number of batches :func:`tally_files` deals files into, whatever the number of workers."""
+
+_HEAP_SLACK = 4
+"""The multiple of the capacity the heap may grow to with stale entries before it's rebuilt."""
+
+
+class SpaceSaving:
+    """Counts a stream's most frequent values in bounded memory with the Space-Saving algorithm.
+
+    At most ``capacity`` values are tracked. When a new value arrives and the sketch is full, the
+    value with the smallest count is replaced, and the new value inherits that count as its possible
+    error. Every count is therefore an overestimate by at most :meth:`error`, which is never more
+    than ``total / capacity``, and every value that occurs more than ``total / capacity`` times is
+    tracked.
+
+    Without a capacity, every value is tracked and counted exactly.
+
+    Args:
+        capacity: The largest number of values to track, or ``None`` for no limit.
+
+    Raises:
+        ValueError: If ``capacity`` is not positive.
+    """
+
+    __slots__ = ("_capacity", "_counts", "_errors", "_heap", "_total")
+
+    def __init__(self, capacity: int | None = DEFAULT_SKETCH_CAPACITY):
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be >= 1.")
+
+        self._capacity = capacity
+        self._counts: dict[int, int] = {}
+        self._errors: dict[int, int] = {}
+        # A min-heap of (count, value) entries. Entries whose count is out of date are skipped.
+        self._heap: list[tuple[int, int]] = []
+        self._total = 0
+
+    @property
+    def capacity(self) -> int | None:
+        return self._capacity
+
+    @property
+    def total(self) -> int:
+        """The sum of every count added to the sketch."""
+        return self._total
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, value: int) -> bool:
+        return value in self._counts
+
+    def count(self, value: int) -> int:
+        """The estimated count of a value, or ``0`` if it isn't tracked."""
+        return self._counts.get(value, 0)
+
+    def error(self, value: int) -> int:
+        """The most a value's estimated count may exceed its true count."""
+        return self._errors.get(value, 0)
+
+    def _pop_minimum(self) -> tuple[int, int]:
+        while True:
+            count, value = heapq.heappop(self._heap)
+            if self._counts.get(value) == count:
+                return count, value
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [(count, value) for value, count in self._counts.items()]
+        heapq.heapify(self._heap)
+
+    def update(self, values: ArrayLike, counts: ArrayLike | None = None) -> None:
+        """Adds occurrences of values to the sketch.
+
+        Repeated values are added together first, so a batch costs one update per distinct value.
+
+        Args:
+            values: The values, like packed 24-bit colors.
+            counts: The number of occurrences of each value. Defaults to one each.
+        """
+        values = np.asarray(values, dtype=np.int64).ravel()
+        if len(values) == 0:
+            return
+
+        weights = None if counts is None else np.asarray(counts, dtype=np.int64).ravel()
+        distinct, inverse = np.unique(values, return_inverse=True)
+        totals = np.bincount(inverse, weights=weights).astype(np.int64)
+        self._total += int(totals.sum())
+
+        tracked = self._counts
+        if self._capacity is None:
+            for value, count in zip(distinct.tolist(), totals.tolist()):
+                tracked[value] = tracked.get(value, 0) + count
+            return
+
+        errors = self._errors
+        heap = self._heap
+        for value, count in zip(distinct.tolist(), totals.tolist()):
+            if value in tracked:
+                count += tracked[value]
+            elif len(tracked) >= self._capacity:
+                minimum, evicted = self._pop_minimum()
+                del tracked[evicted]
+                del errors[evicted]
+                count += minimum
+                errors[value] = minimum
+            else:
+                errors[value] = 0
+
+            tracked[value] = count
+            heapq.heappush(heap, (count, value))
+
+        if len(heap) > _HEAP_SLACK * self._capacity:
+            self._rebuild_heap()
+
+    def merge(self, other: "SpaceSaving") -> None:
+        """Adds the counts of another sketch to this one, as if its stream had been added here.
+
+        A value that a full sketch isn't tracking may have occurred up to that sketch's smallest
+        count times, so it's counted that many times, keeping every count an overestimate.
+
+        Args:
+            other: The sketch to add.
+        """
+        def floor(sketch: "SpaceSaving") -> int:
+            full = sketch._capacity is not None and len(sketch._counts) >= sketch._capacity
+            return min(sketch._counts.values()) if full else 0
+
+        own_floor = floor(self)
+        other_floor = floor(other)
+        counts: dict[int, int] = {}
+        errors: dict[int, int] = {}
+        for value in self._counts.keys() | other._counts.keys():
+            if value in self._counts:
+                own, own_error = self._counts[value], self._errors.get(value, 0)
+            else:
+                own = own_error = own_floor
+            if value in other._counts:
+                theirs, their_error = other._counts[value], other._errors.get(value, 0)
+            else:
+                theirs = their_error = other_floor
+            counts[value] = own + theirs
+            errors[value] = own_error + their_error
+
+        if self._capacity is not None and len(counts) > self._capacity:
+            kept = sorted(counts, key=lambda value: (-counts[value], value))[:self._capacity]
+            counts = {value: counts[value] for value in kept}
+            errors = {value: errors[value] for value in kept}
+
+        self._counts = counts
+        self._errors = errors
+        self._total += other._total
+        self._rebuild_heap()
+
+    def top(self, n: int | None = None, min_count: int = 1) -> list[tuple[int, int]]:
+        """Finds the most frequent values.
+
+        Args:
+            n: The largest number of values to return, or ``None`` for every value that is tracked.
+            min_count: The smallest estimated count of a value that is returned.
+
+        Returns:
+            ``(value, count)`` pairs from the most to the least frequent, with ties in ascending
+            order of value.
+        """
+        ranked = sorted(
+            ((value, count) for value, count in self._counts.items() if count >= min_count),
+            key=lambda entry: (-entry[1], entry[0]),
+        )
+
+        return ranked if n is None else ranked[:n]
+
+
+def tally_file(
+    filename: str,
+    scanner: ColorScanner = HEX_SCANNER,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    sketch: SpaceSaving | None = None,
+) -> SpaceSaving:
+    """Memory-maps a file and counts the colors in it. See :meth:`ColorScanner.tally`
+
+    Args:
+        filename: The file to scan.
+        scanner: The scanner that finds colors.
+        chunk_size: The number of bytes to search at a time.
+        sketch: The sketch to add the counts to. Defaults to a new sketch with the default capacity.
+
+    Returns:
+        The sketch.
+    """
+    sketch = sketch if sketch is not None else SpaceSaving()
+
+    with open(filename, "rb") as file:
+        # Empty files can't be mapped.
+        if file.seek(0, 2) == 0:
+            return sketch
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            for values, counts in scanner.tally(buffer, chunk_size):
+                sketch.update(values, counts)
+
+    return sketch
+
+
+def _tally_batch(
+    filenames: Sequence[str], scanner: ColorScanner, chunk_size: int, capacity: int | None
+) -> SpaceSaving:
+    sketch = SpaceSaving(capacity)
+    for filename in filenames:
+        tally_file(filename, scanner, chunk_size, sketch)
+
+    return sketch
+
+
+def tally_files(
+    filenames: Sequence[str],
+    scanner: ColorScanner = HEX_SCANNER,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    capacity: int | None = DEFAULT_SKETCH_CAPACITY,
+) -> SpaceSaving:
+    """Counts the colors in many files, spreading the files across a pool of processes.
+
+    Each batch of files is counted in its own sketch, and the sketches are merged in order. See
+    :func:`scan_files` and :meth:`SpaceSaving.merge`
+
+    With a capacity, the estimated counts depend on how the files are split into batches, so they're
+    always dealt into the same batches, and the result is the same for any number of workers.
+
+    Args:
+        filenames: The files to scan.
+        scanner: The scanner that finds colors.
+        workers: The number of processes to use. Defaults to the number of CPUs.
+        chunk_size: The number of bytes to search at a time.
+        capacity: The largest number of colors to track, or ``None`` to count every color exactly.
+
+    Returns:
+        The merged sketch.
+
+    Raises:
+        ValueError: If ``workers`` or ``capacity`` is not positive.
+    """
+    workers = workers if workers is not None else os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be >= 1.")
+
+    sketch = SpaceSaving(capacity)
+    if len(filenames) == 0:
+        return sketch
+
+    _, sketches = _map_batches(
+        partial(_tally_batch, capacity=capacity), filenames, scanner, workers, chunk_size,
+        _TALLY_BATCHES,
+    )
+    for other in sketches:
+        sketch.merge(other)
+
+    return sketch
+
+
+def color_counts_from_files(
+    sources: Iterable[str],
+    patterns: Sequence[str] = SOURCE_PATTERNS,
+    workers: int | None = None,
+    scanner: ColorScanner = HEX_SCANNER,
+    capacity: int | None = DEFAULT_SKETCH_CAPACITY,
+    top: int | None = None,
+    min_count: int = 1,
+) -> tuple[ColorCount, ...]:
+    """Counts how often each color occurs in files, directory trees, and glob patterns.
+
+    See :func:`find_files` and :func:`tally_files`
+
+    Args:
+        sources: The files, directories, and glob patterns.
+        patterns: The file name patterns to search directories for.
+        workers: The number of processes to use. Defaults to the number of CPUs.
+        scanner: The scanner that finds colors.
+        capacity: The largest number of colors to track, or ``None`` to count every color exactly.
+        top: The largest number of colors to return, or ``None`` for every color that is tracked.
+        min_count: The smallest count of a color that is returned.
+
+    Returns:
+        The colors and their counts, from the most to the least common.
+    """
+    sketch = tally_files(find_files(sources, patterns), scanner, workers, capacity=capacity)
+
+    return tuple(
+        ColorCount(packed_color(value), count) for value, count in sketch.top(top, min_count)
+    )
@@ -0,0 +1,196 @@
+import glob
+import os
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from pathlib import Path
+from typing import TypeVar
+
+import numpy as np
+from numpy.typing import NDArray
+
+from designtools.color import Color, packed_color
+from ._color_scan import DEFAULT_CHUNK_SIZE, HEX_SCANNER, ColorScanner, scan_file
+from ._extraction_cache import ExtractionCache, ScannedFile, scan_for_cache
+
+T = TypeVar("T")
+
+SOURCE_PATTERNS = (
+    "*.css", "*.scss", "*.sass", "*.less", "*.svg", "*.html", "*.htm", "*.js", "*.jsx", "*.ts",
+    "*.tsx", "*.vue", "*.json", "*.xml", "*.txt",
+)
+"""The file name patterns searched for in directories by default."""
+
+_BATCHES_PER_WORKER = 4
+"""Splitting the files into more batches than workers evens out the time each worker spends."""
+
+
+def _is_glob(source: str) -> bool:
+    return any(char in source for char in "*?[")
+
+
+def find_files(sources: Iterable[str], patterns: Sequence[str] = SOURCE_PATTERNS) -> list[str]:
+    """Expands files, directories, and glob patterns into a sorted list of files.
+
+    Directories are searched recursively for files matching any of ``patterns``. Glob patterns may
+    use ``**`` to match any number of directories.
+
+    Args:
+        sources: The files, directories, and glob patterns.
+        patterns: The file name patterns to search directories for.
+
+    Returns:
+        The distinct files found, sorted by path.
+
+    Raises:
+        FileNotFoundError: If a source that isn't a glob pattern doesn't exist.
+    """
+    files: set[str] = set()
+
+    for source in sources:
+        path = Path(source)
+        if _is_glob(source):
+            matches = glob.iglob(source, recursive=True)
+            files.update(name for name in matches if os.path.isfile(name))
+        elif path.is_dir():
+            matches = (match for pattern in patterns for match in path.rglob(pattern))
+            files.update(str(match) for match in matches if match.is_file())
+        elif path.is_file():
+            files.add(source)
+        else:
+            raise FileNotFoundError(f"'{source}' does not exist.")
+
+    return sorted(files)
+
+
+def _scan_batch(
+    filenames: Sequence[str], scanner: ColorScanner, chunk_size: int
+) -> list[NDArray[np.uint32]]:
+    return [scan_file(filename, scanner, chunk_size) for filename in filenames]
+
+
+def _scan_batch_for_cache(
+    filenames: Sequence[str], scanner: ColorScanner, chunk_size: int
+) -> list[ScannedFile]:
+    return [scan_for_cache(filename, scanner, chunk_size) for filename in filenames]
+
+
+def _merge(found: Sequence[NDArray[np.uint32]]) -> NDArray[np.uint32]:
+    return np.unique(np.concatenate(found)) if found else np.empty(0, dtype=np.uint32)
+
+
+def _scan_merged_batch(
+    filenames: Sequence[str], scanner: ColorScanner, chunk_size: int
+) -> NDArray[np.uint32]:
+    """Scans a batch of files in a worker process, de-duplicating before sending the colors back."""
+    return _merge(_scan_batch(filenames, scanner, chunk_size))
+
+
+def _map_batches(
+    function: Callable[[Sequence[str], ColorScanner, int], T],
+    filenames: Sequence[str],
+    scanner: ColorScanner,
+    workers: int,
+    chunk_size: int,
+    batch_count: int | None = None,
+) -> tuple[list[Sequence[str]], list[T]]:
+    """Deals the files into interleaved batches and calls ``function`` on each batch in a pool of
+    processes, or directly when there is only one worker or batch.
+
+    By default the number of batches depends on the number of workers, and a single worker scans
+    every file in one batch. A fixed ``batch_count`` splits the files the same way for any number of
+    workers."""
+    if batch_count is None:
+        batch_count = min(len(filenames), workers * _BATCHES_PER_WORKER)
+        if workers == 1 or batch_count <= 1:
+            return [filenames], [function(filenames, scanner, chunk_size)]
+    else:
+        batch_count = max(min(len(filenames), batch_count), 1)
+
+    batches = [filenames[index::batch_count] for index in range(batch_count)]
+    if workers == 1 or batch_count == 1:
+        return batches, [function(batch, scanner, chunk_size) for batch in batches]
+
+    with ProcessPoolExecutor(max_workers=min(workers, batch_count)) as executor:
+        results = list(executor.map(
+            function, batches, [scanner] * batch_count, [chunk_size] * batch_count
+        ))
+
+    return batches, results
+
+
+def scan_files(
+    filenames: Sequence[str],
+    scanner: ColorScanner = HEX_SCANNER,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache: ExtractionCache | None = None,
+) -> NDArray[np.uint32]:
+    """Finds the distinct colors in many files, spreading the files across a pool of processes.
+
+    The files are dealt into interleaved batches that are scanned by separate workers. Each worker
+    de-duplicates the colors of its batch, and the batches are merged into a single sorted set, so
+    the result doesn't depend on the number of workers or the order the batches finish in.
+
+    With a cache, only the files without a valid cache entry are scanned. Their colors are sent back
+    file by file, along with a digest of the bytes that were scanned, so that they can be stored,
+    and merged with the cached colors.
+
+    Args:
+        filenames: The files to scan.
+        scanner: The scanner that finds colors.
+        workers: The number of processes to use. Defaults to the number of CPUs. With ``1`` the
+            files are scanned in the current process.
+        chunk_size: The number of bytes to search at a time.
+        cache: The optional cache of previously scanned files.
+
+    Returns:
+        The distinct packed color values in ascending order.
+
+    Raises:
+        ValueError: If ``workers`` is not positive.
+    """
+    workers = workers if workers is not None else os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be >= 1.")
+
+    if cache is None:
+        _, found = _map_batches(_scan_merged_batch, filenames, scanner, workers, chunk_size)
+        return _merge(found)
+
+    found, missing = cache.lookup(filenames, scanner)
+    if missing:
+        _, results = _map_batches(
+            _scan_batch_for_cache, [state.path for state in missing], scanner, workers, chunk_size
+        )
+        scanned = list(chain.from_iterable(results))
+        cache.store(scanned, scanner)
+        found.extend(file.colors for file in scanned)
+
+    return _merge(found)
+
+
+def colors_from_files(
+    sources: Iterable[str],
+    patterns: Sequence[str] = SOURCE_PATTERNS,
+    workers: int | None = None,
+    scanner: ColorScanner = HEX_SCANNER,
+    cache: ExtractionCache | None = None,
+) -> Sequence[Color]:
+    """Extracts the colors from files, directory trees, and glob patterns in parallel.
+
+    See :func:`find_files` and :func:`scan_files`
+
+    Args:
+        sources: The files, directories, and glob patterns.
+        patterns: The file name patterns to search directories for.
+        workers: The number of processes to use. Defaults to the number of CPUs.
+        scanner: The scanner that finds colors.
+        cache: The optional cache of previously scanned files.
+
+    Returns:
+        The distinct colors sorted by their packed value.
+    """
+    packed = scan_files(find_files(sources, patterns), scanner, workers, cache=cache)
+
+    return tuple(packed_color(value) for value in packed.tolist())
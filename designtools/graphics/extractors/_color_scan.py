@@ -0,0 +1,423 @@
+import hashlib
+import mmap
+import re
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from typing import BinaryIO
+
+import numpy as np
+from numpy.typing import NDArray
+
+from designtools.color import Color, hex_to_packed_array, packed_color
+
+DEFAULT_CHUNK_SIZE = 1 << 24
+"""The number of bytes a scanner searches at a time, 16 MiB."""
+
+DEFAULT_BLOCK_SIZE = 1 << 20
+"""The number of bytes a scanner reads from a stream at a time, 1 MiB."""
+
+HEX_COLOR_BYTES = re.compile(rb"#[0-9a-f]{6}|#[0-9a-f]{3}", re.I)
+"""Matches RGB hexadecimal colors in bytes, ignoring alpha. The bytes form of ``HEX_COLOR``."""
+
+Buffer = bytes | bytearray | memoryview | mmap.mmap
+"""The bytes-like objects a scanner can search."""
+
+NOT_A_COLOR = 0xffffffff
+"""The value a scanner's ``parse`` function gives tokens that turn out not to be colors."""
+
+_WORD_BYTES = frozenset(b"#-0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz")
+"""The bytes a scanner's words are made of. Any other byte ends a word."""
+
+_WORD_TABLE = bytes(
+    (byte | 0x20 if 0x41 <= byte <= 0x5a else byte) if byte in _WORD_BYTES else 0x20
+    for byte in range(256)
+)
+"""Lowercases letters and replaces the bytes that can't be part of a word with spaces."""
+
+
+def _parse_hex(tokens: Sequence[bytes]) -> NDArray[np.uint32]:
+    values, invalid = hex_to_packed_array(tokens)
+    values[invalid] = NOT_A_COLOR
+
+    return values
+
+
+class ColorScanner:
+    """Finds colors in large byte buffers with a single regular expression, one chunk at a time.
+
+    Each chunk is searched with the pattern's ``pos`` and ``endpos`` limits, so no chunk is ever
+    copied out of the buffer. The matches are exactly those a single search of the whole buffer
+    would find:
+
+    - When a chunk contains one of the ``separators``, it is cut just after the last one and
+      searched with ``findall``. Since no match can contain a separator, no match can straddle the
+      cut. The rest of the chunk is carried over to the next one.
+    - Otherwise the search may read up to ``max_length`` bytes past the end of the chunk so that a
+      match straddling the boundary is found whole, and the next chunk resumes after it.
+
+    If the pattern has a capturing group, the group is the token, and matches where it didn't take
+    part are ignored. This lets a pattern consume text that can't contain a color, like whole words,
+    so that the search doesn't try to match at each position inside it.
+
+    Colors that are words, like CSS named colors, are better found without the pattern. Each chunk
+    is lowercased and split into runs of letters, digits, ``_``, ``-``, and ``#`` with ``bytes``
+    methods, and the runs are looked up in a set of ``words``. A word is only found when the bytes
+    on both sides of it can't be part of a word, so ``#tan`` and ``--red`` aren't colors.
+
+    Tokens are collected into a set of distinct byte strings, which are only parsed into packed
+    color values once the whole buffer has been searched. :meth:`tally` counts the colors instead,
+    one chunk at a time.
+
+    Streams that can't be mapped, like decompressed files and pipes, are read a block at a time by
+    :meth:`scan_stream` and :meth:`tally_stream`. The unsearched end of each block is carried over
+    to the next one, along with ``max_length`` bytes before it for lookbehinds, so the matches are
+    the same as for the whole stream in one buffer.
+
+    Args:
+        pattern: The bytes pattern matching a single color, with at most one capturing group.
+        max_length: The length of the longest possible match, including any lookahead.
+        parse: Converts a sequence of tokens to their packed 24-bit color values, one for each
+            token. Tokens that aren't colors are given :data:`NOT_A_COLOR`.
+        separators: Bytes that never occur in a match. They can't be part of a word.
+        words: The words that are colors, matched regardless of case. Found words are lowercase
+            tokens.
+
+    Raises:
+        ValueError: If ``max_length`` is not positive or not longer than every word, the pattern has
+            more than one group, or a separator can be part of a word.
+    """
+
+    __slots__ = ("_pattern", "_max_length", "_parse", "_separators", "_words", "_max_word")
+
+    def __init__(
+        self,
+        pattern: re.Pattern[bytes],
+        max_length: int,
+        parse: Callable[[Sequence[bytes]], NDArray[np.uint32]],
+        separators: bytes = b"",
+        words: Iterable[bytes] = (),
+    ):
+        words = frozenset(word.lower() for word in words)
+        max_word = max(map(len, words), default=0)
+
+        if max_length < 1:
+            raise ValueError("max_length must be >= 1.")
+        if max_length <= max_word:
+            raise ValueError("max_length must be longer than every word.")
+        if pattern.groups > 1:
+            raise ValueError("The pattern may have at most one capturing group.")
+        if words and any(separator in _WORD_BYTES for separator in separators):
+            raise ValueError("Separators can't be part of a word.")
+
+        self._pattern = pattern
+        self._max_length = max_length
+        self._parse = parse
+        self._separators = tuple(bytes((separator,)) for separator in separators)
+        self._words = words
+        self._max_word = max_word
+
+    @property
+    def pattern(self) -> re.Pattern[bytes]:
+        return self._pattern
+
+    @property
+    def max_length(self) -> int:
+        return self._max_length
+
+    @property
+    def separators(self) -> bytes:
+        return b"".join(self._separators)
+
+    @property
+    def words(self) -> frozenset[bytes]:
+        return self._words
+
+    @property
+    def cache_key(self) -> str:
+        """A digest of every setting that decides which colors are found, so that caches can tell
+        scanners apart. The parser is identified by its qualified name."""
+        settings = (
+            self._pattern.pattern, self._pattern.flags, self._max_length, self.separators,
+            sorted(self._words), self._parse.__module__, self._parse.__qualname__,
+        )
+
+        return hashlib.blake2b(repr(settings).encode("utf-8"), digest_size=16).hexdigest()
+
+    def _cut(self, buffer: Buffer, pos: int, end: int) -> int | None:
+        """Finds the position just after the last separator in a chunk, if there is one."""
+        if end == len(buffer):
+            return end
+
+        cuts = (buffer.rfind(separator, pos, end) for separator in self._separators)
+        last = max(cuts, default=-1)
+
+        return last + 1 if last >= pos else None
+
+    def _scan_straddling(self, buffer: Buffer, pos: int, end: int, found: list[bytes]) -> int:
+        """Searches a chunk that may have a match straddling its end, returning where the next chunk
+        should resume."""
+        group = self._pattern.groups
+        for match in self._pattern.finditer(buffer, pos, min(end + self._max_length, len(buffer))):
+            if match.start() >= end:
+                # Leave it for the next chunk, which will find it first.
+                break
+            found.append(match.group(group))
+            pos = match.end()
+
+        return max(pos, end)
+
+    def _find_words(self, buffer: Buffer, start: int, end: int) -> list[bytes]:
+        """Finds the words that start between ``start`` and ``end``. Up to the length of the longest
+        word is read past ``end`` to finish the last one."""
+        if start >= end:
+            return []
+
+        stop = end
+        if buffer[end - 1] in _WORD_BYTES:
+            limit = min(end + self._max_word, len(buffer))
+            while stop < limit and buffer[stop] in _WORD_BYTES:
+                stop += 1
+
+        found = bytes(buffer[start:stop]).translate(_WORD_TABLE).split()
+        if start > 0 and buffer[start - 1] in _WORD_BYTES and buffer[start] in _WORD_BYTES:
+            # The first word started in the previous chunk.
+            del found[0]
+
+        return list(filter(self._words.__contains__, found))
+
+    def _matches(self, buffer: Buffer, chunk_size: int) -> Iterator[list[bytes]]:
+        """Searches a buffer one chunk at a time, yielding the matches of each chunk. Matches where
+        the group didn't take part are ``b""`` or ``None``."""
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1.")
+
+        size = len(buffer)
+        pos = 0
+
+        while pos < size:
+            end = min(pos + chunk_size, size)
+            cut = self._cut(buffer, pos, end)
+            if cut is not None:
+                found = self._pattern.findall(buffer, pos, cut)
+            else:
+                found = []
+                cut = self._scan_straddling(buffer, pos, end, found)
+
+            if self._words:
+                found.extend(self._find_words(buffer, pos, cut))
+            yield found
+            pos = cut
+
+    def _stream_matches(self, stream: BinaryIO, block_size: int) -> Iterator[list[bytes]]:
+        """Searches a stream one block at a time, yielding the matches of each block."""
+        if block_size < 1:
+            raise ValueError("block_size must be >= 1.")
+
+        tail = b""
+        pos = 0
+
+        while block := stream.read(block_size):
+            buffer = tail + block
+            last = max((buffer.rfind(separator, pos) for separator in self._separators), default=-1)
+            if last >= pos:
+                found = self._pattern.findall(buffer, pos, last + 1)
+                resume = last + 1
+            else:
+                # Only matches starting this far from the end are sure to be complete, and leave
+                # room to finish the last word.
+                limit = len(buffer) - self._max_length - self._max_word
+                found = []
+                resume = self._scan_straddling(buffer, pos, limit, found) if limit > pos else pos
+
+            if self._words:
+                found.extend(self._find_words(buffer, pos, resume))
+            yield found
+
+            start = max(0, resume - self._max_length)
+            tail = buffer[start:]
+            pos = resume - start
+
+        if pos < len(tail):
+            found = self._pattern.findall(tail, pos)
+            if self._words:
+                found.extend(self._find_words(tail, pos, len(tail)))
+            yield found
+
+    @staticmethod
+    def _distinct(chunks: Iterable[list[bytes]]) -> set[bytes]:
+        found: set[bytes] = set()
+        for matches in chunks:
+            found.update(matches)
+
+        # Matches where the group didn't take part.
+        found.discard(b"")
+        # Unmatched optional groups are returned as None by match.group().
+        found.discard(None)
+
+        return found
+
+    def tokens(self, buffer: Buffer, chunk_size: int = DEFAULT_CHUNK_SIZE) -> set[bytes]:
+        """Finds the distinct tokens in a buffer.
+
+        Args:
+            buffer: The bytes to search.
+            chunk_size: The number of bytes to search at a time.
+
+        Returns:
+            The distinct tokens.
+
+        Raises:
+            ValueError: If ``chunk_size`` is not positive.
+        """
+        return self._distinct(self._matches(buffer, chunk_size))
+
+    def parse(self, tokens: Sequence[bytes]) -> NDArray[np.uint32]:
+        """Converts matches found by :meth:`tokens` to their distinct packed color values.
+
+        Args:
+            tokens: The matches.
+
+        Returns:
+            The distinct packed values in ascending order.
+        """
+        if len(tokens) == 0:
+            return np.empty(0, dtype=np.uint32)
+
+        values = self._parse(tokens)
+
+        return np.unique(values[values != NOT_A_COLOR]).astype(np.uint32)
+
+    def tally(
+        self, buffer: Buffer, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[tuple[NDArray[np.uint32], NDArray[np.int64]]]:
+        """Counts the colors in a buffer one chunk at a time.
+
+        Each chunk's matches are counted before they are parsed, so memory use is bounded by the
+        number of distinct tokens in a chunk rather than by the number of matches in the buffer.
+
+        Args:
+            buffer: The bytes to search.
+            chunk_size: The number of bytes to search at a time.
+
+        Returns:
+            An iterator over the packed color values found in each chunk and the number of times
+            each was found. Values may repeat within a chunk, when different tokens are the same
+            color.
+
+        Raises:
+            ValueError: If ``chunk_size`` is not positive.
+        """
+        return self._tally(self._matches(buffer, chunk_size))
+
+    def tally_stream(
+        self, stream: BinaryIO, block_size: int = DEFAULT_BLOCK_SIZE
+    ) -> Iterator[tuple[NDArray[np.uint32], NDArray[np.int64]]]:
+        """Counts the colors in a stream one block at a time. See :meth:`tally`
+
+        Args:
+            stream: The binary stream to read to its end.
+            block_size: The number of bytes to read at a time.
+
+        Returns:
+            An iterator over the packed color values found in each block and the number of times
+            each was found.
+
+        Raises:
+            ValueError: If ``block_size`` is not positive.
+        """
+        return self._tally(self._stream_matches(stream, block_size))
+
+    def _tally(
+        self, chunks: Iterable[list[bytes]]
+    ) -> Iterator[tuple[NDArray[np.uint32], NDArray[np.int64]]]:
+        for matches in chunks:
+            counter = Counter(matches)
+            counter.pop(b"", None)
+            counter.pop(None, None)
+            if not counter:
+                continue
+
+            values = np.asarray(self._parse(list(counter.keys())))
+            counts = np.fromiter(counter.values(), dtype=np.int64, count=len(counter))
+            valid = values != NOT_A_COLOR
+
+            yield values[valid].astype(np.uint32), counts[valid]
+
+    def scan(self, buffer: Buffer, chunk_size: int = DEFAULT_CHUNK_SIZE) -> NDArray[np.uint32]:
+        """Finds the distinct colors in a buffer.
+
+        Args:
+            buffer: The bytes to search.
+            chunk_size: The number of bytes to search at a time.
+
+        Returns:
+            The distinct packed color values in ascending order.
+
+        Raises:
+            ValueError: If ``chunk_size`` is not positive.
+        """
+        return self.parse(list(self.tokens(buffer, chunk_size)))
+
+    def scan_stream(
+        self, stream: BinaryIO, block_size: int = DEFAULT_BLOCK_SIZE
+    ) -> NDArray[np.uint32]:
+        """Finds the distinct colors in a stream, reading it a block at a time.
+
+        Args:
+            stream: The binary stream to read to its end.
+            block_size: The number of bytes to read at a time.
+
+        Returns:
+            The distinct packed color values in ascending order.
+
+        Raises:
+            ValueError: If ``block_size`` is not positive.
+        """
+        return self.parse(list(self._distinct(self._stream_matches(stream, block_size))))
+
+
+HEX_SCANNER = ColorScanner(HEX_COLOR_BYTES, 7, _parse_hex, b"\n;}")
+"""Finds the same hexadecimal colors as :func:`colors_from_text`."""
+
+
+@contextmanager
+def _map_file(file: BinaryIO) -> Iterator[Buffer]:
+    """Memory-maps an open file for reading."""
+    # Empty files can't be mapped.
+    if file.seek(0, 2) == 0:
+        yield b""
+        return
+
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        yield buffer
+
+
+def scan_file(
+    filename: str, scanner: ColorScanner = HEX_SCANNER, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> NDArray[np.uint32]:
+    """Memory-maps a file and finds the distinct colors in it.
+
+    The file is never decoded or read into memory as a whole. The operating system pages it in as
+    each chunk is searched, so memory use is bounded by the number of distinct colors rather than by
+    the size of the file or the length of its lines.
+
+    Args:
+        filename: The file to scan.
+        scanner: The scanner that finds colors.
+        chunk_size: The number of bytes to search at a time.
+
+    Returns:
+        The distinct packed color values in ascending order.
+    """
+    with open(filename, "rb") as file, _map_file(file) as buffer:
+        return scanner.scan(buffer, chunk_size)
+
+
+def colors_from_mapped_text(filename: str) -> Sequence[Color]:
+    """Extracts the colors from a text file by memory-mapping it. See :func:`scan_file`
+
+    Finds the same colors as :func:`colors_from_text` for any ASCII compatible encoding, like UTF-8,
+    and returns them sorted.
+    """
+    return tuple(packed_color(value) for value in scan_file(filename).tolist())
@@ -0,0 +1,250 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import sys
+import tarfile
+import warnings
+import zipfile
+from collections.abc import Iterator, Sequence
+from contextlib import ExitStack
+from fnmatch import fnmatch
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO
+
+import numpy as np
+from numpy.typing import NDArray
+
+from designtools.color import Color, packed_color
+from ._color_counts import SpaceSaving
+from ._color_files import SOURCE_PATTERNS, _merge
+from ._color_scan import DEFAULT_BLOCK_SIZE, HEX_SCANNER, ColorScanner
+
+STDIN = "-"
+"""The source name that reads from standard input."""
+
+COMPRESSED_SUFFIXES = (".gz", ".bz2", ".xz", ".lzma")
+"""The suffixes of files compressed with gzip, bzip2, xz, or lzma."""
+
+ARCHIVE_SUFFIXES = (".tar", ".tgz", ".tbz2", ".txz", ".zip")
+"""The suffixes of tar and zip archives."""
+
+STREAM_SUFFIXES = COMPRESSED_SUFFIXES + ARCHIVE_SUFFIXES
+"""The suffixes of files that are read as streams rather than memory-mapped."""
+
+_SNIFF_SIZE = 262
+"""The number of bytes read to recognize a format, enough to reach the magic of a tar header."""
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_BZIP2_MAGIC = b"BZh"
+_XZ_MAGIC = b"\xfd7zXZ\x00"
+_ZIP_MAGICS = (b"PK\x03\x04", b"PK\x05\x06")
+_TAR_MAGIC = b"ustar"
+_TAR_MAGIC_OFFSET = 257
+
+
+class _Prefixed(io.RawIOBase):
+    """Reads the start of a stream to recognize its format, then replays it before the rest of the
+    stream, so streams that can't seek can be sniffed."""
+
+    def __init__(self, stream: BinaryIO, size: int):
+        super().__init__()
+        self._stream = stream
+        self._pos = 0
+
+        prefix = bytearray()
+        while len(prefix) < size and (data := stream.read(size - len(prefix))):
+            prefix += data
+        self.prefix = bytes(prefix)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._pos < len(self.prefix):
+            size = min(len(buffer), len(self.prefix) - self._pos)
+            buffer[:size] = self.prefix[self._pos:self._pos + size]
+            self._pos += size
+            return size
+
+        data = self._stream.read(len(buffer))
+        buffer[:len(data)] = data
+
+        return len(data)
+
+
+def _is_wanted(name: str, patterns: Sequence[str]) -> bool:
+    """Checks whether an archive member matches a pattern, or may contain files that do."""
+    base = PurePosixPath(name).name
+    while True:
+        if any(fnmatch(base, pattern) for pattern in patterns):
+            return True
+
+        stem, suffix = os.path.splitext(base)
+        suffix = suffix.lower()
+        if suffix in ARCHIVE_SUFFIXES:
+            return True
+        if suffix not in COMPRESSED_SUFFIXES:
+            return False
+        base = stem
+
+
+def _streams(
+    name: str, stream: BinaryIO, patterns: Sequence[str], nested: bool = False
+) -> Iterator[tuple[str, BinaryIO]]:
+    original = stream
+    stream = _Prefixed(original, _SNIFF_SIZE)
+    prefix = stream.prefix
+
+    if prefix.startswith(_GZIP_MAGIC):
+        decompressed = gzip.GzipFile(fileobj=stream, mode="rb")
+    elif prefix.startswith(_BZIP2_MAGIC):
+        decompressed = bz2.BZ2File(stream)
+    elif prefix.startswith(_XZ_MAGIC):
+        decompressed = lzma.LZMAFile(stream)
+    else:
+        decompressed = None
+
+    if decompressed is not None:
+        with decompressed:
+            yield from _streams(name, decompressed, patterns, nested)
+    elif prefix[_TAR_MAGIC_OFFSET:_TAR_MAGIC_OFFSET + len(_TAR_MAGIC)] == _TAR_MAGIC:
+        # Stream mode reads the members in order, without seeking.
+        with tarfile.open(fileobj=stream, mode="r|") as archive:
+            for member in archive:
+                if member.isfile() and _is_wanted(member.name, patterns):
+                    with archive.extractfile(member) as file:
+                        yield from _streams(f"{name}/{member.name}", file, patterns, True)
+    elif prefix.startswith(_ZIP_MAGICS):
+        try:
+            original.seek(-len(prefix), io.SEEK_CUR)
+        except (AttributeError, OSError):
+            message = (
+                f"'{name}' is a zip archive, which can't be read from a stream that can't seek."
+            )
+            if not nested:
+                raise ValueError(message) from None
+            # A zip inside a tar archive is skipped, so the rest of the archive is still scanned.
+            warnings.warn(f"{message} Skipping it.", stacklevel=2)
+            return
+
+        with zipfile.ZipFile(original) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and _is_wanted(info.filename, patterns):
+                    with archive.open(info) as file:
+                        yield from _streams(f"{name}/{info.filename}", file, patterns, True)
+    else:
+        yield name, stream
+
+
+def is_stream_source(source: str) -> bool:
+    """Checks whether a source is standard input or a compressed file or archive.
+
+    Args:
+        source: The file name, or :data:`STDIN`.
+
+    Returns:
+        Whether the source should be read with :func:`open_streams`.
+    """
+    path = Path(source)
+
+    return source == STDIN or (path.suffix.lower() in STREAM_SUFFIXES and path.is_file())
+
+
+def open_streams(
+    source: str, patterns: Sequence[str] = SOURCE_PATTERNS
+) -> Iterator[tuple[str, BinaryIO]]:
+    """Opens the text streams in a file or standard input, decompressing and unpacking as it goes.
+
+    The format is recognized from the first bytes of the stream rather than the file name. gzip,
+    bzip2, and xz data is decompressed incrementally, and may contain any of the other formats, so
+    ``.tar.gz`` archives and compressed archive members work. Tar archives are read in stream mode,
+    one member at a time. Zip archives need to seek to their central directory, so they can be read
+    from files and other zip archives but not from standard input. A zip archive inside a tar
+    archive is skipped with a warning. Anything else is text.
+
+    Nothing is written to disk or read into memory as a whole. Each stream must be read before the
+    next one is requested.
+
+    Args:
+        source: The file name, or :data:`STDIN`.
+        patterns: The file name patterns that archive members must match to be opened.
+
+    Returns:
+        An iterator over the name and binary stream of each text file.
+
+    Raises:
+        ValueError: If the source is a zip archive read from standard input.
+    """
+    with ExitStack() as stack:
+        if source == STDIN:
+            stream = sys.stdin.buffer
+        else:
+            stream = stack.enter_context(open(source, "rb"))
+
+        yield from _streams(source, stream, patterns)
+
+
+def scan_source(
+    source: str,
+    scanner: ColorScanner = HEX_SCANNER,
+    patterns: Sequence[str] = SOURCE_PATTERNS,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> NDArray[np.uint32]:
+    """Finds the distinct colors in a compressed file, an archive, or standard input.
+
+    See :func:`open_streams` and :meth:`ColorScanner.scan_stream`
+
+    Args:
+        source: The file name, or :data:`STDIN`.
+        scanner: The scanner that finds colors.
+        patterns: The file name patterns that archive members must match to be scanned.
+        block_size: The number of bytes to read at a time.
+
+    Returns:
+        The distinct packed color values in ascending order.
+    """
+    return _merge([
+        scanner.scan_stream(stream, block_size) for _, stream in open_streams(source, patterns)
+    ])
+
+
+def tally_source(
+    source: str,
+    scanner: ColorScanner = HEX_SCANNER,
+    patterns: Sequence[str] = SOURCE_PATTERNS,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    sketch: SpaceSaving | None = None,
+) -> SpaceSaving:
+    """Counts the colors in a compressed file, an archive, or standard input.
+
+    See :func:`open_streams` and :meth:`ColorScanner.tally_stream`
+
+    Args:
+        source: The file name, or :data:`STDIN`.
+        scanner: The scanner that finds colors.
+        patterns: The file name patterns that archive members must match to be scanned.
+        block_size: The number of bytes to read at a time.
+        sketch: The sketch to add the counts to. Defaults to a new sketch with the default capacity.
+
+    Returns:
+        The sketch.
+    """
+    sketch = sketch if sketch is not None else SpaceSaving()
+
+    for _, stream in open_streams(source, patterns):
+        for values, counts in scanner.tally_stream(stream, block_size):
+            sketch.update(values, counts)
+
+    return sketch
+
+
+def colors_from_stream(source: str) -> Sequence[Color]:
+    """Extracts the colors from a compressed file, an archive, or standard input. See
+    :func:`scan_source`
+
+    Returns:
+        The colors, sorted.
+    """
+    return tuple(packed_color(value) for value in scan_source(source).tolist())
@@ -0,0 +1,265 @@
+import colorsys
+import math
+import re
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from designtools.color import Color, hex_to_packed, packed_color
+from ._color_scan import NOT_A_COLOR, ColorScanner, scan_file
+
+CSS_NAMED_COLORS: Mapping[str, int] = {
+    "aliceblue": 0xf0f8ff,
+    "antiquewhite": 0xfaebd7,
+    "aqua": 0x00ffff,
+    "aquamarine": 0x7fffd4,
+    "azure": 0xf0ffff,
+    "beige": 0xf5f5dc,
+    "bisque": 0xffe4c4,
+    "black": 0x000000,
+    "blanchedalmond": 0xffebcd,
+    "blue": 0x0000ff,
+    "blueviolet": 0x8a2be2,
+    "brown": 0xa52a2a,
+    "burlywood": 0xdeb887,
+    "cadetblue": 0x5f9ea0,
+    "chartreuse": 0x7fff00,
+    "chocolate": 0xd2691e,
+    "coral": 0xff7f50,
+    "cornflowerblue": 0x6495ed,
+    "cornsilk": 0xfff8dc,
+    "crimson": 0xdc143c,
+    "cyan": 0x00ffff,
+    "darkblue": 0x00008b,
+    "darkcyan": 0x008b8b,
+    "darkgoldenrod": 0xb8860b,
+    "darkgray": 0xa9a9a9,
+    "darkgreen": 0x006400,
+    "darkgrey": 0xa9a9a9,
+    "darkkhaki": 0xbdb76b,
+    "darkmagenta": 0x8b008b,
+    "darkolivegreen": 0x556b2f,
+    "darkorange": 0xff8c00,
+    "darkorchid": 0x9932cc,
+    "darkred": 0x8b0000,
+    "darksalmon": 0xe9967a,
+    "darkseagreen": 0x8fbc8f,
+    "darkslateblue": 0x483d8b,
+    "darkslategray": 0x2f4f4f,
+    "darkslategrey": 0x2f4f4f,
+    "darkturquoise": 0x00ced1,
+    "darkviolet": 0x9400d3,
+    "deeppink": 0xff1493,
+    "deepskyblue": 0x00bfff,
+    "dimgray": 0x696969,
+    "dimgrey": 0x696969,
+    "dodgerblue": 0x1e90ff,
+    "firebrick": 0xb22222,
+    "floralwhite": 0xfffaf0,
+    "forestgreen": 0x228b22,
+    "fuchsia": 0xff00ff,
+    "gainsboro": 0xdcdcdc,
+    "ghostwhite": 0xf8f8ff,
+    "gold": 0xffd700,
+    "goldenrod": 0xdaa520,
+    "gray": 0x808080,
+    "green": 0x008000,
+    "greenyellow": 0xadff2f,
+    "grey": 0x808080,
+    "honeydew": 0xf0fff0,
+    "hotpink": 0xff69b4,
+    "indianred": 0xcd5c5c,
+    "indigo": 0x4b0082,
+    "ivory": 0xfffff0,
+    "khaki": 0xf0e68c,
+    "lavender": 0xe6e6fa,
+    "lavenderblush": 0xfff0f5,
+    "lawngreen": 0x7cfc00,
+    "lemonchiffon": 0xfffacd,
+    "lightblue": 0xadd8e6,
+    "lightcoral": 0xf08080,
+    "lightcyan": 0xe0ffff,
+    "lightgoldenrodyellow": 0xfafad2,
+    "lightgray": 0xd3d3d3,
+    "lightgreen": 0x90ee90,
+    "lightgrey": 0xd3d3d3,
+    "lightpink": 0xffb6c1,
+    "lightsalmon": 0xffa07a,
+    "lightseagreen": 0x20b2aa,
+    "lightskyblue": 0x87cefa,
+    "lightslategray": 0x778899,
+    "lightslategrey": 0x778899,
+    "lightsteelblue": 0xb0c4de,
+    "lightyellow": 0xffffe0,
+    "lime": 0x00ff00,
+    "limegreen": 0x32cd32,
+    "linen": 0xfaf0e6,
+    "magenta": 0xff00ff,
+    "maroon": 0x800000,
+    "mediumaquamarine": 0x66cdaa,
+    "mediumblue": 0x0000cd,
+    "mediumorchid": 0xba55d3,
+    "mediumpurple": 0x9370db,
+    "mediumseagreen": 0x3cb371,
+    "mediumslateblue": 0x7b68ee,
+    "mediumspringgreen": 0x00fa9a,
+    "mediumturquoise": 0x48d1cc,
+    "mediumvioletred": 0xc71585,
+    "midnightblue": 0x191970,
+    "mintcream": 0xf5fffa,
+    "mistyrose": 0xffe4e1,
+    "moccasin": 0xffe4b5,
+    "navajowhite": 0xffdead,
+    "navy": 0x000080,
+    "oldlace": 0xfdf5e6,
+    "olive": 0x808000,
+    "olivedrab": 0x6b8e23,
+    "orange": 0xffa500,
+    "orangered": 0xff4500,
+    "orchid": 0xda70d6,
+    "palegoldenrod": 0xeee8aa,
+    "palegreen": 0x98fb98,
+    "paleturquoise": 0xafeeee,
+    "palevioletred": 0xdb7093,
+    "papayawhip": 0xffefd5,
+    "peachpuff": 0xffdab9,
+    "peru": 0xcd853f,
+    "pink": 0xffc0cb,
+    "plum": 0xdda0dd,
+    "powderblue": 0xb0e0e6,
+    "purple": 0x800080,
+    "rebeccapurple": 0x663399,
+    "red": 0xff0000,
+    "rosybrown": 0xbc8f8f,
+    "royalblue": 0x4169e1,
+    "saddlebrown": 0x8b4513,
+    "salmon": 0xfa8072,
+    "sandybrown": 0xf4a460,
+    "seagreen": 0x2e8b57,
+    "seashell": 0xfff5ee,
+    "sienna": 0xa0522d,
+    "silver": 0xc0c0c0,
+    "skyblue": 0x87ceeb,
+    "slateblue": 0x6a5acd,
+    "slategray": 0x708090,
+    "slategrey": 0x708090,
+    "snow": 0xfffafa,
+    "springgreen": 0x00ff7f,
+    "steelblue": 0x4682b4,
+    "tan": 0xd2b48c,
+    "teal": 0x008080,
+    "thistle": 0xd8bfd8,
+    "tomato": 0xff6347,
+    "turquoise": 0x40e0d0,
+    "violet": 0xee82ee,
+    "wheat": 0xf5deb3,
+    "white": 0xffffff,
+    "whitesmoke": 0xf5f5f5,
+    "yellow": 0xffff00,
+    "yellowgreen": 0x9acd32,
+}
+"""The packed value of each `CSS named color`_.
+
+.. _CSS named color:
+   https://www.w3.org/TR/css-color-4/#named-colors
+"""
+
+
+_NUMBER = r"[+-]?(?:\d{1,3}(?:\.\d{1,6})?|\.\d{1,6})"
+_SPACE = r"[ \t]{0,4}"
+_SEPARATOR = _SPACE + r"[, \t]" + _SPACE
+_ALPHA = "(?:" + _SPACE + r"[,/]" + _SPACE + _NUMBER + "%?)?"
+
+CSS_COLOR_BYTES = re.compile(
+    (
+        # A leading character class lets the search skip ahead to the next candidate quickly, which
+        # an alternation of branches can't do. The lookbehinds pick the branch.
+        r"[#hHrR](?i:"
+        + r"(?<=#)(?:[0-9a-f]{8}|[0-9a-f]{6}|[0-9a-f]{3,4})(?![\w-])"
+        + r"|(?<=r)gba?\(" + _SPACE + _SEPARATOR.join([_NUMBER + "%?"] * 3) + _ALPHA + _SPACE
+        + r"\)"
+        + r"|(?<=h)sla?\(" + _SPACE + _NUMBER + "(?:deg|grad|rad|turn)?" + _SEPARATOR
+        + _SEPARATOR.join([_NUMBER + "%?"] * 2) + _ALPHA + _SPACE + r"\))"
+    ).encode("ascii")
+)
+"""Matches hexadecimal colors with 3, 4, 6, or 8 digits, and ``rgb()``, ``rgba()``, ``hsl()``, and
+``hsla()`` functions in bytes. Named colors are found by :data:`CSS_SCANNER` as words instead.
+
+Whitespace and digits inside functions are limited so that no match is longer than
+:data:`CSS_MAX_LENGTH`, and functions must be on a single line.
+"""
+
+CSS_MAX_LENGTH = 128
+"""An upper bound on the length of a :data:`CSS_COLOR_BYTES` match, including its lookahead."""
+
+_ARGUMENT = re.compile(r"([+-]?(?:\d+(?:\.\d*)?|\.\d+))(%|deg|grad|rad|turn)?")
+
+_DEGREES = {"": 1.0, "deg": 1.0, "grad": 0.9, "rad": 180 / math.pi, "turn": 360.0}
+
+
+def _to_byte(component: float) -> int:
+    return min(max(round(component * 255), 0), 255)
+
+
+def parse_css_color(color: str | bytes) -> int | None:
+    """Parses a color found by :data:`CSS_SCANNER` to its packed 24-bit value.
+
+    Alpha channels are ignored. Out of range components are clamped, as browsers do.
+
+    Args:
+        color: The color, like ``"#c0ffee"``, ``"rgb(255 0 0 / 50%)"``,
+            ``"hsl(120deg, 100%, 25%)"``, or ``"rebeccapurple"``.
+
+    Returns:
+        The packed color value, or ``None`` if the color can't be parsed.
+    """
+    text = (color.decode("ascii") if isinstance(color, bytes) else color).strip().lower()
+
+    if text.startswith("#"):
+        try:
+            return hex_to_packed(text)
+        except ValueError:
+            return None
+
+    arguments = _ARGUMENT.findall(text)
+    if text.startswith("rgb") and len(arguments) >= 3:
+        return int.from_bytes(bytes(
+            _to_byte(float(value) / (100 if unit == "%" else 255)) for value, unit in arguments[:3]
+        ), "big")
+
+    if text.startswith("hsl") and len(arguments) >= 3:
+        (hue, unit), (saturation, _), (lightness, _) = arguments[:3]
+        if unit == "%":
+            return None
+        red, green, blue = colorsys.hls_to_rgb(
+            (float(hue) * _DEGREES[unit] % 360) / 360,
+            min(max(float(lightness) / 100, 0), 1.0),
+            min(max(float(saturation) / 100, 0), 1.0),
+        )
+        return (_to_byte(red) << 16) | (_to_byte(green) << 8) | _to_byte(blue)
+
+    return CSS_NAMED_COLORS.get(text)
+
+
+def _parse_css(tokens: Sequence[bytes]) -> NDArray[np.uint32]:
+    values = (parse_css_color(token) for token in tokens)
+
+    return np.array([NOT_A_COLOR if value is None else value for value in values], dtype=np.uint32)
+
+
+CSS_SCANNER = ColorScanner(
+    CSS_COLOR_BYTES, CSS_MAX_LENGTH, _parse_css, b"\n;}",
+    words=[name.encode("ascii") for name in CSS_NAMED_COLORS],
+)
+"""Finds the colors matched by :data:`CSS_COLOR_BYTES` and the CSS named colors in a single pass."""
+
+
+def css_colors_from_text(filename: str) -> Sequence[Color]:
+    """Extracts the hexadecimal, functional, and named CSS colors from a text file. See
+    :data:`CSS_SCANNER`
+
+    Returns:
+        The distinct colors sorted by their packed value.
+    """
+    return tuple(packed_color(value) for value in scan_file(filename, CSS_SCANNER).tolist())
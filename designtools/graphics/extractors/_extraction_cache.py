@@ -0,0 +1,234 @@
+import hashlib
+import os
+import sqlite3
+from collections.abc import Sequence
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ._color_scan import DEFAULT_CHUNK_SIZE, HEX_SCANNER, ColorScanner, _map_file
+
+SCHEMA_VERSION = 1
+"""The version of the cache database layout. Caches with another version are emptied when opened."""
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT NOT NULL,
+    scanner TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest BLOB NOT NULL,
+    colors BLOB NOT NULL,
+    PRIMARY KEY (path, scanner)
+);
+CREATE TABLE IF NOT EXISTS stats (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+_COLOR_TYPE = np.dtype("<u4")
+
+
+class ExtractionCacheInfo(NamedTuple):
+    """Statistics reported by :class:`ExtractionCache`."""
+    hits: int
+    """The number of files found in the cache since it was opened."""
+    misses: int
+    """The number of files that had to be scanned since the cache was opened."""
+    total_hits: int
+    """The number of files found in the cache over its lifetime."""
+    total_misses: int
+    """The number of files that had to be scanned over the cache's lifetime."""
+    entries: int
+    """The number of files in the cache."""
+
+
+class FileState(NamedTuple):
+    """The identity of a file's contents when it was looked up in the cache."""
+    path: str
+    size: int
+    mtime_ns: int
+
+
+class ScannedFile(NamedTuple):
+    """The colors found in a file, with the state and digest of the contents that were scanned."""
+    state: FileState
+    digest: bytes
+    colors: NDArray[np.uint32]
+
+
+def scan_for_cache(
+    filename: str, scanner: ColorScanner = HEX_SCANNER, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> ScannedFile:
+    """Memory-maps a file, finds the distinct colors in it, and hashes the same bytes for
+    :meth:`ExtractionCache.store`. See :func:`scan_file`
+
+    Args:
+        filename: The file to scan.
+        scanner: The scanner that finds colors.
+        chunk_size: The number of bytes to search at a time.
+
+    Returns:
+        The scanned file.
+    """
+    with open(filename, "rb") as file, _map_file(file) as buffer:
+        stat = os.fstat(file.fileno())
+        state = FileState(os.path.abspath(filename), stat.st_size, stat.st_mtime_ns)
+
+        return ScannedFile(
+            state, hashlib.blake2b(buffer).digest(), scanner.scan(buffer, chunk_size)
+        )
+
+
+def default_cache_file() -> Path:
+    """Finds the cache database used unless another is given, in ``$XDG_CACHE_HOME`` or
+    ``~/.cache``."""
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+
+    return cache_home / "designtools" / "extraction.db"
+
+
+def _digest(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, "blake2b").digest()
+
+
+class ExtractionCache:
+    """An on-disk SQLite index of the colors found in each file.
+
+    Entries are keyed by a file's absolute path and the scanner that found its colors, and are valid
+    for as long as the file's size, modification time, and content hash are unchanged. When only the
+    modification time has changed, the contents are hashed to decide whether the entry can still be
+    used, so touching a file doesn't cause it to be scanned again.
+
+    Args:
+        path: The database file, which is created if needed. ``":memory:"`` creates a cache that
+            only lasts as long as this object. Defaults to :func:`default_cache_file`.
+    """
+
+    __slots__ = ("_connection", "_hits", "_misses")
+
+    def __init__(self, path: str | os.PathLike | None = None):
+        path = path if path is not None else default_cache_file()
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._connection = sqlite3.connect(path)
+        self._hits = 0
+        self._misses = 0
+
+        version, = self._connection.execute("PRAGMA user_version").fetchone()
+        if version != SCHEMA_VERSION:
+            with self._connection:
+                self._connection.executescript(
+                    "DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS stats;"
+                )
+                self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def lookup(
+        self, filenames: Sequence[str], scanner: ColorScanner
+    ) -> tuple[list[NDArray[np.uint32]], list[FileState]]:
+        """Finds the cached colors of files.
+
+        Args:
+            filenames: The files to look up.
+            scanner: The scanner the colors were found with.
+
+        Returns:
+            The packed colors of each file that has a valid entry, and the state of the files that
+            need to be scanned with :func:`scan_for_cache` and then passed to :meth:`store`.
+        """
+        key = scanner.cache_key
+        found: list[NDArray[np.uint32]] = []
+        missing: list[FileState] = []
+        refreshed: list[tuple[int, str, str]] = []
+
+        for filename in filenames:
+            path = os.path.abspath(filename)
+            stat = os.stat(path)
+            state = FileState(path, stat.st_size, stat.st_mtime_ns)
+            row = self._connection.execute(
+                "SELECT size, mtime_ns, digest, colors FROM files WHERE path = ? AND scanner = ?",
+                (path, key),
+            ).fetchone()
+
+            if row is not None and row[0] == state.size and (
+                row[1] == state.mtime_ns or row[2] == _digest(path)
+            ):
+                found.append(np.frombuffer(row[3], dtype=_COLOR_TYPE))
+                if row[1] != state.mtime_ns:
+                    refreshed.append((state.mtime_ns, path, key))
+            else:
+                missing.append(state)
+
+        self._hits += len(found)
+        self._misses += len(missing)
+        with self._connection:
+            self._connection.executemany(
+                "UPDATE files SET mtime_ns = ? WHERE path = ? AND scanner = ?", refreshed
+            )
+            self._count("hits", len(found))
+            self._count("misses", len(missing))
+
+        return found, missing
+
+    def store(self, scanned: Sequence[ScannedFile], scanner: ColorScanner) -> None:
+        """Adds or replaces the cached colors of files that were scanned.
+
+        Args:
+            scanned: The files returned by :func:`scan_for_cache`.
+            scanner: The scanner the colors were found with.
+        """
+        key = scanner.cache_key
+        rows = [
+            (
+                state.path, key, state.size, state.mtime_ns, digest,
+                np.asarray(colors, dtype=_COLOR_TYPE).tobytes(),
+            )
+            for state, digest, colors in scanned
+        ]
+
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def _count(self, name: str, amount: int) -> None:
+        self._connection.execute(
+            "INSERT INTO stats VALUES (?, ?) ON CONFLICT (name) DO UPDATE SET value = value + ?",
+            (name, amount, amount),
+        )
+
+    def info(self) -> ExtractionCacheInfo:
+        """Reports the hit and miss counts of this session and of the cache's lifetime, along with
+        the number of cached files."""
+        totals = dict(self._connection.execute("SELECT name, value FROM stats"))
+        entries, = self._connection.execute("SELECT COUNT(*) FROM files").fetchone()
+
+        return ExtractionCacheInfo(
+            self._hits, self._misses, totals.get("hits", 0), totals.get("misses", 0), entries
+        )
+
+    def clear(self) -> None:
+        """Removes every entry from the cache and resets the statistics."""
+        with self._connection:
+            self._connection.execute("DELETE FROM files")
+            self._connection.execute("DELETE FROM stats")
+        self._hits = 0
+        self._misses = 0
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._connection.close()
+
+    def __enter__(self) -> "ExtractionCache":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,186 @@
+import heapq
+import itertools
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from designtools.color import Color, ColorCount, packed_color
+from ._png import DEFAULT_STRIP_ROWS, read_png_strips
+
+DEFAULT_PALETTE_SIZE = 16
+"""The number of colors an image is reduced to by default."""
+
+DEFAULT_HISTOGRAM_BITS = 5
+"""The number of bits kept from each channel when binning pixels, giving 32,768 bins."""
+
+
+class ColorHistogram(NamedTuple):
+    """The pixel counts and channel sums of each color bin, indexed by the bin's packed value."""
+    bits: int
+    """The number of bits per channel used to index the bins."""
+    counts: NDArray[np.int64]
+    """The number of pixels in each bin."""
+    sums: NDArray[np.float64]
+    """The ``(bins, 3)`` sums of the red, green, and blue values of the pixels in each bin."""
+
+
+def color_histogram(
+    strips: Iterable[NDArray[np.uint8]], bits: int = DEFAULT_HISTOGRAM_BITS
+) -> ColorHistogram:
+    """Bins the pixels of an image by the high bits of their channels.
+
+    Fully transparent pixels are ignored. Keeping the sum of each channel means the mean color of a
+    bin is exact, so a bin that holds a single color is reported as that color.
+
+    Args:
+        strips: ``(rows, width, 4)`` arrays of 8-bit RGBA values, like those from
+            :func:`read_png_strips`.
+        bits: The number of bits per channel. The histogram has ``2 ** (3 * bits)`` bins.
+
+    Returns:
+        The histogram.
+
+    Raises:
+        ValueError: If ``bits`` is not between 1 and 8.
+    """
+    if not 1 <= bits <= 8:
+        raise ValueError("bits must be between 1 and 8.")
+
+    size = 1 << (3 * bits)
+    shift = 8 - bits
+    counts = np.zeros(size, dtype=np.int64)
+    sums = np.zeros((size, 3), dtype=np.float64)
+
+    for strip in strips:
+        pixels = strip.reshape(-1, 4)
+        pixels = pixels[pixels[:, 3] > 0]
+        rgb = pixels[:, :3]
+        high = (rgb >> shift).astype(np.intp)
+        index = (high[:, 0] << (2 * bits)) | (high[:, 1] << bits) | high[:, 2]
+
+        counts += np.bincount(index, minlength=size)
+        for channel in range(3):
+            sums[:, channel] += np.bincount(index, weights=rgb[:, channel], minlength=size)
+
+    return ColorHistogram(bits, counts, sums)
+
+
+def _box_priority(counts: NDArray[np.int64], coordinates: NDArray[np.intp]) -> tuple[int, int]:
+    """Ranks a box by its pixel count times the length of its longest side, and finds that side."""
+    extent = coordinates.max(axis=0) - coordinates.min(axis=0)
+    axis = int(np.argmax(extent))
+
+    return int(counts.sum()) * int(extent[axis]), axis
+
+
+def median_cut(
+    histogram: ColorHistogram, size: int = DEFAULT_PALETTE_SIZE
+) -> tuple[ColorCount, ...]:
+    """Reduces a histogram to a palette with median cut.
+
+    The occupied bins start out in a single box. The box with the largest pixel count times the
+    length of its longest side is repeatedly split across that side, until there are ``size`` boxes
+    or no box spans more than one bin. Each box becomes the mean color of its pixels.
+
+    Args:
+        histogram: The binned pixels.
+        size: The largest number of colors in the palette.
+
+    Returns:
+        The palette colors and the number of pixels each represents, most common first.
+
+    Raises:
+        ValueError: If ``size`` is not positive.
+    """
+    if size < 1:
+        raise ValueError("size must be >= 1.")
+
+    bits = histogram.bits
+    occupied = np.flatnonzero(histogram.counts)
+    if len(occupied) == 0:
+        return ()
+
+    mask = (1 << bits) - 1
+    coordinates = np.stack(
+        [occupied >> (2 * bits), (occupied >> bits) & mask, occupied & mask], axis=1
+    )
+    counts = histogram.counts[occupied]
+
+    # Entries are (-priority, tie breaker, axis, bin indexes), so the highest priority pops first.
+    boxes = []
+    done = []
+    order = itertools.count()
+
+    def push(members: NDArray[np.intp]) -> None:
+        priority, axis = _box_priority(counts[members], coordinates[members])
+        if priority == 0:
+            done.append(members)
+        else:
+            heapq.heappush(boxes, (-priority, next(order), axis, members))
+
+    push(np.arange(len(occupied)))
+    while boxes and len(boxes) + len(done) < size:
+        _, _, axis, members = heapq.heappop(boxes)
+        members = members[np.argsort(coordinates[members, axis], kind="stable")]
+        sides = coordinates[members, axis]
+        cumulative = np.cumsum(counts[members])
+        median = sides[np.searchsorted(cumulative, cumulative[-1] / 2)]
+        # Cutting halfway between the median and the far end of the longer half, rather than at the
+        # median, keeps small clusters of distant colors from being absorbed by a large neighbor.
+        if sides[-1] - median >= median - sides[0]:
+            split = int(np.searchsorted(sides, median + (sides[-1] - median) // 2, side="right"))
+        else:
+            split = int(np.searchsorted(sides, median - (median - sides[0]) // 2, side="left"))
+        split = min(max(split, 1), len(members) - 1)
+        push(members[:split])
+        push(members[split:])
+
+    palette = []
+    for members in done + [entry[3] for entry in boxes]:
+        bins = occupied[members]
+        count = int(histogram.counts[bins].sum())
+        red, green, blue = np.rint(histogram.sums[bins].sum(axis=0) / count).astype(int).tolist()
+        palette.append((count, (red << 16) | (green << 8) | blue))
+
+    palette.sort(key=lambda entry: (-entry[0], entry[1]))
+
+    return tuple(ColorCount(packed_color(value), count) for count, value in palette)
+
+
+def image_palette(
+    filename: str,
+    size: int = DEFAULT_PALETTE_SIZE,
+    bits: int = DEFAULT_HISTOGRAM_BITS,
+    strip_rows: int = DEFAULT_STRIP_ROWS,
+) -> tuple[ColorCount, ...]:
+    """Reduces a PNG image to a palette of its most representative colors.
+
+    The image is decoded a strip at a time into a histogram (see :func:`color_histogram`), so memory
+    use doesn't grow with the size of the image, and the histogram is reduced with
+    :func:`median_cut`.
+
+    Args:
+        filename: The PNG file.
+        size: The largest number of colors in the palette.
+        bits: The number of bits per channel of the histogram.
+        strip_rows: The number of rows decoded at a time.
+
+    Returns:
+        The palette colors and their pixel counts, most common first.
+
+    Raises:
+        ValueError: If the file is not a supported PNG image, or an argument is out of range.
+    """
+    return median_cut(color_histogram(read_png_strips(filename, strip_rows), bits), size)
+
+
+def colors_from_image(filename: str) -> Sequence[Color]:
+    """Extracts a palette of up to :data:`DEFAULT_PALETTE_SIZE` colors from a PNG image. See
+    :func:`image_palette`
+
+    Returns:
+        The colors, from the most to the least common.
+    """
+    return tuple(entry.color for entry in image_palette(filename))
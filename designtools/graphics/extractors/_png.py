@@ -0,0 +1,350 @@
+import struct
+import zlib
+from collections.abc import Iterator
+from typing import BinaryIO, NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+"""The first 8 bytes of every PNG file."""
+
+DEFAULT_STRIP_ROWS = 256
+"""The number of image rows decoded at a time."""
+
+_BLOCK_SIZE = 1 << 16
+"""The number of compressed bytes read from the file at a time."""
+
+_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+"""The number of samples in a pixel of each PNG color type."""
+
+_BIT_DEPTHS = {0: (1, 2, 4, 8, 16), 2: (8, 16), 3: (1, 2, 4, 8), 4: (8, 16), 6: (8, 16)}
+"""The bit depths allowed for each PNG color type."""
+
+
+class PngHeader(NamedTuple):
+    """The image properties in a PNG file's ``IHDR`` chunk."""
+    width: int
+    height: int
+    bit_depth: int
+    color_type: int
+    interlace: int
+
+    @property
+    def channels(self) -> int:
+        return _CHANNELS[self.color_type]
+
+    @property
+    def row_bytes(self) -> int:
+        """The length of a row of pixels in bytes, without its filter type."""
+        return (self.width * self.channels * self.bit_depth + 7) // 8
+
+    @property
+    def pixel_bytes(self) -> int:
+        """The distance to the byte of the previous pixel used by the ``Sub``, ``Average``, and
+        ``Paeth`` filters."""
+        return max(1, self.channels * self.bit_depth // 8)
+
+
+def _read_chunk_header(file: BinaryIO) -> tuple[bytes, int]:
+    header = file.read(8)
+    if len(header) < 8:
+        raise ValueError("The PNG file is truncated.")
+    length, chunk_type = struct.unpack(">I4s", header)
+
+    return chunk_type, length
+
+
+def _read_chunk_body(file: BinaryIO, chunk_type: bytes, length: int) -> Iterator[bytes]:
+    """Reads a chunk's data in blocks, checking its CRC once all of it has been read."""
+    crc = zlib.crc32(chunk_type)
+    while length > 0:
+        block = file.read(min(length, _BLOCK_SIZE))
+        if not block:
+            raise ValueError("The PNG file is truncated.")
+        crc = zlib.crc32(block, crc)
+        length -= len(block)
+        yield block
+
+    expected = file.read(4)
+    if len(expected) < 4 or struct.unpack(">I", expected)[0] != crc:
+        raise ValueError(f"The PNG {chunk_type.decode('latin-1')} chunk is corrupt.")
+
+
+def _read_chunk(file: BinaryIO, chunk_type: bytes, length: int) -> bytes:
+    return b"".join(_read_chunk_body(file, chunk_type, length))
+
+
+def _parse_header(data: bytes) -> PngHeader:
+    if len(data) != 13:
+        raise ValueError("The PNG IHDR chunk is corrupt.")
+    width, height, bit_depth, color_type, compression, filter_method, interlace = struct.unpack(
+        ">IIBBBBB", data
+    )
+
+    if width == 0 or height == 0:
+        raise ValueError("The PNG image is empty.")
+    if bit_depth not in _BIT_DEPTHS.get(color_type, ()):
+        raise ValueError(f"Unsupported PNG color type {color_type} with bit depth {bit_depth}.")
+    if compression != 0 or filter_method != 0:
+        raise ValueError("Unsupported PNG compression or filter method.")
+    if interlace != 0:
+        raise ValueError("Interlaced PNG images are not supported.")
+
+    return PngHeader(width, height, bit_depth, color_type, interlace)
+
+
+def _paeth(a: NDArray[np.int16], b: NDArray[np.int16], c: NDArray[np.int16]) -> NDArray[np.int16]:
+    pa = np.abs(b - c)
+    pb = np.abs(a - c)
+    pc = np.abs(a + b - 2 * c)
+
+    return np.where((pa <= pb) & (pa <= pc), a, np.where(pb <= pc, b, c))
+
+
+def _unfilter_rows(
+    types: NDArray[np.uint8], rows: NDArray[np.uint8], previous: NDArray[np.uint8], pixel_bytes: int
+) -> NDArray[np.uint8]:
+    """Reverses the ``None``, ``Sub``, and ``Up`` filters, which only need a few array operations
+    per row."""
+    out = np.empty_like(rows)
+    for index, filter_type in enumerate(types.tolist()):
+        row = rows[index]
+        if filter_type == 0:
+            out[index] = row
+        elif filter_type == 1:
+            out[index] = row.reshape(-1, pixel_bytes).cumsum(axis=0, dtype=np.uint8).reshape(-1)
+        else:
+            out[index] = row + previous
+        previous = out[index]
+
+    return out
+
+
+def _unfilter_wavefront(
+    types: NDArray[np.uint8], rows: NDArray[np.uint8], previous: NDArray[np.uint8], pixel_bytes: int
+) -> NDArray[np.uint8]:
+    """Reverses any mix of filters, including ``Average`` and ``Paeth``.
+
+    Each pixel depends on the pixels to its left, above it, and above and to its left, so the pixels
+    on each anti-diagonal of the strip are independent of each other. The strip is skewed so that
+    each anti-diagonal is a contiguous row of ``skewed``, and the diagonals are decoded in order,
+    one vectorized step per pixel column plus one per row instead of a step per byte.
+    """
+    count, length = rows.shape
+    width = length // pixel_bytes
+    # Row r of the strip is column r of the diagonals, counting the previous row as row 0. Pixel x
+    # of row r is on diagonal x + r + 1, leaving diagonal 0 and the cells left of each row as zero
+    # padding.
+    skewed = np.zeros((width + count + 2, count + 1, pixel_bytes), dtype=np.int16)
+    filtered = np.zeros_like(skewed)
+    skewed[1:width + 1, 0] = previous.reshape(width, pixel_bytes)
+    pixels = rows.reshape(count, width, pixel_bytes)
+    for row in range(1, count + 1):
+        filtered[row + 1:row + 1 + width, row] = pixels[row - 1]
+
+    # Strips usually use a single filter, which can skip selecting a predictor for each row.
+    kinds = [types == kind for kind in range(1, 5)]
+    uniform = int(types[0]) if np.all(types == types[0]) else None
+    for diagonal in range(2, width + count + 1):
+        low = max(1, diagonal - width)
+        high = min(count, diagonal - 1) + 1
+        a = skewed[diagonal - 1, low:high]
+        b = skewed[diagonal - 1, low - 1:high - 1]
+        c = skewed[diagonal - 2, low - 1:high - 1]
+
+        if uniform == 4:
+            predicted = _paeth(a, b, c)
+        elif uniform == 3:
+            predicted = (a + b) >> 1
+        else:
+            predicted = np.select(
+                [kind[low - 1:high - 1, np.newaxis] for kind in kinds],
+                [a, b, (a + b) >> 1, _paeth(a, b, c)],
+                0,
+            )
+        skewed[diagonal, low:high] = (filtered[diagonal, low:high] + predicted) & 0xff
+
+    row_index = np.arange(1, count + 1)[:, np.newaxis]
+    unskewed = skewed[np.arange(width)[np.newaxis, :] + row_index + 1, row_index]
+
+    return unskewed.astype(np.uint8).reshape(count, length)
+
+
+def _unfilter(
+    strip: NDArray[np.uint8], previous: NDArray[np.uint8], pixel_bytes: int
+) -> NDArray[np.uint8]:
+    types = strip[:, 0]
+    if types.max() > 4:
+        raise ValueError("The PNG image data is corrupt.")
+
+    unfilter = _unfilter_wavefront if types.max() >= 3 else _unfilter_rows
+
+    return unfilter(types, strip[:, 1:], previous, pixel_bytes)
+
+
+class _Palette(NamedTuple):
+    """Converts unfiltered rows to RGBA pixels."""
+    header: PngHeader
+    colors: NDArray[np.uint8] | None
+    transparent: NDArray[np.uint16] | None
+
+    def samples(self, rows: NDArray[np.uint8]) -> NDArray[np.uint16]:
+        """Unpacks rows into ``(rows, width, channels)`` samples at the image's bit depth."""
+        count = len(rows)
+        header = self.header
+        depth = header.bit_depth
+        if depth == 16:
+            wide = rows.reshape(count, -1, 2).astype(np.uint16)
+            values = (wide[..., 0] << 8) | wide[..., 1]
+        elif depth < 8:
+            shifts = np.arange(8 - depth, -1, -depth, dtype=np.uint8)
+            values = ((rows[..., np.newaxis] >> shifts) & ((1 << depth) - 1)).reshape(count, -1)
+            values = values[:, :header.width].astype(np.uint16)
+        else:
+            values = rows.astype(np.uint16)
+
+        return values.reshape(count, header.width, header.channels)
+
+    def rgba(self, rows: NDArray[np.uint8]) -> NDArray[np.uint8]:
+        samples = self.samples(rows)
+        header = self.header
+        color_type = header.color_type
+
+        if color_type == 3:
+            if self.colors is None:
+                raise ValueError("The PNG image has no palette.")
+            return self.colors[samples[..., 0]]
+
+        # Scale to 8 bits, replicating the high bits of sub-byte grays.
+        eight_bit = (samples >> 8 if header.bit_depth == 16
+                     else samples * 255 // ((1 << header.bit_depth) - 1)).astype(np.uint8)
+        rgba = np.empty((*samples.shape[:2], 4), dtype=np.uint8)
+        color = eight_bit[..., :3] if color_type in (2, 6) else eight_bit[..., :1]
+        rgba[..., :3] = color
+
+        if color_type in (4, 6):
+            rgba[..., 3] = eight_bit[..., -1]
+        elif self.transparent is not None:
+            keyed = np.all(samples == self.transparent, axis=-1)
+            rgba[..., 3] = np.where(keyed, 0, 0xff)
+        else:
+            rgba[..., 3] = 0xff
+
+        return rgba
+
+
+def _read_palette(header: PngHeader, palette: bytes | None,
+                  transparency: bytes | None) -> _Palette:
+    colors = None
+    transparent = None
+
+    if header.color_type == 3 and palette is not None:
+        if len(palette) % 3 != 0:
+            raise ValueError("The PNG PLTE chunk is corrupt.")
+        # Out of range indexes are treated as transparent black rather than failing the lookup.
+        colors = np.zeros((256, 4), dtype=np.uint8)
+        entries = len(palette) // 3
+        colors[:entries, :3] = np.frombuffer(palette, dtype=np.uint8).reshape(entries, 3)
+        colors[:entries, 3] = 0xff
+        if transparency is not None:
+            alpha = np.frombuffer(transparency[:entries], dtype=np.uint8)
+            colors[:len(alpha), 3] = alpha
+    elif header.color_type in (0, 2) and transparency is not None:
+        transparent = np.frombuffer(transparency, dtype=">u2")[:header.channels].astype(np.uint16)
+
+    return _Palette(header, colors, transparent)
+
+
+def read_png_strips(
+    filename: str, strip_rows: int = DEFAULT_STRIP_ROWS
+) -> Iterator[NDArray[np.uint8]]:
+    """Decodes a PNG image a strip of rows at a time.
+
+    The compressed image data is read and inflated incrementally, so memory use is bounded by the
+    size of a strip rather than by the size of the image. Every standard color type and bit depth is
+    supported, and palette and color key transparency are applied. Interlaced images are not
+    supported.
+
+    Args:
+        filename: The PNG file.
+        strip_rows: The number of rows in each strip. The last strip may have fewer.
+
+    Returns:
+        An iterator over the strips as ``(rows, width, 4)`` arrays of 8-bit RGBA values.
+
+    Raises:
+        ValueError: If ``strip_rows`` is not positive, or the file is not a PNG image, is corrupt,
+            or is interlaced.
+    """
+    if strip_rows < 1:
+        raise ValueError("strip_rows must be >= 1.")
+
+    with open(filename, "rb") as file:
+        if file.read(8) != PNG_SIGNATURE:
+            raise ValueError(f"'{filename}' is not a PNG file.")
+
+        chunk_type, length = _read_chunk_header(file)
+        if chunk_type != b"IHDR":
+            raise ValueError("The PNG file doesn't start with an IHDR chunk.")
+        header = _parse_header(_read_chunk(file, chunk_type, length))
+
+        palette = transparency = None
+        while (chunk := _read_chunk_header(file))[0] != b"IDAT":
+            chunk_type, length = chunk
+            if chunk_type == b"IEND":
+                raise ValueError("The PNG file has no image data.")
+            data = _read_chunk(file, chunk_type, length)
+            if chunk_type == b"PLTE":
+                palette = data
+            elif chunk_type == b"tRNS":
+                transparency = data
+
+        yield from _decode(file, chunk[1], header, _read_palette(header, palette, transparency),
+                           strip_rows)
+
+
+def _image_data(file: BinaryIO, length: int) -> Iterator[bytes]:
+    """Reads the blocks of consecutive IDAT chunks."""
+    while True:
+        yield from _read_chunk_body(file, b"IDAT", length)
+        chunk_type, length = _read_chunk_header(file)
+        if chunk_type != b"IDAT":
+            return
+
+
+def _decode(file: BinaryIO, length: int, header: PngHeader, palette: _Palette,
+            strip_rows: int) -> Iterator[NDArray[np.uint8]]:
+    stride = header.row_bytes + 1
+    strip_size = stride * min(strip_rows, header.height)
+    previous = np.zeros(header.row_bytes, dtype=np.uint8)
+    inflater = zlib.decompressobj()
+    pending = bytearray()
+    rows_left = header.height
+
+    def strips(final: bool) -> Iterator[NDArray[np.uint8]]:
+        nonlocal pending, previous, rows_left
+        while rows_left > 0 and (len(pending) >= strip_size or final and len(pending) >= stride):
+            count = min(len(pending) // stride, strip_rows, rows_left)
+            strip = np.frombuffer(pending, dtype=np.uint8, count=count * stride)
+            strip = strip.reshape(count, stride)
+            rows = _unfilter(strip, previous, header.pixel_bytes)
+            previous = rows[-1]
+            rows_left -= count
+            pending = pending[count * stride:]
+            yield palette.rgba(rows)
+
+    try:
+        for block in _image_data(file, length):
+            while block:
+                # Limiting the output bounds memory even for highly compressible images.
+                pending += inflater.decompress(block, strip_size)
+                block = inflater.unconsumed_tail
+                yield from strips(False)
+        pending += inflater.flush()
+    except zlib.error as error:
+        raise ValueError("The PNG image data is corrupt.") from error
+
+    yield from strips(True)
+    if rows_left > 0:
+        raise ValueError("The PNG image data is truncated.")
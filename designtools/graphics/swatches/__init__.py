@@ -1,4 +1,6 @@
 from .color_stack import ColorStack
-from .gradient_bar import GradientBar
+from .gradient_bar import GradientBar, stop_offsets
 from .swatch_renderer import SwatchRenderer
-from .swatch_grid import BallGrid, CircleGrid, SquareGrid, SwatchGrid
+from .simulated_renderer import SimulatedRenderer
+from .swatch_grid import (MIN_SWATCH_SCALE, BallGrid, CircleGrid, SquareGrid, SwatchGrid,
+                          get_swatch_scales, )
@@ -27,7 +27,8 @@ class ColorStack(SwatchRenderer):
 
             cx += self._radius
 
-    def compute_size(self, color_groups: Sequence[Sequence[Color]]) -> tuple[Numeric, Numeric]:
+    def compute_size(self, color_groups: Sequence[Sequence[Color]],
+                     counts: Sequence[Sequence[int]] | None = None) -> tuple[Numeric, Numeric]:
         row_count = len(color_groups)
         col_count = max(len(group) for group in color_groups)
 
@@ -36,7 +37,8 @@ class ColorStack(SwatchRenderer):
 
         return width, height
 
-    def render(self, color_groups: Sequence[Sequence[Color]], ctx: cairo.Context) -> None:
+    def render(self, color_groups: Sequence[Sequence[Color]], ctx: cairo.Context,
+               counts: Sequence[Sequence[int]] | None = None) -> None:
         ctx.save()
         cy = self._padding + self._radius
 
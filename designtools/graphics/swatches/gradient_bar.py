@@ -1,4 +1,5 @@
 from collections.abc import Sequence
+from itertools import accumulate
 
 import cairo
 
@@ -7,12 +8,37 @@ from designtools.mathutil import Numeric
 from .swatch_renderer import SwatchRenderer
 
 
+def stop_offsets(size: int, counts: Sequence[int] | None = None) -> Sequence[float]:
+    """Computes the gradient stop offset of each color in a bar.
+
+    Each color's stop is at the end of its share of the bar. Without counts, the colors share the
+    bar equally. With counts, each color's share is proportional to how often it occurs.
+
+    Args:
+        size: The number of colors in the bar.
+        counts: Optional. The number of times each color occurs.
+
+    Returns:
+        The offset of each color's stop, between 0 and 1.
+    """
+    if counts is None or sum(counts) <= 0:
+        return [(index + 1) / size for index in range(size)]
+
+    total = sum(counts)
+
+    return [end / total for end in accumulate(counts)]
+
+
 class GradientBar(SwatchRenderer):
+    """Renders each color group as a horizontal linear gradient.
+
+    When counts are given, the more common a color is, the more of its bar it covers.
+    """
 
     @staticmethod
-    def _add_color_stops(colors: Sequence[Color], gradient: cairo.Gradient) -> None:
-        for index, color in enumerate(colors):
-            offset = (index + 1) / len(colors)
+    def _add_color_stops(colors: Sequence[Color], gradient: cairo.Gradient,
+                         counts: Sequence[int] | None = None) -> None:
+        for offset, color in zip(stop_offsets(len(colors), counts), colors):
             r, g, b = color.rgb
             gradient.add_color_stop_rgb(offset, r, g, b)
 
@@ -20,7 +46,8 @@ class GradientBar(SwatchRenderer):
         self._swatch_width = swatch_width
         self._swatch_height = swatch_height
 
-    def _render_bar(self, colors: Sequence[Color], row: int, ctx: cairo.Context) -> None:
+    def _render_bar(self, colors: Sequence[Color], row: int, ctx: cairo.Context,
+                    counts: Sequence[int] | None = None) -> None:
         ctx.save()
         x = 0
         y = row * self._swatch_height
@@ -28,7 +55,7 @@ class GradientBar(SwatchRenderer):
         height = self._swatch_height
 
         gradient = cairo.LinearGradient(x, y, x + width, y)
-        GradientBar._add_color_stops(colors, gradient)
+        GradientBar._add_color_stops(colors, gradient, counts)
 
         ctx.set_source(gradient)
         ctx.rectangle(x, y, width, height)
@@ -36,12 +63,14 @@ class GradientBar(SwatchRenderer):
 
         ctx.restore()
 
-    def compute_size(self, color_groups: Sequence[Sequence[Color]]) -> tuple[Numeric, Numeric]:
+    def compute_size(self, color_groups: Sequence[Sequence[Color]],
+                     counts: Sequence[Sequence[int]] | None = None) -> tuple[Numeric, Numeric]:
         return self._swatch_width, len(color_groups) * self._swatch_height
 
-    def render(self, color_groups: Sequence[Sequence[Color]], ctx: cairo.Context) -> None:
+    def render(self, color_groups: Sequence[Sequence[Color]], ctx: cairo.Context,
+               counts: Sequence[Sequence[int]] | None = None) -> None:
         ctx.save()
         for index, colors in enumerate(color_groups):
-            self._render_bar(colors, index, ctx)
+            self._render_bar(colors, index, ctx, None if counts is None else counts[index])
 
         ctx.restore()
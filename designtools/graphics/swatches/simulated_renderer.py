@@ -0,0 +1,71 @@
+from collections.abc import Sequence
+from itertools import accumulate, chain
+
+import cairo
+
+from designtools.color import Color, ColorArray
+from designtools.color.vision import cvd_matrix, simulate_cvd
+from designtools.mathutil import Numeric
+from .swatch_renderer import SwatchRenderer
+
+
+class SimulatedRenderer(SwatchRenderer):
+    """Renders swatches through another renderer as they would appear to a viewer with a color
+    vision deficiency.
+
+    The colors of every group are simulated together in a single vectorized pass before rendering.
+    See :mod:`designtools.color.vision`
+
+    Args:
+        renderer: The renderer that draws the simulated colors.
+        deficiency: One of the :data:`~designtools.color.vision.CVD_TYPES`.
+        severity: How severe the deficiency is, from ``0`` to ``1``.
+
+    Raises:
+        ValueError: If ``deficiency`` is unknown or ``severity`` is outside the range [0, 1].
+    """
+
+    def __init__(self, renderer: SwatchRenderer, deficiency: str, severity: float = 1.0):
+        # Fail on bad settings now instead of at render time.
+        cvd_matrix(deficiency, severity)
+
+        self._renderer = renderer
+        self._deficiency = deficiency
+        self._severity = severity
+
+    @property
+    def renderer(self) -> SwatchRenderer:
+        return self._renderer
+
+    @property
+    def deficiency(self) -> str:
+        return self._deficiency
+
+    @property
+    def severity(self) -> float:
+        return self._severity
+
+    def simulate(self, color_groups: Sequence[Sequence[Color]]) -> Sequence[Sequence[Color]]:
+        """Simulates the deficiency for every color in a set of color groups.
+
+        Args:
+            color_groups: the color groups to simulate
+
+        Returns:
+            The simulated color groups with the same structure as ``color_groups``.
+        """
+        colors = ColorArray.from_colors(chain.from_iterable(color_groups))
+        simulated = simulate_cvd(colors, self._deficiency, self._severity).to_colors()
+        ends = tuple(accumulate(len(group) for group in color_groups))
+
+        return [simulated[end - len(group):end] for group, end in zip(color_groups, ends)]
+
+    def compute_size(self, color_groups: Sequence[Sequence[Color]],
+                     counts: Sequence[Sequence[int]] | None = None) -> tuple[Numeric, Numeric]:
+        # Simulation doesn't change the number or grouping of colors, so the size is the same.
+        return self._renderer.compute_size(color_groups, counts)
+
+    def render(self, color_groups: Sequence[Sequence[Color]], ctx: cairo.Context,
+               counts: Sequence[Sequence[int]] | None = None) -> None:
+        # Simulated colors keep their positions, so the counts still line up with them.
+        self._renderer.render(self.simulate(color_groups), ctx, counts)
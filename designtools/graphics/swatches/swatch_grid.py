@@ -11,6 +11,9 @@ from .swatch_renderer import SwatchRenderer
 
 TWO_PI = 2 * math.pi
 
+MIN_SWATCH_SCALE = 0.25
+"""The scale of the swatch of the least common colors when swatches are sized by frequency."""
+
 
 def get_color_grid(color_groups: Sequence[Sequence[Color]]) -> tuple[int, int, Sequence[Color]]:
     """Calculates the grid size for the given set of color groups.
@@ -26,6 +29,31 @@ def get_color_grid(color_groups: Sequence[Sequence[Color]]) -> tuple[int, int, S
     return columns, rows, colors
 
 
+def get_swatch_scales(counts: Sequence[Sequence[int]] | None, size: int) -> Sequence[float]:
+    """Calculates the scale of each swatch in a grid from how often its color occurs.
+
+    A swatch's area is proportional to its color's count, so the most common color fills its cell
+    and the others shrink, down to :data:`MIN_SWATCH_SCALE`.
+
+    Args:
+        counts: The number of times each color occurs, with the same structure as the color groups.
+            ``None`` gives every swatch the full size.
+        size: The number of colors in the grid.
+
+    Returns:
+        The flattened scale of each swatch, between :data:`MIN_SWATCH_SCALE` and 1.
+    """
+    if counts is None:
+        return [1.0] * size
+
+    flattened = tuple(chain.from_iterable(counts))
+    largest = max(flattened, default=0)
+    if largest <= 0:
+        return [1.0] * size
+
+    return [max(MIN_SWATCH_SCALE, math.sqrt(max(count, 0) / largest)) for count in flattened]
+
+
 class SwatchGrid(SwatchRenderer):
     """Provides the base utility logic for swatch grid renderers.
 
@@ -84,11 +112,13 @@ class SwatchGrid(SwatchRenderer):
 
         return x + half_size, y + half_size
 
-    def compute_size(self, color_groups: Sequence[Sequence[Color]]) -> tuple[Numeric, Numeric]:
+    def compute_size(self, color_groups: Sequence[Sequence[Color]],
+                     counts: Sequence[Sequence[int]] | None = None) -> tuple[Numeric, Numeric]:
         """Computes the view box size for a given set of color groups.
 
         Args:
             color_groups: the color groups to measure
+            counts: Optional. Swatches are scaled within their cells, so counts don't change it.
 
         Returns:
             The (width, height) of the view box.
@@ -101,7 +131,8 @@ class SwatchGrid(SwatchRenderer):
         return width, height
 
     @abstractmethod
-    def render_cell(self, ctx: cairo.Context, column: int, row: int, color: Color) -> None:
+    def render_cell(self, ctx: cairo.Context, column: int, row: int, color: Color,
+                    scale: float = 1.0) -> None:
         """Renders the individual grid cell swatch.
 
         Args:
@@ -109,18 +140,23 @@ class SwatchGrid(SwatchRenderer):
             column: The column for this cell.
             row: The row for this cell.
             color: The color this cell should represent.
+            scale: The size of the swatch relative to :attr:`size`, centered in the cell.
         """
         ...
 
-    def render(self, color_groups: Sequence[Sequence[Color]], ctx: cairo.Context) -> None:
+    def render(self, color_groups: Sequence[Sequence[Color]], ctx: cairo.Context,
+               counts: Sequence[Sequence[int]] | None = None) -> None:
+        """Renders a swatch for each color, sized by how often the color occurs when ``counts`` is
+        given. See :func:`get_swatch_scales`"""
         ctx.save()
 
         cols, _, colors = get_color_grid(color_groups)
+        scales = get_swatch_scales(counts, len(colors))
         row = 0
         column = 0
 
-        for color in colors:
-            self.render_cell(ctx, column, row, color)
+        for color, scale in zip(colors, scales):
+            self.render_cell(ctx, column, row, color, scale)
 
             column += 1
             if column == cols:
@@ -144,13 +180,15 @@ class BallGrid(SwatchGrid):
         # The shadow color adjustment
         gradient.add_color_stop_rgb(1.0, *color.hsv_transform(1.0, 1.5, 0.5).rgb)
 
-    def render_cell(self, ctx: cairo.Context, column: int, row: int, color: Color):
+    def render_cell(self, ctx: cairo.Context, column: int, row: int, color: Color,
+                    scale: float = 1.0):
         cx, cy = self.get_cell_center(column, row)
-        rg = cairo.RadialGradient(cx - (self.half_size / 2), cy - (self.half_size / 2),
-                                  self.half_size * 0.1, cx, cy, self.half_size)
+        radius = self.half_size * scale
+        rg = cairo.RadialGradient(cx - (radius / 2), cy - (radius / 2), radius * 0.1,
+                                  cx, cy, radius)
         BallGrid._add_color_stops(color, rg)
         ctx.set_source(rg)
-        ctx.arc(cx, cy, self.half_size, 0, TWO_PI)
+        ctx.arc(cx, cy, radius, 0, TWO_PI)
         ctx.fill()
 
 
@@ -159,11 +197,12 @@ class CircleGrid(SwatchGrid):
     def __init__(self, size: Numeric, padding: Numeric | None):
         super().__init__(size, padding)
 
-    def render_cell(self, ctx: cairo.Context, column: int, row: int, color: Color):
+    def render_cell(self, ctx: cairo.Context, column: int, row: int, color: Color,
+                    scale: float = 1.0):
         cx, cy = self.get_cell_center(column, row)
 
         ctx.set_source_rgb(*color.rgb)
-        ctx.arc(cx, cy, self.half_size, 0, TWO_PI)
+        ctx.arc(cx, cy, self.half_size * scale, 0, TWO_PI)
         ctx.fill()
 
 
@@ -172,17 +211,21 @@ class SquareGrid(SwatchGrid):
     def __init__(self, size: Numeric, padding: Numeric | None):
         super().__init__(size, padding)
 
-    def compute_size(self, color_groups: Sequence[Sequence[Color]]) -> tuple[Numeric, Numeric]:
-        size = super().compute_size(color_groups)
+    def compute_size(self, color_groups: Sequence[Sequence[Color]],
+                     counts: Sequence[Sequence[int]] | None = None) -> tuple[Numeric, Numeric]:
+        size = super().compute_size(color_groups, counts)
         columns, rows, _ = get_color_grid(color_groups)
 
         return size[0] + self.padding, size[1] + self.padding
 
-    def render_cell(self, ctx: cairo.Context, column: int, row: int, color: Color):
+    def render_cell(self, ctx: cairo.Context, column: int, row: int, color: Color,
+                    scale: float = 1.0):
         x, y = self.get_cell_location(column, row)
-        rx = x + self.padding
-        ry = y + self.padding
+        size = self.size * scale
+        # Smaller swatches stay centered where the full size swatch would be.
+        rx = x + self.padding + (self.size - size) / 2
+        ry = y + self.padding + (self.size - size) / 2
 
         ctx.set_source_rgb(*color.rgb)
-        ctx.rectangle(rx, ry, self.size, self.size)
+        ctx.rectangle(rx, ry, size, size)
         ctx.fill()
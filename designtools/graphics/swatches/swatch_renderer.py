@@ -12,11 +12,14 @@ class SwatchRenderer(ABC):
     """
 
     @abstractmethod
-    def compute_size(self, color_groups: Sequence[Sequence[Color]]) -> tuple[Numeric, Numeric]:
+    def compute_size(self, color_groups: Sequence[Sequence[Color]],
+                     counts: Sequence[Sequence[int]] | None = None) -> tuple[Numeric, Numeric]:
         """Computes the view box size for a given set of color groups.
 
         Args:
             color_groups: the color groups to measure
+            counts: Optional. The number of times each color occurs, with the same structure as
+                ``color_groups``.
 
         Returns:
             The (width, height) of the view box.
@@ -24,11 +27,14 @@ class SwatchRenderer(ABC):
         ...
 
     @abstractmethod
-    def render(self, color_groups: Sequence[Sequence[Color]], ctx: cairo.Context) -> None:
+    def render(self, color_groups: Sequence[Sequence[Color]], ctx: cairo.Context,
+               counts: Sequence[Sequence[int]] | None = None) -> None:
         """Renders the given set of color groups as an SVG document.
 
         Args:
             color_groups: the color groups to render swatches for.
             ctx: the graphics context to draw on.
+            counts: Optional. The number of times each color occurs, with the same structure as
+                ``color_groups``. Renderers that support it give more common colors more space.
         """
         ...
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from designtools import color
+
+HEX_CODES = ("f1d35a", "Ab1", "#FFF", "#1234", "12345678", "#00ff80", "#abcdef01")
+
+
+def test_hex_to_packed_array():
+    packed, invalid = color.hex_to_packed_array(HEX_CODES)
+
+    assert packed.dtype == np.uint32
+    assert packed.tolist() == [color.hex_to_packed(code) for code in HEX_CODES]
+    assert invalid.tolist() == []
+
+
+def test_hex_to_packed_array_bytes():
+    packed, invalid = color.hex_to_packed_array([code.encode() for code in HEX_CODES])
+
+    assert packed.tolist() == [color.hex_to_packed(code) for code in HEX_CODES]
+    assert invalid.tolist() == []
+
+
+def test_hex_to_packed_array_errors():
+    codes = [
+        "#1", "fff", "22", "#55555", "ff", "7777777", "#999999999", "ffffxx", "", "#ffé", "000",
+    ]
+    packed, invalid = color.hex_to_packed_array(codes)
+
+    assert invalid.tolist() == [0, 2, 3, 4, 5, 6, 7, 8, 9]
+    assert packed.tolist() == [0, 0xffffff] + [0] * 8 + [0]
+
+
+def test_hex_to_packed_array_matches_scalar():
+    codes = [
+        "##fff", "###c0ffee", "#" * 12 + "abc", "##", "#", "", "#ff#f", "##123456789", "##xyz",
+        "0x1234", "#0X12ab",
+    ]
+    packed, invalid = color.hex_to_packed_array(codes)
+
+    for index, code in enumerate(codes):
+        try:
+            expected = color.hex_to_packed(code)
+        except ValueError:
+            assert index in invalid
+        else:
+            assert index not in invalid
+            assert packed[index] == expected
+
+
+def test_hex_to_rgb_array():
+    rgb, invalid = color.hex_to_rgb_array(HEX_CODES + ("nope",))
+
+    assert rgb.shape == (len(HEX_CODES) + 1, 3)
+    assert [tuple(row) for row in rgb[:-1]] == [color.hex_to_rgb(code) for code in HEX_CODES]
+    assert invalid.tolist() == [len(HEX_CODES)]
+
+
+def test_empty_hex_arrays():
+    packed, invalid = color.hex_to_packed_array([])
+
+    assert packed.shape == (0,)
+    assert invalid.shape == (0,)
+    assert color.hex_to_rgb_array([]).values.shape == (0, 3)
+
+
+def test_get_luminance_array():
+    rng = np.random.default_rng(7)
+    rgb = np.vstack((rng.integers(0, 256, (50, 3)) / 255, rng.random((50, 3))))
+    expected = [color.get_luminance(*row) for row in rgb.tolist()]
+
+    result = color.get_luminance_array(rgb).tolist()
+
+    # 8-bit components come from the lookup table, others from the exact formula.
+    assert result[:50] == expected[:50]
+    assert result[50:] == pytest.approx(expected[50:])
+    assert color.get_luminance_array(rgb[:0]).shape == (0,)
+
+
+def test_get_packed_luminance_array():
+    packed, _ = color.hex_to_packed_array(HEX_CODES)
+    expected = [color.get_packed_luminance(value) for value in packed.tolist()]
+
+    assert color.get_packed_luminance_array(packed).tolist() == expected
+
+
+@pytest.mark.parametrize(
+    "array_fn, scalar_fn",
+    [
+        (color.rgb_to_oklab_array, color.rgb_to_oklab),
+        (color.rgb_to_lab_array, color.rgb_to_lab),
+    ],
+)
+def test_perceptual_arrays(array_fn, scalar_fn):
+    rng = np.random.default_rng(5)
+    rgb = np.vstack((rng.integers(0, 256, (50, 3)) / 255, rng.random((50, 3)), np.eye(3)))
+    expected = np.array([scalar_fn(*row) for row in rgb.tolist()])
+
+    assert array_fn(rgb) == pytest.approx(expected, abs=1e-9)
+
+
+def test_lab_to_lch_array():
+    lab = color.rgb_to_lab_array(np.random.default_rng(9).random((50, 3)))
+    expected = np.array([color.lab_to_lch(*row) for row in lab.tolist()])
+
+    assert color.lab_to_lch_array(lab) == pytest.approx(expected)
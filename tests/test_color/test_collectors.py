@@ -1,7 +1,10 @@
+import numpy as np
 import pytest
 
 from designtools.color import hsv_color
-from designtools.color.collectors import HsvCollector
+from designtools.color.collectors import (GRAYS, HUE_SIMPLE, HUES_MARTIAN, HsvCollector,
+                                          HuePartition, )
+from designtools.common import ContainerChain
 
 
 @pytest.fixture(scope="module")
@@ -38,3 +41,61 @@ def sat_collector():
 def test_hsv_collector(name, color, expected, request):
     collector = request.getfixturevalue(name)
     assert (color in collector) == expected
+
+
+@pytest.mark.parametrize(
+    "hue, expected",
+    [
+        (0.0, "01 red"),
+        (0.04, "01 red"),
+        (1 / 6, "02 yellow"),
+        (0.5, "04 cyan"),
+        (0.99, "06 magenta"),
+        (1.0, None),
+    ],
+)
+def test_hue_partition_find(hue, expected):
+    partition = HuePartition(HUE_SIMPLE)
+
+    assert partition.find(hue) == expected
+    assert (hsv_color(hue, 1, 1) in partition) == (expected is not None)
+
+
+def test_hue_partition_matches_collectors():
+    partition = HuePartition(HUES_MARTIAN)
+    hues = np.linspace(0, 1, 2401)
+    expected = [
+        next((key for key, c in HUES_MARTIAN.items() if hsv_color(hue, 1, 1) in c), None)
+        for hue in hues.tolist()
+    ]
+
+    assert [partition.find(hue) for hue in hues.tolist()] == expected
+
+    indexes = partition.find_indexes(hues)
+    assert [partition.keys[i] if i >= 0 else None for i in indexes] == expected
+
+
+def test_hue_partition_with_gaps():
+    partition = HuePartition({
+        "b": HsvCollector("h", 0.5, 0.75),
+        "a": HsvCollector("h", 0.1, 0.2),
+    })
+
+    assert partition.keys == ("a", "b")
+    assert [partition.find(h) for h in (0.05, 0.1, 0.2, 0.6, 0.75)] == [None, "a", None, "b", None]
+    hues = np.array([0.05, 0.1, 0.2, 0.6, 0.75])
+    assert partition.find_indexes(hues).tolist() == [-1, 0, -1, 1, -1]
+
+
+@pytest.mark.parametrize(
+    "collectors",
+    [
+        GRAYS,
+        {"a": HsvCollector("h", 0.1, 0.5), "b": HsvCollector("h", 0.4, 0.6)},
+        {"a": HsvCollector("h", 0.1, 0.5), "b": ContainerChain(HsvCollector("h", 0.5, 0.6))},
+    ],
+)
+def test_bad_hue_partition(collectors):
+    assert not HuePartition.is_partition(collectors)
+    with pytest.raises(ValueError):
+        HuePartition(collectors)
@@ -0,0 +1,113 @@
+import colorsys
+import itertools
+
+import numpy as np
+import pytest
+
+from designtools.color import Color, ColorArray, hex_color
+
+HEX_CODES = ("ffd500", "2277ff", "32ff32", "000000", "ffffff", "808080", "ff0080", "01fe7f")
+
+
+@pytest.fixture(scope="module")
+def color_array():
+    return ColorArray(hex_codes=HEX_CODES)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"hex_codes": None, "rgb": None, "hsv": None},
+        {"hex_codes": ["fff", "fffff"]},
+        {"hex_codes": ["ffffxx"]},
+        {"rgb": [(2.0, 0.0, 0.1)]},
+        {"rgb": [(0.5, 0.0)]},
+        {"hsv": [(2.0, 0.0, 0.1)]},
+        {"hsv": [(0.0, 0.1)]},
+    ],
+)
+def test_bad_color_array_init(params):
+    with pytest.raises(ValueError):
+        ColorArray(**params)
+
+
+def test_color_array_from_hex(color_array):
+    assert len(color_array) == len(HEX_CODES)
+    assert color_array.hex_codes == HEX_CODES
+    for code, rgb, hsv in zip(HEX_CODES, color_array.rgb, color_array.hsv):
+        assert tuple(rgb) == hex_color(code).rgb
+        assert tuple(hsv) == pytest.approx(hex_color(code).hsv)
+
+
+def test_rgb_hsv_round_trip():
+    steps = (0.0, 0.1, 0.25, 0.5, 0.75, 0.9, 1.0)
+    rgb = np.array(list(itertools.product(steps, repeat=3)))
+    colors = ColorArray(rgb=rgb)
+    expected = [colorsys.rgb_to_hsv(*row) for row in rgb]
+
+    assert colors.hsv == pytest.approx(np.array(expected))
+    assert ColorArray(hsv=colors.hsv).rgb == pytest.approx(rgb)
+
+
+def test_hsv_to_rgb():
+    steps = (0.0, 0.1, 0.25, 0.5, 0.75, 0.9, 1.0)
+    hsv = np.array(list(itertools.product(steps, repeat=3)))
+    expected = [colorsys.hsv_to_rgb(*row) for row in hsv]
+
+    assert ColorArray(hsv=hsv).rgb == pytest.approx(np.array(expected))
+
+
+def test_color_array_indexing(color_array):
+    assert color_array[1] == hex_color("2277ff")
+    assert color_array[-1] == hex_color("01fe7f")
+    assert color_array[2:4].hex_codes == ("32ff32", "000000")
+    assert color_array[[0, 5]].hex_codes == ("ffd500", "808080")
+    assert len(color_array[color_array.hsv[:, 1] == 0]) == 3
+
+
+def test_color_array_round_trip(color_array):
+    colors = color_array.to_colors()
+
+    assert colors == tuple(hex_color(code) for code in HEX_CODES)
+    assert ColorArray.from_colors(colors).hex_codes == HEX_CODES
+    assert list(color_array) == list(colors)
+    assert Color(hsv=(0.5, 0.5, 0.5)) == ColorArray(hsv=[(0.5, 0.5, 0.5)])[0]
+
+
+def test_color_array_read_only(color_array):
+    with pytest.raises(ValueError):
+        color_array.rgb[0, 0] = 0.5
+
+
+def test_color_array_packed(color_array):
+    packed = color_array.packed
+
+    assert packed.dtype == np.uint32
+    assert packed.tolist() == [int(code, 16) for code in HEX_CODES]
+    assert ColorArray.from_packed(packed).hex_codes == HEX_CODES
+    assert ColorArray(hsv=[(0.3333333333333333, 0.8, 1.0)]).packed.tolist() == [0x32ff32]
+
+    with pytest.raises(ValueError):
+        ColorArray.from_packed([0x1000000])
+
+
+def test_color_array_perceptual(color_array):
+    colors = color_array.to_colors()
+
+    assert color_array.oklab == pytest.approx(np.array([c.oklab for c in colors]))
+    assert color_array.lab == pytest.approx(np.array([c.lab for c in colors]))
+    assert color_array.lch == pytest.approx(np.array([c.lch for c in colors]))
+    assert color_array[1:3].oklab == pytest.approx(color_array.oklab[1:3])
+
+
+def test_color_array_coordinates(color_array):
+    assert color_array.coordinates("rgb") is color_array.rgb
+    assert color_array.coordinates("oklab") is color_array.oklab
+
+    cone = color_array.coordinates("hsv")
+    assert cone[:, 2].tolist() == color_array.hsv[:, 2].tolist()
+    radius = color_array.hsv[:, 1] * color_array.hsv[:, 2]
+    assert np.hypot(cone[:, 0], cone[:, 1]) == pytest.approx(radius)
+
+    with pytest.raises(ValueError):
+        color_array.coordinates("cmyk")
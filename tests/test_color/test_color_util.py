@@ -59,3 +59,98 @@ def test_hex_to_hsv(hex_code, hsv):
 )
 def test_rgb_to_hex(rgb, hex_code):
     assert color.rgb_to_hex(*rgb) == hex_code
+
+
+@pytest.mark.parametrize(
+    "hex_code, packed",
+    [
+        ("#fff", 0xffffff),
+        ("000000", 0),
+        ("ff0080", 0xff0080),
+        ("#12345678", 0x123456),
+    ],
+)
+def test_hex_to_packed(hex_code, packed):
+    assert color.hex_to_packed(hex_code) == packed
+    assert color.packed_to_hex(packed) == color.normalize_hex_color(hex_code)
+    assert color.packed_to_rgb(packed) == color.hex_to_rgb(hex_code)
+
+
+@pytest.mark.parametrize(
+    "test", ["ffffxx", "+fffff", "-fffff", "ff_fff", "ff ff", "0x1234", "0X12ab", "#0x123456"]
+)
+def test_hex_to_packed_error(test):
+    with pytest.raises(ValueError):
+        color.hex_to_packed(test)
+
+
+@pytest.mark.parametrize(
+    "rgb, packed",
+    [
+        ((1.0, 1.0, 1.0), 0xffffff),
+        ((0.0, 0.0, 0.0), 0),
+        ((1.0, 0.0, 0.5019607843137255), 0xff0080),
+        ((0.19999999999999996, 1.0, 0.19999999999999996), 0x32ff32),
+    ],
+)
+def test_rgb_to_packed(rgb, packed):
+    assert color.rgb_to_packed(*rgb) == packed
+
+
+@pytest.mark.parametrize(
+    "rgb, luminance",
+    [
+        ((1.0, 1.0, 1.0), 1.0),
+        ((0.0, 0.0, 0.0), 0.0),
+        ((1.0, 0.0, 0.0), 0.2126),
+        ((0.5, 0.5, 0.5), 0.21404114048223255),
+    ],
+)
+def test_get_luminance(rgb, luminance):
+    assert color.get_luminance(*rgb) == pytest.approx(luminance)
+
+
+@pytest.mark.parametrize("hex_code", ["ffffff", "000000", "ff0080", "0a0b0c", "808080", "fedcba"])
+def test_get_packed_luminance(hex_code):
+    packed = color.hex_to_packed(hex_code)
+    assert color.get_packed_luminance(packed) == color.get_luminance(*color.hex_to_rgb(hex_code))
+
+
+@pytest.mark.parametrize(
+    "rgb, oklab",
+    [
+        ((1.0, 1.0, 1.0), (1.0, 0.0, 0.0)),
+        ((0.0, 0.0, 0.0), (0.0, 0.0, 0.0)),
+        ((1.0, 0.0, 0.0), (0.627955, 0.224863, 0.125846)),
+        ((0.0, 0.0, 1.0), (0.452014, -0.032457, -0.311528)),
+    ],
+)
+def test_rgb_to_oklab(rgb, oklab):
+    assert color.rgb_to_oklab(*rgb) == pytest.approx(oklab, abs=1e-6)
+
+
+@pytest.mark.parametrize(
+    "rgb, lab",
+    [
+        ((1.0, 1.0, 1.0), (100.0, 0.0, 0.0)),
+        ((0.0, 0.0, 0.0), (0.0, 0.0, 0.0)),
+        ((1.0, 0.0, 0.0), (53.2408, 80.0925, 67.2032)),
+        ((0.0, 1.0, 0.0), (87.7347, -86.1827, 83.1793)),
+    ],
+)
+def test_rgb_to_lab(rgb, lab):
+    assert color.rgb_to_lab(*rgb) == pytest.approx(lab, abs=1e-3)
+
+
+@pytest.mark.parametrize(
+    "lab, lch",
+    [
+        ((50.0, 0.0, 0.0), (50.0, 0.0, 0.0)),
+        ((50.0, 10.0, 0.0), (50.0, 10.0, 0.0)),
+        ((50.0, 0.0, 10.0), (50.0, 10.0, 90.0)),
+        ((50.0, 0.0, -10.0), (50.0, 10.0, 270.0)),
+        ((53.2408, 80.0925, 67.2032), (53.2408, 104.5518, 39.9990)),
+    ],
+)
+def test_lab_to_lch(lab, lch):
+    assert color.lab_to_lch(*lab) == pytest.approx(lch, abs=1e-3)
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from designtools.color import ColorArray, hex_color
+from designtools.color.contrast import (WCAG_AA, WCAG_AA_LARGE, WCAG_AAA, contrast_matrix,
+                                        contrast_pairs, contrast_ratio, pass_counts, )
+
+
+@pytest.fixture(scope="module")
+def foregrounds():
+    return ColorArray.from_packed(np.random.default_rng(31).integers(0, 1 << 24, 150))
+
+
+@pytest.fixture(scope="module")
+def backgrounds():
+    return ColorArray.from_packed(np.random.default_rng(37).integers(0, 1 << 24, 90))
+
+
+@pytest.mark.parametrize(
+    "color1, color2, expected",
+    [
+        ("000000", "ffffff", 21.0),
+        ("ffffff", "000000", 21.0),
+        ("777777", "ffffff", 4.478),
+        ("0000ff", "ffffff", 8.592),
+        ("123456", "123456", 1.0),
+    ],
+)
+def test_contrast_ratio(color1, color2, expected):
+    assert contrast_ratio(hex_color(color1), hex_color(color2)) == pytest.approx(expected, abs=1e-3)
+
+
+def test_contrast_matrix(foregrounds, backgrounds):
+    matrix = contrast_matrix(foregrounds, backgrounds)
+    expected = [[contrast_ratio(fg, bg) for bg in backgrounds] for fg in foregrounds]
+
+    assert matrix.shape == (len(foregrounds), len(backgrounds))
+    assert matrix == pytest.approx(np.array(expected))
+
+
+@pytest.mark.parametrize("passing", [True, False])
+@pytest.mark.parametrize("tile_size", [16, 1024])
+def test_contrast_pairs(foregrounds, backgrounds, passing, tile_size):
+    matrix = contrast_matrix(foregrounds, backgrounds)
+    expected = sorted(zip(*(a.tolist() for a in np.nonzero((matrix >= WCAG_AA) == passing))))
+    blocks = list(contrast_pairs(foregrounds, backgrounds, WCAG_AA, passing, tile_size))
+    pairs = sorted(
+        (fg, bg)
+        for block in blocks
+        for fg, bg in zip(block.foreground.tolist(), block.background.tolist())
+    )
+
+    assert pairs == expected
+    assert all(
+        block.ratios == pytest.approx(matrix[block.foreground, block.background])
+        for block in blocks
+    )
+
+
+@pytest.mark.parametrize("threshold", [1.0, WCAG_AA_LARGE, WCAG_AA, WCAG_AAA, 21.0])
+def test_pass_counts(foregrounds, backgrounds, threshold):
+    passed = contrast_matrix(foregrounds, backgrounds) >= threshold
+    counts = pass_counts(foregrounds, backgrounds, threshold)
+
+    assert counts.foreground.tolist() == passed.sum(axis=1).tolist()
+    assert counts.background.tolist() == passed.sum(axis=0).tolist()
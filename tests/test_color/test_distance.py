@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from designtools.color import ColorArray, hex_color
+from designtools.color.distance import (close_pairs, color_distance, delta_e_2000, delta_e_76,
+                                        distance_matrix, distance_tiles, )
+
+
+@pytest.fixture(scope="module")
+def palette():
+    rng = np.random.default_rng(23)
+    base = ColorArray.from_packed(rng.integers(0, 1 << 24, 60))
+    # Slightly shifted copies give the palette some near-duplicates.
+    shifted = np.clip(base.rgb + rng.uniform(-0.01, 0.01, base.rgb.shape), 0, 1)
+
+    return ColorArray(rgb=np.vstack((base.rgb, shifted[:20])))
+
+
+@pytest.mark.parametrize(
+    "lab1, lab2, expected",
+    [
+        ((50.0, 2.6772, -79.7751), (50.0, 0.0, -82.7485), 2.0425),
+        ((50.0, 3.1571, -77.2803), (50.0, 0.0, -82.7485), 2.8615),
+        ((50.0, -1.3802, -84.2814), (50.0, 0.0, -82.7485), 1.0000),
+        ((50.0, 0.0, 0.0), (50.0, -1.0, 2.0), 2.3669),
+        ((50.0, 2.5, 0.0), (73.0, 25.0, -18.0), 27.1492),
+        ((50.0, 2.5, 0.0), (50.0, 0.0, -2.5), 4.3065),
+        ((60.2574, -34.0099, 36.2677), (60.4626, -34.1751, 39.4387), 1.2644),
+        ((2.0776, 0.0795, -1.1350), (0.9033, -0.0636, -0.5514), 0.9082),
+    ],
+)
+def test_delta_e_2000(lab1, lab2, expected):
+    assert delta_e_2000(np.array(lab1), np.array(lab2)) == pytest.approx(expected, abs=1e-4)
+    assert delta_e_2000(np.array(lab2), np.array(lab1)) == pytest.approx(expected, abs=1e-4)
+
+
+def test_delta_e_76():
+    assert delta_e_76(np.array((50.0, 0.0, 0.0)), np.array((53.0, 4.0, 0.0))) == pytest.approx(5.0)
+
+
+def test_color_distance():
+    assert color_distance(hex_color("fff"), hex_color("000"), "cie76") == pytest.approx(100.0)
+    assert color_distance(hex_color("fff"), hex_color("000"), "oklab") == pytest.approx(1.0)
+    assert color_distance(hex_color("123456"), hex_color("123456")) == 0.0
+
+    with pytest.raises(ValueError):
+        color_distance(hex_color("fff"), hex_color("000"), "cie94")
+
+
+@pytest.mark.parametrize("metric", ["cie76", "ciede2000", "oklab"])
+@pytest.mark.parametrize("tile_size", [7, 32, 1024])
+def test_distance_matrix(palette, metric, tile_size):
+    points = palette.oklab if metric == "oklab" else palette.lab
+    metric_fn = delta_e_2000 if metric == "ciede2000" else delta_e_76
+    expected = metric_fn(points[:, np.newaxis, :], points[np.newaxis, :, :])
+
+    assert distance_matrix(palette, metric=metric, tile_size=tile_size) == pytest.approx(expected)
+    assert distance_matrix(palette[:10], palette[5:], metric, tile_size) == pytest.approx(
+        expected[:10, 5:]
+    )
+
+
+def test_distance_tiles_bounded(palette):
+    tiles = list(distance_tiles(palette, tile_size=16))
+
+    assert all(tile.distances.shape[0] <= 16 and tile.distances.shape[1] <= 16 for tile in tiles)
+    assert all(tile.column >= tile.row for tile in tiles)
+
+
+@pytest.mark.parametrize("tile_size", [7, 1024])
+def test_close_pairs(palette, tile_size):
+    matrix = distance_matrix(palette)
+    first, second = np.nonzero(np.triu(matrix < 3.0, k=1))
+    blocks = list(close_pairs(palette, 3.0, tile_size=tile_size))
+    pairs = sorted(
+        (i, j, d) for block in blocks for i, j, d in zip(*(a.tolist() for a in block))
+    )
+
+    assert len(pairs) >= 20
+    assert [(i, j) for i, j, _ in pairs] == sorted(zip(first.tolist(), second.tolist()))
+    assert [d for _, _, d in pairs] == pytest.approx([matrix[i, j] for i, j, _ in pairs])
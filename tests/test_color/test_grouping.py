@@ -1,7 +1,13 @@
+import pickle
+
+import numpy as np
 import pytest
 
-from designtools.color import group_colors, hex_color
-from designtools.color.collectors import HsvCollector
+from designtools.color import (ColorCount, group_color_counts, group_colors, hex_color, pack_groups,
+                              packed_color, )
+from designtools.color.collectors import (GRAYS, HUE_SIMPLE, HUES_BASIC, HUES_MARTIAN,
+                                          SPLIT_GRAYS, HsvCollector, )
+from designtools.color.grouping import compile_collectors
 
 
 @pytest.fixture(scope="module")
@@ -39,3 +45,76 @@ def collectors():
 )
 def test_group_colors(collectors, colors, expected):
     assert group_colors(colors, collectors) == expected
+
+
+def _linear_group_colors(colors, collectors):
+    groupings = {key: [] for key in collectors}
+    for color in dict.fromkeys(colors):
+        key = next((key for key, collector in collectors.items() if color in collector), None)
+        if key is not None:
+            groupings[key].append(color)
+
+    return groupings
+
+
+@pytest.mark.parametrize("collectors", [GRAYS | HUES_MARTIAN, SPLIT_GRAYS | HUES_BASIC, HUE_SIMPLE])
+def test_group_colors_partition(collectors):
+    rng = np.random.default_rng(3)
+    colors = [packed_color(int(value)) for value in rng.integers(0, 1 << 24, 2000)]
+    groups = group_colors(colors, collectors)
+
+    assert {key: value for key, value in groups.items() if value} == {
+        key: value for key, value in _linear_group_colors(colors, collectors).items() if value
+    }
+
+
+def test_compile_collectors():
+    matchers = compile_collectors(GRAYS | HUES_MARTIAN | {"zz": HsvCollector("v", 0, 1)})
+
+    assert len(matchers) == 3
+
+
+def test_group_colors_duplicates_and_empty_groups():
+    collectors = {
+        "00 all": HsvCollector("v", 0, 0.5),
+        "01 bright": HsvCollector("v", 0.5, 1.1),
+        "02 unused": HsvCollector("s", 2, 3),
+        "03 overlap": HsvCollector("v", 0, 1.1),
+    }
+    colors = [hex_color(code) for code in ("111", "eee", "111", "222", "eee")]
+
+    assert group_colors(colors, collectors) == {
+        "00 all": [hex_color("111"), hex_color("222")],
+        "01 bright": [hex_color("eee")],
+        "02 unused": [],
+        "03 overlap": [],
+    }
+    assert list(group_colors([], collectors)) == list(collectors)
+
+
+def test_group_color_counts():
+    red, green, dark_red = hex_color("#ff0000"), hex_color("#00ff00"), hex_color("#800000")
+    counted = [
+        ColorCount(red, 2), ColorCount(green, 5), ColorCount(dark_red, 4), ColorCount(red, 3),
+    ]
+    collectors = {"red": HUE_SIMPLE["01 red"], "green": HUE_SIMPLE["03 green"]}
+    groups = group_color_counts(counted, collectors)
+
+    assert list(groups) == ["red", "green"]
+    assert groups["red"] == [ColorCount(red, 5), ColorCount(dark_red, 4)]
+    assert groups["green"] == [ColorCount(green, 5)]
+
+
+def test_pack_groups():
+    colors = [hex_color(code) for code in ("f00", "0f0", "00f", "fff", "000", "777", "c0ffee")]
+    groups = group_colors(colors, GRAYS | HUES_BASIC)
+    packed = pack_groups(groups)
+
+    assert packed.names == tuple(groups.keys())
+    assert packed.offsets[-1] == len(colors)
+    assert packed.packed.dtype == np.uint32
+
+    restored = pickle.loads(pickle.dumps(packed)).unpack()
+    assert list(restored.keys()) == list(groups.keys())
+    assert restored == {key: list(group) for key, group in groups.items()}
+    assert pack_groups({}).unpack() == {}
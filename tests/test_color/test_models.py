@@ -1,6 +1,8 @@
+import pickle
+
 import pytest
 
-from designtools.color import Color
+from designtools.color import CacheInfo, Color, ColorCache, hex_color, packed_color
 
 
 @pytest.mark.parametrize(
@@ -91,3 +93,143 @@ def test_hsv_transform(base_color, xform, new_color):
 )
 def test_rgb_transform(base_color, xform, new_color):
     assert base_color.rgb_transform(*xform) == new_color
+
+
+def test_color_cache_shared_instances():
+    cache = ColorCache()
+    first = cache.get("#FFD500")
+
+    assert cache.get("ffd500") is first
+    assert cache.get("ffd500cc") is first
+    assert cache.get("#ffd") is not first
+    assert cache.info() == CacheInfo(hits=2, misses=2, maxsize=4096, currsize=2)
+
+
+def test_color_cache_eviction():
+    cache = ColorCache(2)
+    red = cache.get("f00")
+    cache.get("0f0")
+    cache.get("f00")
+    cache.get("00f")
+
+    assert cache.get("f00") is red
+    assert cache.info().currsize == 2
+    assert cache.info().misses == 3
+
+    cache.resize(1)
+    assert cache.info().currsize == 1
+
+    cache.clear()
+    assert cache.info() == CacheInfo(hits=0, misses=0, maxsize=1, currsize=0)
+
+
+def test_color_cache_disabled():
+    cache = ColorCache(0)
+
+    assert cache.get("f00") is not cache.get("f00")
+    assert cache.info() == CacheInfo(hits=0, misses=2, maxsize=0, currsize=0)
+
+
+@pytest.mark.parametrize("params", [{"maxsize": -1}, {"maxsize": -10}])
+def test_bad_color_cache_size(params):
+    with pytest.raises(ValueError):
+        ColorCache(**params)
+
+
+@pytest.mark.parametrize(
+    "params, pending",
+    [
+        ({"hex_code": "ffd500"}, ("_hsv",)),
+        ({"rgb": (0.13333333333333333, 0.4666666666666667, 1.0)}, ("_hex", "_hsv")),
+        ({"hsv": (0.3333333333333333, 0.8, 1.0)}, ("_hex", "_rgb")),
+    ],
+)
+def test_lazy_color_data(params, pending):
+    c = Color(**params)
+    assert all(getattr(c, name) is None for name in pending)
+
+    expected = Color._from_components(c.hex_code, c.rgb, c.hsv)
+    assert all(getattr(c, name) is not None for name in pending)
+    assert (c.hex_code, c.rgb, c.hsv) == (expected.hex_code, expected.rgb, expected.hsv)
+
+
+@pytest.mark.parametrize(
+    "params, expected",
+    [
+        ({"hex_code": "#ffd500"}, 0xffd500),
+        ({"rgb": (0.13333333333333333, 0.4666666666666667, 1.0)}, 0x2277ff),
+        ({"hsv": (0.3333333333333333, 0.8, 1.0)}, 0x32ff32),
+    ],
+)
+def test_packed_identity(params, expected):
+    c = Color(**params)
+    assert c.packed == expected
+    assert hash(c) == hash(expected)
+    assert packed_color(expected) == c
+    assert packed_color(expected).hex_code == c.hex_code
+
+
+def test_packed_ordering():
+    colors = [hex_color(code) for code in ("ffffff", "000000", "0f0f0f", "f00", "00ff01")]
+    assert sorted(colors) == sorted(colors, key=lambda c: c.hex_code)
+    assert hex_color("000001") < hex_color("000100") < hex_color("010000")
+    assert hex_color("fff") > hex_color("ffffef")
+
+
+@pytest.mark.parametrize("packed", [-1, 0x1000000])
+def test_bad_packed_color(packed):
+    with pytest.raises(ValueError):
+        packed_color(packed)
+
+
+def test_perceptual_properties():
+    c = hex_color("ff0000")
+
+    assert c.oklab == pytest.approx((0.627955, 0.224863, 0.125846), abs=1e-6)
+    assert c.lab == pytest.approx((53.2408, 80.0925, 67.2032), abs=1e-3)
+    assert c.lch == pytest.approx((53.2408, 104.5518, 39.9990), abs=1e-3)
+    assert c.oklab is c.oklab
+
+
+@pytest.mark.parametrize(
+    "color",
+    [
+        hex_color("c0ffee"),
+        packed_color(0x123456),
+        Color(rgb=(1.0, 0.2, 0.0)),
+        Color(rgb=(0.1234, 0.5, 0.9)),
+        Color(hsv=(0.5, 0.25, 0.75)),
+    ],
+)
+def test_pickle(color):
+    restored = pickle.loads(pickle.dumps(color))
+
+    assert restored == color
+    assert restored.rgb == pytest.approx(color.rgb, abs=1e-15)
+    assert restored.hex_code == color.hex_code
+
+
+def test_pickle_derived_packed():
+    color = Color(rgb=(0.1234, 0.5, 0.9))
+    assert color.packed == 0x1f7fe5
+
+    assert pickle.loads(pickle.dumps(color)).rgb == color.rgb
+
+
+@pytest.mark.parametrize("derive_rgb", [False, True])
+def test_pickle_hsv(derive_rgb):
+    color = Color(hsv=(0.7, 0.3, 0.7))
+    if derive_rgb:
+        assert color.rgb
+
+    restored = pickle.loads(pickle.dumps(color))
+
+    assert restored.hsv == (0.7, 0.3, 0.7)
+    assert restored.rgb == color.rgb
+
+
+def test_pickle_size():
+    compact = len(pickle.dumps(hex_color("c0ffee")))
+
+    assert compact < len(pickle.dumps(Color(rgb=(0.1234, 0.5, 0.9))))
+    assert len(pickle.dumps(Color(rgb=(1.0, 0.2, 0.0)))) == compact
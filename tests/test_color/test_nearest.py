@@ -0,0 +1,76 @@
+import math
+
+import numpy as np
+import pytest
+
+from designtools.color import ColorArray, hex_color
+from designtools.color.nearest import PaletteIndex
+
+PALETTE = tuple(
+    hex_color(code)
+    for code in ("ff0000", "00ff00", "0000ff", "ffffff", "000000", "808080", "ffd500")
+)
+
+
+@pytest.fixture(scope="module")
+def queries():
+    return ColorArray.from_packed(np.random.default_rng(17).integers(0, 1 << 24, 500))
+
+
+def _brute_force(queries, space, k):
+    points = ColorArray.from_colors(PALETTE).coordinates(space)
+    results = []
+    for point in queries.coordinates(space).tolist():
+        distances = [math.dist(point, other) for other in points.tolist()]
+        results.append(sorted(range(len(distances)), key=distances.__getitem__)[:k])
+
+    return np.array(results)
+
+
+@pytest.mark.parametrize("space", ["rgb", "hsv", "oklab", "lab"])
+def test_nearest_query(queries, space):
+    index = PaletteIndex(PALETTE, space, batch_size=64)
+    indexes, distances = index.query(queries)
+    expected = _brute_force(queries, space, 1)[:, 0]
+
+    assert indexes.shape == (len(queries),)
+    assert indexes.tolist() == expected.tolist()
+
+    offsets = queries.coordinates(space) - index.palette.coordinates(space)[expected]
+    assert distances == pytest.approx(np.linalg.norm(offsets, axis=1))
+
+
+@pytest.mark.parametrize("k", [2, 3, len(PALETTE)])
+def test_k_nearest_query(queries, k):
+    indexes, distances = PaletteIndex(PALETTE, "oklab", batch_size=100).query(queries, k)
+
+    assert indexes.shape == distances.shape == (len(queries), k)
+    assert indexes.tolist() == _brute_force(queries, "oklab", k).tolist()
+    assert np.all(np.diff(distances, axis=1) >= 0)
+
+
+def test_nearest_colors():
+    index = PaletteIndex(PALETTE, "rgb")
+    snapped = index.nearest([hex_color("fe0101"), hex_color("fff"), hex_color("777")])
+
+    assert list(snapped) == [hex_color("ff0000"), hex_color("ffffff"), hex_color("808080")]
+    assert index.query([]).indexes.shape == (0,)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"palette": ()},
+        {"palette": PALETTE, "space": "cmyk"},
+        {"palette": PALETTE, "batch_size": 0},
+    ],
+)
+def test_bad_palette_index(params):
+    with pytest.raises(ValueError):
+        PaletteIndex(**params)
+
+
+@pytest.mark.parametrize("k", [0, len(PALETTE) + 1])
+def test_bad_k(k):
+    with pytest.raises(ValueError):
+        PaletteIndex(PALETTE).query(PALETTE, k)
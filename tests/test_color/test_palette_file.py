@@ -0,0 +1,104 @@
+import struct
+
+import numpy as np
+import pytest
+
+from designtools.color import ColorArray, group_colors, hex_color
+from designtools.color.collectors import GRAYS, HUES_BASIC
+from designtools.color.palette_file import (MappedPalette, load_palette, write_grouped_palette,
+                                            write_palette, )
+
+PALETTE = tuple(
+    hex_color(code) for code in ("ff0000", "00ff00", "0000ff", "ffffff", "000000", "c0ffee")
+)
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "palette.dtpl"
+    write_palette(path, PALETTE)
+    palette = load_palette(path)
+
+    assert isinstance(palette.packed, np.memmap)
+    assert tuple(palette) == PALETTE
+    assert palette[5] == hex_color("c0ffee")
+    assert palette[-1] == hex_color("c0ffee")
+    assert palette.group_ids is None
+    assert palette.counts is None
+    assert palette.to_color_array().hex_codes == tuple(color.hex_code for color in PALETTE)
+    assert path.stat().st_size == 16 + 4 * len(PALETTE)
+
+
+def test_round_trip_counts_and_groups(tmp_path):
+    path = tmp_path / "palette.dtpl"
+    group_ids = [0, 1, 0, 1, 2, 1]
+    write_palette(path, ColorArray.from_colors(PALETTE), group_ids, range(6), ("a", "b", "c"))
+    palette = load_palette(path)
+
+    assert tuple(palette) == PALETTE
+    assert palette.group_ids.tolist() == [0, 1, 0, 1, 2, 1]
+    assert palette.counts.tolist() == list(range(6))
+    assert palette.counts.ctypes.data % 8 == 0
+    assert palette.group_names == ("a", "b", "c")
+
+    view = palette[1:4]
+    assert isinstance(view, MappedPalette)
+    assert tuple(view) == PALETTE[1:4]
+    assert view.counts.tolist() == [1, 2, 3]
+
+
+def test_grouped_palette(tmp_path):
+    path = tmp_path / "palette.dtpl"
+    groups = group_colors(PALETTE, GRAYS | HUES_BASIC)
+    write_grouped_palette(path, groups, {PALETTE[0]: 7})
+    palette = load_palette(path)
+
+    assert palette.groups() == {key: tuple(group) for key, group in groups.items()}
+    assert sorted(palette.counts.tolist()) == [0, 0, 0, 0, 0, 7]
+
+
+@pytest.mark.parametrize("groups", [{}, {"": PALETTE[:2]}, {"": (), "a": PALETTE[:1]}])
+def test_grouped_palette_names(tmp_path, groups):
+    path = tmp_path / "palette.dtpl"
+    write_grouped_palette(path, groups)
+
+    assert load_palette(path).groups() == groups
+
+
+def test_empty_palette(tmp_path):
+    path = tmp_path / "palette.dtpl"
+    write_palette(path, (), counts=[])
+    palette = load_palette(path)
+
+    assert len(palette) == 0
+    assert palette.counts.tolist() == []
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"group_ids": [0, 1]},
+        {"group_ids": [0] * 6, "group_names": ()},
+        {"group_ids": [0] * 6, "group_names": ("a\nb",)},
+        {"counts": [1]},
+    ],
+)
+def test_bad_write_palette(tmp_path, params):
+    with pytest.raises(ValueError):
+        write_palette(tmp_path / "palette.dtpl", PALETTE, **params)
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        b"",
+        struct.pack("<4sHHII", b"PNG\x00", 1, 0, 0, 0),
+        struct.pack("<4sHHII", b"DTPL", 2, 0, 0, 0),
+        struct.pack("<4sHHII", b"DTPL", 1, 0, 2, 4),
+    ],
+)
+def test_bad_load_palette(tmp_path, contents):
+    path = tmp_path / "palette.dtpl"
+    path.write_bytes(contents)
+
+    with pytest.raises(ValueError):
+        load_palette(path)
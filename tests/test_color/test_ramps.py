@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from designtools.color import ColorArray, hex_color
+from designtools.color.ramps import (color_ramps, shade_factors, tint_factors, tone_factors,
+                                     transform_palette, )
+
+FACTORS = np.array([(1, 0.5, 1.5), (1, 1.5, 0.5), (2, 1, 1), (0.5, -2, 1), (1, 1, 1)])
+
+
+@pytest.fixture(scope="module")
+def palette():
+    return ColorArray.from_packed(np.random.default_rng(41).integers(0, 1 << 24, 40)).to_colors()
+
+
+@pytest.mark.parametrize("space", ["hsv", "rgb"])
+def test_transform_palette(palette, space):
+    result = transform_palette(palette, FACTORS, space)
+    transform = "hsv_transform" if space == "hsv" else "rgb_transform"
+    expected = [getattr(color, transform)(*row) for color in palette for row in FACTORS.tolist()]
+
+    assert len(result) == len(palette) * len(FACTORS)
+    assert result.hex_codes == tuple(color.hex_code for color in expected)
+    assert result.rgb == pytest.approx(np.array([color.rgb for color in expected]))
+    assert result.hsv == pytest.approx(np.array([color.hsv for color in expected]))
+
+
+def test_color_ramps(palette):
+    ramps = color_ramps(palette, shade_factors(4))
+
+    assert len(ramps) == len(palette)
+    assert all(len(ramp) == 4 for ramp in ramps)
+    assert ramps[0][-1] == hex_color("000")
+    assert ramps[3] == tuple(palette[3].hsv_transform(1, 1, v) for v in (0.75, 0.5, 0.25, 0))
+    assert color_ramps([], shade_factors(4)) == ()
+
+
+def test_tint_ramps(palette):
+    ramps = color_ramps(palette, tint_factors(4), "white")
+    tints = transform_palette(palette, tint_factors(4), "white")
+    rgb = ColorArray.of(palette).rgb
+    amounts = np.array([0.25, 0.5, 0.75, 1])
+    expected = rgb[:, np.newaxis, :] + (1 - rgb[:, np.newaxis, :]) * amounts[:, np.newaxis]
+
+    assert all(ramp[-1] == hex_color("fff") for ramp in ramps)
+    assert tints.rgb == pytest.approx(expected.reshape(-1, 3))
+    assert color_ramps([hex_color("000")], tint_factors(1), "white") == ((hex_color("fff"),),)
+
+
+def test_ramp_factors():
+    assert shade_factors(2).tolist() == [[1, 1, 0.5], [1, 1, 0]]
+    assert tint_factors(2).tolist() == [[0.5, 0.5, 0.5], [0, 0, 0]]
+    assert tone_factors(4).tolist() == [[1, 0.75, 1], [1, 0.5, 1], [1, 0.25, 1], [1, 0, 1]]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"factors": FACTORS, "space": "lab"},
+        {"factors": [1, 1, 1]},
+        {"factors": [(1, 1)]},
+    ],
+)
+def test_bad_transform_palette(palette, params):
+    with pytest.raises(ValueError):
+        transform_palette(palette, **params)
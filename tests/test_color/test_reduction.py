@@ -0,0 +1,46 @@
+import math
+
+import numpy as np
+import pytest
+
+from designtools.color import ColorArray, hex_color
+from designtools.color.reduction import reduce_palette
+
+
+@pytest.fixture(scope="module")
+def colors():
+    return ColorArray.from_packed(np.random.default_rng(29).integers(0, 1 << 24, 3000)).to_colors()
+
+
+def test_reduce_palette_merges_near_duplicates():
+    colors = [hex_color(code) for code in ("ff0000", "fe0101", "0000ff", "ff0101", "0101fe", "fff")]
+    reduced = reduce_palette(colors, 0.02)
+
+    assert reduced.colors == (hex_color("ff0000"), hex_color("0000ff"), hex_color("fff"))
+    assert reduced.mapping[hex_color("fe0101")] == hex_color("ff0000")
+    assert reduced.mapping[hex_color("0101fe")] == hex_color("0000ff")
+    assert reduced.mapping[hex_color("fff")] == hex_color("fff")
+
+
+@pytest.mark.parametrize("space, threshold", [("oklab", 0.05), ("lab", 5.0), ("rgb", 0.1)])
+def test_reduce_palette_invariants(colors, space, threshold):
+    reduced = reduce_palette(colors, threshold, space)
+    points = {
+        color: point for color, point in
+        zip(colors, ColorArray.from_colors(colors).coordinates(space).tolist())
+    }
+
+    assert set(reduced.mapping) == set(colors)
+    assert set(reduced.mapping.values()) == set(reduced.colors)
+    assert all(math.dist(points[c], points[r]) < threshold for c, r in reduced.mapping.items())
+
+    # Representatives are never within the threshold of each other.
+    reps = np.array([points[color] for color in reduced.colors])
+    distances = np.linalg.norm(reps[:, np.newaxis] - reps[np.newaxis], axis=-1)
+    assert np.all(distances[np.triu_indices(len(reps), k=1)] >= threshold)
+
+
+@pytest.mark.parametrize("params", [{"threshold": 0}, {"threshold": 0.1, "space": "cmyk"}])
+def test_bad_reduce_palette(params):
+    with pytest.raises(ValueError):
+        reduce_palette([hex_color("fff")], **params)
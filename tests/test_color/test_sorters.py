@@ -1,9 +1,12 @@
 from random import shuffle
 
+import numpy as np
 import pytest
 
-from designtools.color import hsv_color
-from designtools.color.sorters import saturation_key
+from designtools.color import ColorArray, hex_color, hsv_color
+from designtools.color.sorters import (apply_order, hlv_step_sort_key, hlv_step_sort_order,
+                                       luminance_sort_key, luminance_sort_order, saturation_key,
+                                       saturation_order, value_key, value_order, )
 
 
 @pytest.fixture(scope="module")
@@ -24,3 +27,39 @@ def test_saturation_sort(colors):
     shuffle(mixed_data)
     result = sorted(mixed_data, key=saturation_key)
     assert result == list(colors)
+
+
+@pytest.fixture(scope="module")
+def palette():
+    rng = np.random.default_rng(11)
+    codes = [f"{value:06x}" for value in rng.integers(0, 1 << 24, 200)]
+    # Include duplicates and grays so that ties have to keep their original order.
+    codes += codes[:20] + ["808080", "000", "fff", "808080"]
+    return tuple(hex_color(code) for code in codes)
+
+
+@pytest.mark.parametrize(
+    "order, key",
+    [
+        (saturation_order, saturation_key),
+        (value_order, value_key),
+        (luminance_sort_order, luminance_sort_key),
+        (hlv_step_sort_order, hlv_step_sort_key),
+    ],
+)
+@pytest.mark.parametrize("reverse", [False, True])
+def test_sort_order(palette, order, key, reverse):
+    expected = sorted(palette, key=key, reverse=reverse)
+    permutation = order(palette, reverse=reverse)
+
+    assert [palette[index] for index in permutation] == expected
+    assert list(apply_order(palette, permutation)) == expected
+    assert list(apply_order(ColorArray.from_colors(palette), permutation)) == expected
+
+
+@pytest.mark.parametrize("repetitions", [1, 3, 8, 16])
+def test_hlv_step_sort_repetitions(palette, repetitions):
+    expected = sorted(palette, key=lambda c: hlv_step_sort_key(c, repetitions))
+    permutation = hlv_step_sort_order(ColorArray.from_colors(palette), repetitions)
+
+    assert list(apply_order(palette, permutation)) == expected
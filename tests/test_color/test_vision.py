@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from designtools.color import ColorArray, delinearize, delinearize_array, hex_color, linearize
+from designtools.color.vision import CVD_TYPES, cvd_matrix, simulate_cvd, simulate_cvd_array
+
+PALETTE = [
+    hex_color(code) for code in ("f00", "0f0", "00f", "fff", "000", "777", "c0ffee", "8a2be2")
+]
+
+
+def test_delinearize():
+    values = np.linspace(0, 1, 101)
+
+    assert delinearize_array(values).tolist() == pytest.approx([delinearize(v) for v in values])
+    assert [delinearize(linearize(v)) for v in values] == pytest.approx(values.tolist())
+
+
+@pytest.mark.parametrize("deficiency", CVD_TYPES)
+def test_simulate_cvd_grays(deficiency):
+    grays = [hex_color(code) for code in ("000", "333", "777", "ccc", "fff")]
+
+    # Every simulation matrix maps neutral colors to themselves.
+    assert simulate_cvd(grays, deficiency).hex_codes == tuple(color.hex_code for color in grays)
+
+
+@pytest.mark.parametrize("deficiency", CVD_TYPES)
+def test_simulate_cvd_severity(deficiency):
+    palette = ColorArray.from_colors(PALETTE)
+
+    assert simulate_cvd(palette, deficiency, 0).hex_codes == palette.hex_codes
+    assert simulate_cvd(palette, deficiency, 0.5).rgb == pytest.approx(
+        simulate_cvd_array(palette.rgb, deficiency, 0.5)
+    )
+    assert cvd_matrix(deficiency, 0.25) == pytest.approx(
+        0.75 * np.identity(3) + 0.25 * cvd_matrix(deficiency)
+    )
+
+
+def test_simulate_cvd():
+    protan = simulate_cvd(PALETTE, "protanopia")
+    deutan = simulate_cvd(PALETTE, "deuteranopia")
+
+    assert len(protan) == len(PALETTE)
+    # Red and green collapse towards yellowish colors under red-green deficiencies.
+    for simulated in (protan, deutan):
+        red, green = simulated.hsv[:2]
+        assert red[0] == pytest.approx(green[0], abs=0.05)
+    assert np.all((protan.rgb >= 0) & (protan.rgb <= 1))
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"deficiency": "achromatopsia"},
+        {"deficiency": "protanopia", "severity": -0.1},
+        {"deficiency": "tritanopia", "severity": 1.5},
+    ],
+)
+def test_bad_simulate_cvd(params):
+    with pytest.raises(ValueError):
+        simulate_cvd(PALETTE, **params)
@@ -0,0 +1,83 @@
+"""Writes PNG files with chosen filters and chunk sizes for testing the decoder."""
+import struct
+import zlib
+
+import numpy as np
+
+from designtools.graphics.extractors import PNG_SIGNATURE
+
+
+def _chunk(chunk_type: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(
+        ">I", zlib.crc32(chunk_type + data)
+    )
+
+
+def _paeth(a: int, b: int, c: int) -> int:
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    return b if pb <= pc else c
+
+
+def _filter_row(filter_type: int, row: bytes, previous: bytes, pixel_bytes: int) -> bytes:
+    out = bytearray([filter_type])
+    for index, value in enumerate(row):
+        a = row[index - pixel_bytes] if index >= pixel_bytes else 0
+        b = previous[index]
+        c = previous[index - pixel_bytes] if index >= pixel_bytes else 0
+        predicted = (0, a, b, (a + b) // 2, _paeth(a, b, c))[filter_type]
+        out.append((value - predicted) & 0xff)
+
+    return bytes(out)
+
+
+def encode_png(
+    samples: np.ndarray,
+    color_type: int,
+    bit_depth: int = 8,
+    filters=(0, 1, 2, 3, 4),
+    palette: bytes | None = None,
+    transparency: bytes | None = None,
+    idat_size: int = 97,
+) -> bytes:
+    """Encodes ``(height, width, channels)`` samples, cycling through ``filters`` row by row and
+    splitting the compressed data into IDAT chunks of ``idat_size`` bytes."""
+    height, width, channels = samples.shape
+    if bit_depth == 16:
+        rows = [row.astype(">u2").tobytes() for row in samples]
+    elif bit_depth < 8:
+        per_byte = 8 // bit_depth
+        rows = []
+        for row in samples.reshape(height, width):
+            padded = np.zeros(-(-width // per_byte) * per_byte, dtype=np.uint8)
+            padded[:width] = row
+            groups = padded.reshape(-1, per_byte)
+            shifts = np.arange(8 - bit_depth, -1, -bit_depth)
+            rows.append(bytes((groups << shifts).sum(axis=1).astype(np.uint8)))
+    else:
+        rows = [row.astype(np.uint8).tobytes() for row in samples]
+
+    pixel_bytes = max(1, channels * bit_depth // 8)
+    previous = bytes(len(rows[0]))
+    raw = bytearray()
+    for index, row in enumerate(rows):
+        raw += _filter_row(filters[index % len(filters)], row, previous, pixel_bytes)
+        previous = row
+
+    compressed = zlib.compress(bytes(raw))
+    header = struct.pack(">IIBBBBB", width, height, bit_depth, color_type, 0, 0, 0)
+    chunks = [_chunk(b"IHDR", header)]
+    if palette is not None:
+        chunks.append(_chunk(b"PLTE", palette))
+    if transparency is not None:
+        chunks.append(_chunk(b"tRNS", transparency))
+    chunks.append(_chunk(b"tEXt", b"Comment\x00test"))
+    chunks.extend(
+        _chunk(b"IDAT", compressed[start:start + idat_size])
+        for start in range(0, len(compressed), idat_size)
+    )
+    chunks.append(_chunk(b"IEND", b""))
+
+    return PNG_SIGNATURE + b"".join(chunks)
@@ -0,0 +1,118 @@
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from designtools.color import ColorCount, packed_color
+from designtools.graphics.extractors import (CSS_SCANNER, HEX_SCANNER, SpaceSaving,
+                                             color_counts_from_files, tally_file, tally_files, )
+
+
+def _zipf_stream(size, distinct, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.zipf(1.5, size) % distinct
+
+
+def test_exact_counts():
+    sketch = SpaceSaving(None)
+    sketch.update([3, 1, 3, 2, 3])
+    sketch.update([1, 2], [10, 1])
+
+    assert sketch.top() == [(1, 11), (3, 3), (2, 2)]
+    assert sketch.total == 16
+    assert sketch.error(1) == 0
+
+
+def test_space_saving_guarantees():
+    stream = _zipf_stream(100_000, 5000)
+    exact = Counter(stream.tolist())
+    sketch = SpaceSaving(100)
+    for batch in np.array_split(stream, 37):
+        sketch.update(batch)
+
+    assert len(sketch) == 100
+    assert sketch.total == len(stream)
+    bound = len(stream) / 100
+    for value in sketch.top():
+        value = value[0]
+        assert exact[value] <= sketch.count(value) <= exact[value] + sketch.error(value)
+        assert sketch.error(value) <= bound
+    # Every value that occurs more than total / capacity times is tracked.
+    assert all(value in sketch for value, count in exact.items() if count > bound)
+    # The most common values are ranked correctly.
+    assert [value for value, _ in sketch.top(5)] == [value for value, _ in exact.most_common(5)]
+
+
+def test_merge():
+    stream = _zipf_stream(50_000, 2000, 1)
+    exact = Counter(stream.tolist())
+    first, second = SpaceSaving(64), SpaceSaving(64)
+    first.update(stream[:20_000])
+    second.update(stream[20_000:])
+    first.merge(second)
+
+    assert len(first) == 64
+    assert first.total == len(stream)
+    for value, count in first.top():
+        assert exact[value] <= count <= exact[value] + first.error(value)
+    assert [value for value, _ in first.top(3)] == [value for value, _ in exact.most_common(3)]
+
+
+def test_top_filters():
+    sketch = SpaceSaving(None)
+    sketch.update([5, 5, 5, 4, 4, 9, 8, 8])
+
+    assert sketch.top(2) == [(5, 3), (4, 2)]
+    assert sketch.top(min_count=2) == [(5, 3), (4, 2), (8, 2)]
+    assert sketch.top(1, min_count=4) == []
+
+
+def test_bad_capacity():
+    with pytest.raises(ValueError):
+        SpaceSaving(0)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1 << 20])
+def test_tally(chunk_size):
+    text = b"a{color:#fff}b{color:#FFFFFF}c{color:#c0ffee;background:#c0ffee}\n#000"
+    tallied = Counter()
+    for values, counts in HEX_SCANNER.tally(text, chunk_size):
+        # Different tokens for the same color are counted separately within a chunk.
+        for value, count in zip(values.tolist(), counts.tolist()):
+            tallied[value] += count
+
+    assert tallied == {0xffffff: 2, 0xc0ffee: 2, 0x000000: 1}
+
+
+def test_tally_css_drops_words():
+    values = [
+        (value, count) for chunk in CSS_SCANNER.tally(b"color: red; border: 1px solid red; x: y")
+        for value, count in zip(*chunk)
+    ]
+
+    assert values == [(0xff0000, 2)]
+
+
+def test_tally_files(tmp_path):
+    for index in range(6):
+        (tmp_path / f"{index}.css").write_text(
+            "a{color:#c0ffee}" * (index + 1) + f"b{{color:#00000{index}}}"
+        )
+    (tmp_path / "empty.css").write_text("")
+    files = sorted(str(path) for path in tmp_path.iterdir())
+
+    single = tally_file(files[0])
+    assert single.top() == [(0, 1), (0xc0ffee, 1)]
+
+    for workers in (1, 3):
+        sketch = tally_files(files, workers=workers, capacity=None)
+        assert sketch.count(0xc0ffee) == 21
+        assert sketch.total == 27
+
+    # Estimates with a small capacity don't depend on the number of workers.
+    estimates = [tally_files(files, workers=workers, capacity=2) for workers in (1, 2, 3)]
+    assert estimates[0].top() == estimates[1].top() == estimates[2].top()
+
+    counted = color_counts_from_files([str(tmp_path)], workers=1, top=2)
+    assert counted == (ColorCount(packed_color(0xc0ffee), 21), ColorCount(packed_color(0), 1))
+    assert color_counts_from_files([str(tmp_path)], workers=1, min_count=2) == counted[:1]
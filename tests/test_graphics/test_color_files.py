@@ -0,0 +1,64 @@
+import pytest
+
+from designtools.color import hex_to_packed
+from designtools.graphics.extractors import colors_from_files, find_files, scan_files
+
+FILES = {
+    "a.css": ".a { color: #f00; background: #c0ffee; }",
+    "styles/b.scss": "$b: #00ff00; $c: #F00;",
+    "styles/deep/c.svg": '<rect fill="#0000ff" stroke="#123"/>',
+    "styles/deep/d.tsx": "const e = '#abcdef';",
+    "notes.md": "#fedcba",
+}
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for name, text in FILES.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+
+    return tmp_path
+
+
+def test_find_files(tree):
+    found = find_files([str(tree)])
+
+    assert found == sorted(found)
+    assert [name[len(str(tree)) + 1:] for name in found] == sorted(
+        name for name in FILES if not name.endswith(".md")
+    )
+    assert find_files([str(tree / "styles" / "**" / "*.s*")]) == [
+        str(tree / "styles" / "b.scss"), str(tree / "styles" / "deep" / "c.svg")
+    ]
+    assert find_files([str(tree / "notes.md"), str(tree / "*.md")]) == [str(tree / "notes.md")]
+    assert find_files([str(tree)], ("*.md",)) == [str(tree / "notes.md")]
+
+
+def test_find_missing_files(tree):
+    with pytest.raises(FileNotFoundError):
+        find_files([str(tree / "missing.css")])
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3])
+def test_scan_files(tree, workers):
+    expected = sorted({
+        hex_to_packed(code) for code in ("f00", "c0ffee", "00ff00", "0000ff", "123", "abcdef")
+    })
+
+    assert scan_files(find_files([str(tree)]), workers=workers).tolist() == expected
+
+
+def test_colors_from_files(tree):
+    colors = colors_from_files([str(tree)], workers=2)
+
+    assert colors == colors_from_files([str(tree)], workers=1)
+    assert list(colors) == sorted(colors)
+    assert len(colors_from_files([str(tree)], ("*.md",))) == 1
+    assert scan_files([]).tolist() == []
+
+
+def test_bad_scan_files(tree):
+    with pytest.raises(ValueError):
+        scan_files(find_files([str(tree)]), workers=0)
@@ -0,0 +1,94 @@
+import re
+
+import numpy as np
+import pytest
+
+from designtools.color import hex_to_packed
+from designtools.graphics.extractors import (HEX_SCANNER, ColorScanner, colors_from_mapped_text,
+                                             colors_from_text, scan_file, )
+
+TEXT = (
+    "body { color: #FFF; background: #c0ffee; }\n"
+    ".a{border:1px solid #12345678}.b{color:#abcd}.c{color:#ABCDEF} #xyz #12 #0f0f0f\n"
+) * 3
+
+
+@pytest.fixture
+def text_file(tmp_path):
+    path = tmp_path / "colors.css"
+    path.write_text(TEXT)
+
+    return str(path)
+
+
+def _expected(text):
+    codes = re.findall(r"(#[0-9a-f]{6}|#[0-9a-f]{3})", text, re.I)
+    return sorted({hex_to_packed(code) for code in codes})
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 11, 64, 1 << 20])
+def test_scan_chunk_boundaries(chunk_size):
+    buffer = TEXT.encode()
+
+    assert HEX_SCANNER.scan(buffer, chunk_size).tolist() == _expected(TEXT)
+
+
+def test_scan_straddling_matches():
+    # Every chunk boundary splits a color, and each color runs straight into the next one.
+    text = "#123456#abcdef#fff#000000"
+    values = HEX_SCANNER.scan(text.encode(), 4).tolist()
+
+    assert values == _expected(text)
+    assert HEX_SCANNER.tokens(text.encode(), 4) == {b"#123456", b"#abcdef", b"#fff", b"#000000"}
+
+
+def test_scan_file(text_file, tmp_path):
+    assert scan_file(text_file).tolist() == _expected(TEXT)
+    assert scan_file(text_file, chunk_size=16).dtype == np.uint32
+
+    empty = tmp_path / "empty.css"
+    empty.write_bytes(b"")
+    assert scan_file(str(empty)).tolist() == []
+
+
+def test_colors_from_mapped_text(text_file):
+    colors = colors_from_mapped_text(text_file)
+
+    assert set(colors) == set(colors_from_text(text_file))
+    assert list(colors) == sorted(colors)
+
+
+def test_custom_scanner():
+    scanner = ColorScanner(
+        re.compile(rb"0x[0-9a-f]{6}"), 8, lambda tokens: np.array([int(t, 16) for t in tokens])
+    )
+
+    assert scanner.scan(b"0x00ff00 0x00ff00, 0xff0000", 5).tolist() == [0x00ff00, 0xff0000]
+
+
+def test_scanner_words():
+    scanner = ColorScanner(
+        re.compile(rb"0x[0-9a-f]{6}"), 12, lambda tokens: np.array([len(t) for t in tokens]), b";",
+        words=[b"Teal", b"tomato"],
+    )
+    text = b"TEAL;xteal teal-x #teal tomato2 (teal) 0x000001 TOMATO"
+
+    for chunk_size in (1, 2, 3, 5, 7, 1 << 20):
+        assert scanner.tokens(text, chunk_size) == {b"teal", b"tomato", b"0x000001"}
+        assert sum(counts.sum() for _, counts in scanner.tally(text, chunk_size)) == 4
+
+
+@pytest.mark.parametrize("params", [{"chunk_size": 0}, {"chunk_size": -4}])
+def test_bad_scan(params):
+    with pytest.raises(ValueError):
+        HEX_SCANNER.scan(b"#fff", **params)
+
+
+@pytest.mark.parametrize("params", [
+    {"max_length": 0},
+    {"max_length": 4, "words": [b"navy"]},
+    {"max_length": 8, "separators": b"-", "words": [b"navy"]},
+])
+def test_bad_scanner(params):
+    with pytest.raises(ValueError):
+        ColorScanner(re.compile(rb"#"), parse=lambda tokens: np.array([]), **params)
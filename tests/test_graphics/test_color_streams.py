@@ -0,0 +1,182 @@
+import bz2
+import gzip
+import io
+import lzma
+import sys
+import tarfile
+import zipfile
+
+import pytest
+
+from designtools.graphics.extractors import (CSS_SCANNER, HEX_SCANNER, STDIN, colors_from_stream,
+                                             is_stream_source, open_streams, scan_source,
+                                             tally_source, )
+
+CSS = b".a { color: #C0FFEE; border: 1px solid #fff }\n.b{background:#123456;color:#fff}\n" * 3
+CSS_EXPECTED = [0x123456, 0xc0ffee, 0xffffff]
+
+NAMED = b"xred red;\nnavy-blue navy #tan tan" * 7
+
+
+class _Pipe(io.RawIOBase):
+    """A stream that can't seek, like standard input."""
+
+    def __init__(self, data: bytes):
+        self._data = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._data.read(min(len(buffer), 5))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def _tar(members: dict[str, bytes], mode: str = "w") -> bytes:
+    out = io.BytesIO()
+    with tarfile.open(fileobj=out, mode=mode) as archive:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return out.getvalue()
+
+
+def _zip(members: dict[str, bytes]) -> bytes:
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return out.getvalue()
+
+
+@pytest.mark.parametrize("scanner, text", [
+    (HEX_SCANNER, CSS), (CSS_SCANNER, CSS), (CSS_SCANNER, NAMED),
+])
+@pytest.mark.parametrize("block_size", [1, 2, 5, 13, 64, 1 << 20])
+def test_scan_stream_matches_buffer(scanner, text, block_size):
+    expected = scanner.scan(text)
+
+    assert scanner.scan_stream(io.BytesIO(text), block_size).tolist() == expected.tolist()
+    assert scanner.scan_stream(_Pipe(text), block_size).tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 8, 1 << 20])
+def test_tally_stream_matches_buffer(block_size):
+    def totals(tallies):
+        counted = {}
+        for values, counts in tallies:
+            for value, count in zip(values.tolist(), counts.tolist()):
+                counted[value] = counted.get(value, 0) + count
+        return counted
+
+    assert totals(CSS_SCANNER.tally_stream(io.BytesIO(NAMED), block_size)) == totals(
+        CSS_SCANNER.tally(NAMED)
+    )
+    assert totals(HEX_SCANNER.tally_stream(io.BytesIO(CSS), block_size)) == {
+        0xc0ffee: 3, 0xffffff: 6, 0x123456: 3
+    }
+
+
+def test_scan_stream_lookbehind():
+    # "xred" must not be found as "red" when a block starts between "x" and "r".
+    assert CSS_SCANNER.scan_stream(io.BytesIO(b"xred xred"), 1).tolist() == []
+
+
+def test_scan_stream_bad_block_size():
+    with pytest.raises(ValueError):
+        HEX_SCANNER.scan_stream(io.BytesIO(CSS), 0)
+
+
+@pytest.mark.parametrize("name, compress", [
+    ("colors.css.gz", gzip.compress),
+    ("colors.css.bz2", bz2.compress),
+    ("colors.css.xz", lzma.compress),
+    ("colors.txt", lambda data: data),
+])
+def test_scan_compressed(tmp_path, name, compress):
+    path = tmp_path / name
+    path.write_bytes(compress(CSS))
+
+    assert scan_source(str(path)).tolist() == CSS_EXPECTED
+
+
+def test_scan_tar_gz(tmp_path):
+    path = tmp_path / "site.tar.gz"
+    path.write_bytes(_tar({
+        "site/a.css": b"#c0ffee;",
+        "site/b.html": b"<p style='color: #FFF'>",
+        "site/c.bin": b"#123456",
+        "site/d.css.bz2": bz2.compress(b"#000000"),
+    }, "w:gz"))
+
+    assert scan_source(str(path)).tolist() == [0x000000, 0xc0ffee, 0xffffff]
+    assert scan_source(str(path), patterns=("*.bin",)).tolist() == [0x123456]
+    assert [name for name, _ in open_streams(str(path))] == [
+        f"{path}/site/a.css", f"{path}/site/b.html", f"{path}/site/d.css.bz2",
+    ]
+
+
+def test_scan_zip(tmp_path):
+    path = tmp_path / "theme.zip"
+    path.write_bytes(_zip({
+        "theme/a.css": b"#c0ffee", "theme/b.json": b'"#fff"', "b.bin": b"#123",
+    }))
+
+    assert scan_source(str(path)).tolist() == [0xc0ffee, 0xffffff]
+
+
+def test_scan_zip_in_tar(tmp_path):
+    path = tmp_path / "bundle.tar.gz"
+    path.write_bytes(_tar({"inner.zip": _zip({"a.css": b"#c0ffee"}), "b.css": b"#fff"}, "w:gz"))
+
+    with pytest.warns(UserWarning, match="inner.zip"):
+        assert scan_source(str(path)).tolist() == [0xffffff]
+
+
+def test_scan_zip_in_zip(tmp_path):
+    path = tmp_path / "bundle.zip"
+    path.write_bytes(_zip({"inner.zip": _zip({"a.css": b"#c0ffee"}), "b.css": b"#fff"}))
+
+    assert scan_source(str(path)).tolist() == [0xc0ffee, 0xffffff]
+
+
+def test_stdin(monkeypatch):
+    stdin = io.TextIOWrapper(_Pipe(gzip.compress(_tar({"a.css": CSS}))))
+    monkeypatch.setattr(sys, "stdin", stdin)
+
+    assert scan_source(STDIN).tolist() == CSS_EXPECTED
+
+
+def test_stdin_zip(monkeypatch):
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(_Pipe(_zip({"a.css": CSS}))))
+
+    with pytest.raises(ValueError):
+        scan_source(STDIN)
+
+
+def test_tally_source(tmp_path):
+    path = tmp_path / "colors.tgz"
+    path.write_bytes(_tar({"a.css": CSS, "b.css": b"#FFFFFF"}, "w:gz"))
+
+    sketch = tally_source(str(path), CSS_SCANNER)
+
+    assert sketch.top() == [(0xffffff, 7), (0x123456, 3), (0xc0ffee, 3)]
+
+
+def test_is_stream_source(tmp_path):
+    (tmp_path / "a.css.gz").write_bytes(gzip.compress(CSS))
+    (tmp_path / "a.css").write_bytes(CSS)
+
+    assert is_stream_source(STDIN)
+    assert is_stream_source(str(tmp_path / "a.css.gz"))
+    assert not is_stream_source(str(tmp_path / "a.css"))
+    assert not is_stream_source(str(tmp_path / "missing.zip"))
+
+
+def test_colors_from_stream(tmp_path):
+    path = tmp_path / "colors.css.xz"
+    path.write_bytes(lzma.compress(CSS))
+
+    assert [color.packed for color in colors_from_stream(str(path))] == CSS_EXPECTED
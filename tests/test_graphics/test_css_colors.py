@@ -0,0 +1,89 @@
+import pytest
+
+from designtools.graphics.extractors import (CSS_MAX_LENGTH, CSS_NAMED_COLORS, CSS_SCANNER,
+                                             css_colors_from_text, parse_css_color, )
+
+TEXT = (
+    ".a { color: #C0FFEE; background: #12345678; border-color: #abcd #fff; }\n"
+    ".b { color: rgb(255, 0, 0); fill: rgba(0 128 255 / 50%); stroke: RGB(100%,50%,0%); }\n"
+    ".c { color: hsl(120deg, 100%, 25%); background: hsla(0.5turn 50% 50% / .5); }\n"
+    ".d { color: RebeccaPurple; outline: 1px solid navy }\n"
+    ".text-red, #tan, .gold-star { --red: 1; color: var(--teal); font: bold 12px serif; }\n"
+    "#12345 #ggg #abcdefg url(#c0ffee) transparent currentColor\n"
+)
+
+EXPECTED = {
+    0xc0ffee, 0x123456, 0xaabbcc, 0xffffff, 0xff0000, 0x0080ff, 0xff8000, 0x008000, 0x40bfbf,
+    0x663399, 0x000080,
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 16, 61, 1 << 20])
+def test_scan_chunk_boundaries(chunk_size):
+    assert set(CSS_SCANNER.scan(TEXT.encode(), chunk_size).tolist()) == EXPECTED
+
+
+def test_tokens():
+    tokens = CSS_SCANNER.tokens(b"a{color:red;fill:hsl(0,0%,0%)}.red-box{--red:#f00}")
+
+    assert tokens == {b"red", b"hsl(0,0%,0%)", b"#f00"}
+
+
+@pytest.mark.parametrize("text", [
+    b"text-red", b"--red", b"red-text", b"red_1", b"#red", b"reddish", b"#c0ffee0", b"#c0ffeeg",
+])
+def test_no_match(text):
+    assert CSS_SCANNER.tokens(text) == set()
+
+
+def test_max_length():
+    longest = b"rgba( +100.123456% , +100.123456% , +100.123456% / +100.123456% )"
+    text = b"color: " + longest + b"\n"
+
+    assert len(longest) <= CSS_MAX_LENGTH
+    assert CSS_SCANNER.tokens(text, 9) == {longest}
+    # Functions spanning lines aren't matched.
+    assert CSS_SCANNER.tokens(b"rgb(0,\n0, 0)") == set()
+
+
+@pytest.mark.parametrize("color, expected", [
+    ("#c0ffee", 0xc0ffee),
+    ("#C0FFEE80", 0xc0ffee),
+    ("#fc0", 0xffcc00),
+    ("#fc08", 0xffcc00),
+    (b"rgb(255, 128, 0)", 0xff8000),
+    ("rgb(100%,50%,0%)", 0xff8000),
+    ("rgba(0 0 255 / 0.5)", 0x0000ff),
+    ("rgb(300, -20, 0)", 0xff0000),
+    ("hsl(120deg, 100%, 25%)", 0x008000),
+    ("hsl(120, 100%, 25%)", 0x008000),
+    ("hsl(0.5turn 50% 50%)", 0x40bfbf),
+    ("hsla(-240, 100%, 50%, 1)", 0x00ff00),
+    ("hsl(0, 0%, 100%)", 0xffffff),
+    ("RebeccaPurple", 0x663399),
+    ("grey", 0x808080),
+])
+def test_parse_css_color(color, expected):
+    assert parse_css_color(color) == expected
+
+
+@pytest.mark.parametrize("color", ["hsl(50%, 50%, 50%)", "rgb(1, 2)", "#ggg", "transparent"])
+def test_parse_bad_css_color(color):
+    assert parse_css_color(color) is None
+
+
+def test_named_colors():
+    assert len(CSS_NAMED_COLORS) == 148
+    text = " ".join(CSS_NAMED_COLORS).encode()
+
+    assert CSS_SCANNER.tokens(text) == {name.encode() for name in CSS_NAMED_COLORS}
+
+
+def test_css_colors_from_text(tmp_path):
+    path = tmp_path / "colors.css"
+    path.write_text(TEXT)
+
+    colors = css_colors_from_text(str(path))
+
+    assert {color.packed for color in colors} == EXPECTED
+    assert list(colors) == sorted(colors)
@@ -0,0 +1,124 @@
+import hashlib
+import os
+import re
+
+import numpy as np
+import pytest
+
+from designtools.graphics.extractors import (HEX_SCANNER, ColorScanner, ExtractionCache, find_files,
+                                             scan_file, scan_files, scan_for_cache, )
+from designtools.graphics.extractors import _extraction_cache
+
+FILES = {
+    "a.css": ".a { color: #f00; background: #c0ffee; }",
+    "b.scss": "$b: #00ff00;",
+    "c.svg": '<rect fill="#0000ff"/>',
+}
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for name, text in FILES.items():
+        (tmp_path / name).write_text(text)
+
+    return tmp_path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with ExtractionCache(tmp_path / "cache" / "extraction.db") as cache:
+        yield cache
+
+
+def test_cache_hits(tree, cache):
+    files = find_files([str(tree)])
+    expected = scan_files(files, workers=1).tolist()
+
+    assert scan_files(files, workers=1, cache=cache).tolist() == expected
+    assert cache.info() == (0, 3, 0, 3, 3)
+    assert scan_files(files, workers=2, cache=cache).tolist() == expected
+    assert cache.info() == (3, 3, 3, 3, 3)
+
+
+def test_cache_changed_files(tree, cache):
+    files = find_files([str(tree)])
+    scan_files(files, workers=1, cache=cache)
+
+    # Touching a file keeps its entry because the content hash still matches.
+    os.utime(tree / "a.css", ns=(1, 1))
+    (tree / "b.scss").write_text("$b: #ffffff; $d: #123456;")
+
+    found, missing = cache.lookup(files, HEX_SCANNER)
+    assert [os.path.basename(state.path) for state in missing] == ["b.scss"]
+    assert len(found) == 2
+
+    assert 0x123456 in scan_files(files, workers=1, cache=cache).tolist()
+    assert 0x00ff00 not in scan_files(files, workers=1, cache=cache).tolist()
+
+
+def test_scan_for_cache(tree):
+    path = tree / "a.css"
+    scanned = scan_for_cache(str(path))
+
+    assert scanned.state == (str(path), path.stat().st_size, path.stat().st_mtime_ns)
+    assert scanned.digest == hashlib.blake2b(path.read_bytes()).digest()
+    assert scanned.colors.tolist() == scan_file(str(path)).tolist()
+
+
+def test_cache_stores_scanned_digest(tree, cache, monkeypatch):
+    files = find_files([str(tree)])
+
+    def read_again(path):
+        raise AssertionError(f"'{path}' was read again to hash it.")
+
+    monkeypatch.setattr(_extraction_cache, "_digest", read_again)
+    scan_files(files, workers=2, cache=cache)
+    monkeypatch.undo()
+
+    os.utime(tree / "a.css", ns=(1, 1))
+    found, missing = cache.lookup(files, HEX_SCANNER)
+    assert (len(found), missing) == (3, [])
+
+
+def test_cache_per_scanner(tree, cache):
+    files = find_files([str(tree)])
+    scanner = ColorScanner(
+        re.compile(rb"#[0-9a-f]{6}"), 7, lambda tokens: np.array([int(t[1:], 16) for t in tokens])
+    )
+
+    scan_files(files, workers=1, cache=cache)
+    assert scan_files(files, scanner, workers=1, cache=cache).tolist() == [0xff, 0xff00, 0xc0ffee]
+    assert cache.info().misses == 6
+
+
+def test_cache_per_scanner_words(tree, cache):
+    (tree / "d.css").write_text(".d { color: red; }")
+    files = find_files([str(tree)])
+    pattern = re.compile(rb"#[0-9a-f]{6}")
+
+    def parse(tokens):
+        return np.array([0xff0000 if t == b"red" else int(t[1:], 16) for t in tokens])
+
+    plain = ColorScanner(pattern, 7, parse)
+    named = ColorScanner(pattern, 7, parse, words=[b"red"])
+
+    assert scan_files(files, plain, workers=1, cache=cache).tolist() == [0xff, 0xff00, 0xc0ffee]
+    assert 0xff0000 in scan_files(files, named, workers=1, cache=cache).tolist()
+    assert cache.info().misses == 8
+
+
+def test_cache_persists_and_clears(tree, tmp_path):
+    files = find_files([str(tree)])
+    path = tmp_path / "extraction.db"
+
+    with ExtractionCache(path) as cache:
+        scan_files(files, workers=1, cache=cache)
+
+    with ExtractionCache(path) as cache:
+        scan_files(files, workers=1, cache=cache)
+        assert cache.info() == (3, 0, 3, 3, 3)
+
+        cache.clear()
+        assert cache.info() == (0, 0, 0, 0, 0)
+        scan_files(files, workers=1, cache=cache)
+        assert cache.info().misses == 3
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from designtools.color import packed_color
+from designtools.graphics.extractors import (ColorCount, color_histogram, colors_from_image,
+                                             image_palette, median_cut, )
+from .png_util import encode_png
+
+COLORS = np.array([[0xc0, 0xff, 0xee], [0x33, 0x66, 0x99], [0xff, 0x00, 0x00], [0x10, 0x10, 0x10]])
+
+
+@pytest.fixture
+def image_file(tmp_path):
+    # 60 rows of the first color, then 30, 20, and 10 rows of the others, plus a transparent row.
+    rows = np.repeat(np.arange(4), [60, 30, 20, 10])
+    rgba = np.full((121, 9, 4), 0xff, dtype=np.uint8)
+    rgba[:120, :, :3] = COLORS[rows][:, np.newaxis]
+    rgba[120] = [1, 2, 3, 0]
+    path = tmp_path / "image.png"
+    path.write_bytes(encode_png(rgba, 6, filters=(4, 1, 2, 3), idat_size=1 << 16))
+
+    return str(path)
+
+
+def test_image_palette(image_file):
+    palette = image_palette(image_file, strip_rows=7)
+
+    assert palette == (
+        ColorCount(packed_color(0xc0ffee), 540),
+        ColorCount(packed_color(0x336699), 270),
+        ColorCount(packed_color(0xff0000), 180),
+        ColorCount(packed_color(0x101010), 90),
+    )
+    assert colors_from_image(image_file) == tuple(entry.color for entry in palette)
+
+
+def test_image_palette_size(image_file):
+    palette = image_palette(image_file, 2)
+
+    assert len(palette) == 2
+    assert sum(entry.count for entry in palette) == 1080
+
+
+def test_histogram_bins():
+    strip = np.array([[[0, 0, 0, 255], [7, 7, 7, 255], [8, 0, 0, 255], [255, 255, 255, 0]]],
+                     dtype=np.uint8)
+    histogram = color_histogram([strip], 5)
+
+    assert histogram.counts.sum() == 3
+    assert histogram.counts[0] == 2
+    assert histogram.counts[1 << 10] == 1
+    assert histogram.sums[0].tolist() == [7, 7, 7]
+
+
+def test_median_cut_splits_by_population():
+    rng = np.random.default_rng(3)
+    dark = rng.integers(0, 64, (1000, 3))
+    light = rng.integers(192, 256, (10, 3))
+    pixels = np.vstack([dark, light])
+    strip = np.hstack([pixels, np.full((len(pixels), 1), 255)]).astype(np.uint8)[np.newaxis]
+
+    palette = median_cut(color_histogram([strip]), 8)
+
+    assert len(palette) == 8
+    assert sum(entry.count for entry in palette) == len(pixels)
+    assert [entry.count for entry in palette] == sorted((entry.count for entry in palette),
+                                                        reverse=True)
+    # The light pixels are far from the rest, so they keep a color of their own.
+    assert any(min(entry.color.rgb) > 0.7 for entry in palette)
+
+
+def test_empty_histogram():
+    strip = np.zeros((2, 2, 4), dtype=np.uint8)
+
+    assert median_cut(color_histogram([strip])) == ()
+
+
+@pytest.mark.parametrize("bits", [0, 9])
+def test_bad_bits(bits):
+    with pytest.raises(ValueError):
+        color_histogram([], bits)
+
+
+def test_bad_size():
+    with pytest.raises(ValueError):
+        median_cut(color_histogram([]), 0)
@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+
+from designtools.graphics.extractors import read_png_strips
+from .png_util import encode_png
+
+
+def _write(tmp_path, data, name="image.png"):
+    path = tmp_path / name
+    path.write_bytes(data)
+
+    return str(path)
+
+
+def _decode(path, strip_rows=4):
+    strips = list(read_png_strips(path, strip_rows))
+    assert all(len(strip) <= strip_rows for strip in strips)
+
+    return np.concatenate(strips)
+
+
+@pytest.fixture
+def rgba():
+    return np.random.default_rng(7).integers(0, 256, (23, 17, 4), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("filters", [(0,), (1,), (2,), (3,), (4,), (0, 1, 2, 3, 4), (4, 2, 4, 1)])
+@pytest.mark.parametrize("strip_rows", [1, 5, 256])
+def test_filters(tmp_path, rgba, filters, strip_rows):
+    path = _write(tmp_path, encode_png(rgba, 6, filters=filters))
+
+    assert np.array_equal(_decode(path, strip_rows), rgba)
+
+
+def test_rgb(tmp_path, rgba):
+    path = _write(tmp_path, encode_png(rgba[..., :3], 2))
+    decoded = _decode(path)
+
+    assert np.array_equal(decoded[..., :3], rgba[..., :3])
+    assert np.all(decoded[..., 3] == 0xff)
+
+
+def test_sixteen_bit(tmp_path, rgba):
+    wide = (rgba.astype(np.uint16) << 8) | 0x7f
+    path = _write(tmp_path, encode_png(wide, 6, 16))
+
+    assert np.array_equal(_decode(path), rgba)
+
+
+@pytest.mark.parametrize("bit_depth", [1, 2, 4, 8])
+def test_gray(tmp_path, bit_depth):
+    levels = (1 << bit_depth) - 1
+    gray = np.arange(7 * 13).reshape(7, 13, 1) % (levels + 1)
+    path = _write(tmp_path, encode_png(gray, 0, bit_depth))
+    decoded = _decode(path, 3)
+
+    expected = (gray[..., 0] * 255 // levels).astype(np.uint8)
+    for channel in range(3):
+        assert np.array_equal(decoded[..., channel], expected)
+
+
+@pytest.mark.parametrize("bit_depth", [1, 2, 4, 8])
+def test_palette(tmp_path, bit_depth):
+    entries = 1 << bit_depth
+    colors = np.random.default_rng(1).integers(0, 256, (entries, 3), dtype=np.uint8)
+    indexes = np.arange(9 * 11).reshape(9, 11, 1) % entries
+    path = _write(tmp_path, encode_png(
+        indexes, 3, bit_depth, palette=colors.tobytes(), transparency=b"\x00\x80"
+    ))
+    decoded = _decode(path)
+
+    assert np.array_equal(decoded[..., :3], colors[indexes[..., 0]])
+    alpha = np.full(entries, 0xff)
+    alpha[:2] = [0, 0x80]
+    assert np.array_equal(decoded[..., 3], alpha[indexes[..., 0]])
+
+
+def test_color_key(tmp_path):
+    rgb = np.zeros((2, 2, 3), dtype=np.uint8)
+    rgb[0, 0] = [1, 2, 3]
+    path = _write(tmp_path, encode_png(rgb, 2, transparency=b"\x00\x01\x00\x02\x00\x03"))
+
+    assert _decode(path)[..., 3].tolist() == [[0, 0xff], [0xff, 0xff]]
+
+
+def test_bad_files(tmp_path, rgba):
+    data = encode_png(rgba, 6)
+
+    with pytest.raises(ValueError):
+        list(read_png_strips(_write(tmp_path, b"GIF89a" + data[6:])))
+    with pytest.raises(ValueError):
+        list(read_png_strips(_write(tmp_path, data[:len(data) // 2])))
+
+    corrupt = bytearray(data)
+    corrupt[40] ^= 0xff
+    with pytest.raises(ValueError):
+        list(read_png_strips(_write(tmp_path, bytes(corrupt))))
+
+    with pytest.raises(ValueError):
+        list(read_png_strips(_write(tmp_path, data), 0))
@@ -0,0 +1,16 @@
+import pytest
+
+pytest.importorskip("cairo")
+
+from designtools.graphics.swatches import MIN_SWATCH_SCALE, get_swatch_scales, stop_offsets
+
+
+def test_stop_offsets():
+    assert stop_offsets(4) == [0.25, 0.5, 0.75, 1.0]
+    assert stop_offsets(3, [2, 1, 1]) == [0.5, 0.75, 1.0]
+    assert stop_offsets(2, [0, 0]) == [0.5, 1.0]
+
+
+def test_swatch_scales():
+    assert get_swatch_scales(None, 3) == [1.0, 1.0, 1.0]
+    assert get_swatch_scales([[100, 25], [1]], 3) == [1.0, 0.5, MIN_SWATCH_SCALE]